@@ -38,8 +38,14 @@ import pandas as pd
 import numpy as np
 import os
 import sys
+import shutil
+import io
 import re
+import codecs
+import csv
 import json
+import pickle
+import hashlib
 from datetime import datetime
 from pathlib import Path
 import warnings
@@ -47,6 +53,9 @@ import traceback
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # Import common employee filter module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -65,6 +74,52 @@ except ImportError:
     print("⚠️ Common condition check module not found. Using legacy logic.")
     get_condition_checker = None
 
+# Optional PyArrow CSV parser (설치된 경우에만 사용, 없으면 pandas 기본 C engine)
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+_CSV_ENGINE = 'pyarrow' if _HAS_PYARROW else 'c'
+
+# Optional calamine Excel reader (Rust 기반 streaming parser, pandas 2.2+ 에서 engine='calamine')
+try:
+    import python_calamine  # noqa: F401
+    _HAS_CALAMINE = True
+except ImportError:
+    _HAS_CALAMINE = False
+
+# Optional xlsxwriter (결과 Excel 저장 시 constant_memory streaming writer, 없으면 openpyxl write-only)
+try:
+    import xlsxwriter  # noqa: F401
+    _HAS_XLSXWRITER = True
+except ImportError:
+    _HAS_XLSXWRITER = False
+
+# Optional orjson (메타data/리뷰 JSON 저장 시 Rust 기반 encoder, 없으면 표준 json)
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Optional Modin (멀티코어 pandas API 호환 구현) - 대규모 인원 처리 시 QIP_USE_MODIN=1 로만 활성화
+# module 의 pd 는 항상 pandas (pd.api / pd.errors / EmployeeFilter / thread pool 은 pandas 객체만 받음)
+# → save 단계 AQL groupby 에서만 명시적으로 Modin 변환 후 결과를 즉시 pandas 로 되돌림 (aql_result_counts)
+_MODIN_PD = None
+if os.environ.get('QIP_USE_MODIN') == '1':
+    try:
+        import modin.pandas as _MODIN_PD
+        print("ℹ️ QIP_USE_MODIN=1: AQL 집계에 Modin 사용")
+    except ImportError:
+        print("⚠️ QIP_USE_MODIN=1 이지만 modin 미설치 - pandas 사용")
+
+# Issue #42 디버그 출력 (단계별 컬럼 수, 중복 컬럼 검사) - QIP_DEBUG_42=1 일 때만 출력
+DEBUG_ISSUE_42 = os.environ.get('QIP_DEBUG_42') == '1'
+
+# main() 실행 오류 시 전체 traceback 출력 여부 - 기본 출력, 반복 실행 harness/CI에서는 QIP_TRACEBACK=0 으로 한 줄 요약만
+SHOW_MAIN_TRACEBACK = os.environ.get('QIP_TRACEBACK', '1') != '0'
+
 # Position condition matrix withload
 def load_position_condition_matrix():
     """Load position condition matrix JSON file"""
@@ -114,6 +169,309 @@ def get_position_config_from_matrix(emp_type, position):
     return type_config.get('default', {})
 
 
+@lru_cache(maxsize=256)
+def cached_position_config(emp_type, position):
+    """
+    get_position_config_from_matrix memoized version (hashable str arguments only)
+
+    POSITION_CONDITION_MATRIX is loaded once at import and not modified during a run,
+    so the result for the same (emp_type, position) never changes.
+    Used in per-employee loops where only a handful of distinct positions occur.
+    """
+    return get_position_config_from_matrix(emp_type, position)
+
+
+# Final Incentive Excel 읽기 cache: (절대경로, mtime) → DataFrame
+_FINAL_INCENTIVE_CACHE = {}
+
+def read_final_incentive_excel(file_path):
+    """
+    Final Incentive Excel 파일 읽기 (openpyxl parse 최소화)
+
+    - 같은 실행 중 동일 파일(경로, mtime)은 1회만 parse (early load / save_results 재사용)
+    - pyarrow 설치 시 같은 이름의 .parquet sidecar 저장 → 다음 실행부터 Parquet로 로드
+      (Excel보다 sidecar가 오래된 경우 무시하고 다시 생성)
+    - python-calamine 설치 시 calamine engine 우선 사용, 없으면 openpyxl
+
+    Args:
+        file_path: Final_{month}_{year}_incentive.xlsx 경로
+
+    Returns:
+        DataFrame (호출자가 수정해도 cache에 영향 없도록 복사본 반환)
+    """
+    excel_mtime = os.path.getmtime(file_path)
+    cache_key = (os.path.abspath(file_path), excel_mtime)
+    if cache_key in _FINAL_INCENTIVE_CACHE:
+        return _FINAL_INCENTIVE_CACHE[cache_key].copy()
+
+    df = None
+    parquet_path = os.path.splitext(file_path)[0] + '.parquet'
+    if _HAS_PYARROW and os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= excel_mtime:
+        try:
+            df = pd.read_parquet(parquet_path)
+        except Exception as e:
+            print(f"  ⚠️ Parquet cache 로드 실패, Excel에서 다시 읽음: {e}")
+            df = None
+
+    if df is None:
+        if _HAS_CALAMINE:
+            try:
+                df = pd.read_excel(file_path, engine='calamine')
+            except (ValueError, ImportError):
+                df = None  # pandas < 2.2: calamine engine 미지원 → openpyxl
+        if df is None:
+            # openpyxl reader는 pandas 내부에서 read_only=True로 workbook을 연다
+            df = pd.read_excel(file_path, engine='openpyxl')
+        if _HAS_PYARROW:
+            try:
+                df.to_parquet(parquet_path, index=False)
+            except Exception as e:
+                print(f"  ⚠️ Parquet cache 저장 실패 (Excel 결과는 정상 사용): {e}")
+
+    _FINAL_INCENTIVE_CACHE[cache_key] = df
+    return df.copy()
+
+
+def write_excel_fast(df, file_path):
+    """
+    결과 DataFrame을 스타일 없이 xlsx로 저장 (데이터 산출물 전용)
+
+    - xlsxwriter 설치 시: constant_memory 모드 ExcelWriter (행 단위 flush)
+    - 없으면: openpyxl write-only workbook에 행 단위 append
+      (df.to_excel 기본 경로의 Cell 객체/스타일 생성 비용 없음)
+    """
+    if _HAS_XLSXWRITER:
+        with pd.ExcelWriter(file_path, engine='xlsxwriter',
+                            engine_kwargs={'options': {'constant_memory': True}}) as writer:
+            df.to_excel(writer, index=False)
+        return
+
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Sheet1')
+    ws.append([str(col) for col in df.columns])
+    # NaN/NaT/pd.NA → 빈 셀 (to_excel과 동일)
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        ws.append(row)
+    wb.save(file_path)
+
+
+def read_json_file(file_path):
+    """
+    JSON 파일 읽기 (config 파일 등)
+
+    - bytes로 한 번에 읽은 뒤 orjson 설치 시 orjson.loads (str decode 단계 없음)
+    - orjson이 거부하는 입력 (UTF-8 BOM, NaN 등)이나 미설치 시 표준 json.loads
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def write_json_file(data, file_path):
+    """
+    JSON 파일 저장 (indent=2, UTF-8 그대로)
+
+    - orjson 설치 시: bytes로 직접 기록 (numpy scalar 변환 불필요, NaN은 null)
+    - 없거나 orjson이 직렬화 못 하는 타입이면: json.dumps(ensure_ascii=False, indent=2)
+    - 두 경우 모두 메모리에서 전체 payload를 만든 뒤 한 번의 write로 기록
+      (json.dump는 작은 조각 단위로 여러 번 write 호출)
+    """
+    payload = None
+    if _HAS_ORJSON:
+        try:
+            payload = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            payload = None
+    if payload is None:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    with open(file_path, 'wb') as f:
+        f.write(payload)
+
+
+def write_result_csv(df, file_path):
+    """
+    결과 DataFrame을 utf-8-sig CSV로 저장
+
+    - 이 CSV는 다른 스크립트(대시보드, 검증 스크립트 등)가 읽는 기준 파일이므로
+      항상 df.to_csv로 기록한다.
+    - pyarrow.csv.write_csv는 float의 '.0'을 생략하고 bool을 true/false로 쓰는 등
+      출력이 달라지므로 사용하지 않음 (빠른 저장은 Parquet 사본이 담당)
+    """
+    df.to_csv(file_path, index=False, encoding='utf-8-sig')
+
+
+def write_parquet_fast(df, file_path) -> bool:
+    """
+    결과 DataFrame의 Parquet 사본 저장 (machine-readable 산출물, zstd 압축)
+
+    - pyarrow 설치 시에만 기록 (C++ writer, 컬럼 단위 인코딩)
+    - 변환 실패(혼합 타입 object 컬럼 등)는 경고만 - CSV/Excel 결과는 그대로 사용
+    - 임시 파일에 쓴 뒤 os.replace로 교체 (읽는 쪽이 반쯤 쓰인 파일을 보지 않도록)
+    """
+    if not _HAS_PYARROW:
+        return False
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_path, index=False, compression='zstd')
+        os.replace(tmp_path, file_path)
+        return True
+    except Exception as e:
+        print(f"  ⚠️ Parquet 사본 저장 실패 (CSV/Excel 결과는 정상 저장): {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+
+def _count_aql_results(aql_df):
+    """employee × RESULT 검사 횟수 (PASS / FAIL / total 열) - pandas / Modin 공통"""
+    counts = (
+        aql_df.groupby(['EMPLOYEE NO', 'RESULT']).size()
+        .unstack(fill_value=0)
+        .reindex(columns=['PASS', 'FAIL'], fill_value=0)
+    )
+    counts['total'] = aql_df.groupby('EMPLOYEE NO').size()
+    return counts
+
+
+def aql_result_counts(aql_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    AQL history employee별 PASS / FAIL / total 집계 (항상 pandas DataFrame 반환)
+
+    - QIP_USE_MODIN=1 + modin 설치 시: groupby 를 Modin 에서 실행 후 결과만 pandas 로 변환
+    - 그 외 또는 Modin 실패 시: pandas groupby
+    """
+    if _MODIN_PD is not None:
+        try:
+            return _count_aql_results(_MODIN_PD.DataFrame(aql_df))._to_pandas()
+        except Exception as e:
+            print(f"  ⚠️ Modin AQL 집계 실패 → pandas 사용: {e}")
+    return _count_aql_results(aql_df)
+
+def frame_digest(df) -> Optional[str]:
+    """
+    결과 DataFrame 내용 digest (열 이름 + dtype + 행 값 hash) - 계산 불가 시 None
+
+    같은 결과를 다시 저장할 때 기존 CSV/Excel 재작성을 생략하는 데 사용
+    (hash 불가 object 값 등은 None → 항상 저장)
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    except Exception:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode('utf-8'))
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+def fast_copy_file(src, dst, allow_link=False):
+    """
+    파일 복사 (shutil.copy2 대체, 메타데이터 포함)
+
+    - allow_link=True 이고 같은 파일시스템이면: 하드링크 (데이터 복사 없음, 백업용)
+    - os.copy_file_range 지원 시: 커널 내 복사 (CoW 파일시스템은 reflink)
+    - 그 외: shutil.copy2
+    복사본은 임시 파일에 쓴 뒤 os.replace로 교체 - 기존 dst가 하드링크 백업과
+    inode를 공유해도 백업 내용이 덮어써지지 않는다.
+    """
+    if allow_link:
+        try:
+            if os.path.lexists(dst):
+                os.remove(dst)
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+
+    tmp_path = f"{dst}.tmp"
+    try:
+        copied = False
+        if hasattr(os, 'copy_file_range'):
+            try:
+                with open(src, 'rb') as fsrc, open(tmp_path, 'wb') as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if sent == 0:
+                            break
+                        remaining -= sent
+                copied = remaining == 0
+            except OSError:
+                copied = False
+        if copied:
+            shutil.copystat(src, tmp_path)
+        else:
+            shutil.copy2(src, tmp_path)
+        os.replace(tmp_path, dst)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def map_previous_incentive(employee_nos: pd.Series, prev_df: pd.DataFrame, incentive_col: str) -> pd.Series:
+    """Employee No별 previous month 인센티브 조회 (없으면 0)
+
+    set_index().to_dict() 후 Series.map(dict) 하면 매 호출마다 dict → Series 재구성이 일어난다.
+    Employee No index Series에 reindex 1회 (해시 조인)로 대체. 중복 Employee No는
+    dict 변환과 동일하게 마지막 행 기준.
+    """
+    lookup = prev_df.drop_duplicates('Employee No', keep='last').set_index('Employee No')[incentive_col]
+    return pd.Series(lookup.reindex(employee_nos).to_numpy(), index=employee_nos.index).fillna(0)
+
+
+# condition 평가 결과 code (int8) - cond_* 컬럼은 이 순서의 category로 저장
+CONDITION_RESULT_DTYPE = pd.CategoricalDtype(['PASS', 'FAIL', 'NOT_APPLICABLE'])
+_COND_PASS, _COND_FAIL, _COND_NOT_APPLICABLE = 0, 1, 2
+
+def _condition_result_codes(pass_mask, applicable_mask, not_applicable_mask=None) -> np.ndarray:
+    """
+    condition 평가 kernel: 행별 결과를 int8 code로 반환 (문자열 배열 생성 없음)
+
+    Args:
+        pass_mask: 기준 충족 여부 (bool 배열)
+        applicable_mask: position별 condition 적용 여부 (bool 배열)
+        not_applicable_mask: 데이터 상 평가 불가 행 (예: 근무해야 할 날 0일)
+
+    Returns:
+        int8 배열 (0=PASS, 1=FAIL, 2=NOT_APPLICABLE) - CONDITION_RESULT_DTYPE code
+    """
+    codes = np.where(pass_mask, _COND_PASS, _COND_FAIL).astype(np.int8)
+    if not_applicable_mask is not None:
+        codes[np.asarray(not_applicable_mask, dtype=bool)] = _COND_NOT_APPLICABLE
+    codes[~np.asarray(applicable_mask, dtype=bool)] = _COND_NOT_APPLICABLE
+    return codes
+
+
+def _attendance_flag_matrix(absence_rate, unapproved_absences, actual_days,
+                            attendance_threshold, unapproved_threshold, minimum_days) -> np.ndarray:
+    """
+    metadata attendance condition kernel: (N, 4) bool 행렬을 한 번에 계산
+
+    열 순서: 0=출근율, 1=무단결근, 2=근무일 > 0, 3=최소 근무일
+    NaN 처리 (기존 metadata 규칙): 결근율/무단결근 NaN → passed, 근무일 NaN → not passed
+    """
+    absence_rate = np.asarray(absence_rate, dtype=float)
+    unapproved_absences = np.asarray(unapproved_absences, dtype=float)
+    actual_days = np.asarray(actual_days, dtype=float)
+
+    flags = np.empty((absence_rate.size, 4), dtype=bool)
+    with np.errstate(invalid='ignore'):
+        flags[:, 0] = np.isnan(absence_rate) | (absence_rate <= (100 - attendance_threshold))
+        flags[:, 1] = np.isnan(unapproved_absences) | (unapproved_absences <= unapproved_threshold)
+        flags[:, 2] = actual_days > 0
+        flags[:, 3] = actual_days >= minimum_days
+    return flags
+
 class Month(Enum):
     """Month enumeration"""
     JANUARY = (1, "january", "jan", "1월")
@@ -134,25 +492,66 @@ class Month(Enum):
         self.full_name = full_name
         self.short_name = short_name
         self.korean_name = korean_name
+        # get_month_str('capital') 용 - 호출마다 capitalize() 하지 않도록 생성 시 1회 계산
+        self.capital_name = full_name.capitalize()
     
     @classmethod
     def from_number(cls, number: int):
         """Return Month object from month number"""
-        for month in cls:
-            if month.number == number:
-                return month
+        # _MONTHS_BY_NUM tuple index (O(1)) - enum 순회 대신
+        try:
+            if 1 <= number <= 12 and number == int(number):
+                return _MONTHS_BY_NUM[int(number) - 1]
+        except (TypeError, ValueError):
+            pass
         raise ValueError(f"Invalid month number: {number}")
     
     @classmethod
     def from_name(cls, name: str):
         """Return Month object from month name"""
         name_lower = name.lower()
-        for month in cls:
-            if name_lower in [month.full_name, month.short_name] or name == month.korean_name:
-                return month
+        # 이름 → Month dict 조회 (enum 순회 + 매 비교마다 list 생성 대신)
+        month = _MONTHS_BY_NAME.get(name_lower) or _MONTHS_BY_KOREAN_NAME.get(name)
+        if month is not None:
+            return month
         raise ValueError(f"Invalid month name: {name}")
 
 
+# month number(1-12) → Month (index = number - 1)
+_MONTHS_BY_NUM = tuple(Month)
+# full/short name(소문자) → Month, korean name → Month (enum 순서상 먼저 나온 month 우선)
+_MONTHS_BY_NAME = {}
+for _month in Month:
+    _MONTHS_BY_NAME.setdefault(_month.full_name, _month)
+    _MONTHS_BY_NAME.setdefault(_month.short_name, _month)
+_MONTHS_BY_KOREAN_NAME = {}
+for _month in Month:
+    _MONTHS_BY_KOREAN_NAME.setdefault(_month.korean_name, _month)
+
+# month 순서 / 인덱스 / 한글 이름 (next month 파일 준비용, 모듈 로드 시 1회 구성)
+MONTH_ORDER = [month.full_name for month in Month]
+MONTH_INDEX = {name: i for i, name in enumerate(MONTH_ORDER)}
+MONTH_KOREAN = {month.full_name: month.korean_name for month in Month}
+
+# TYPE-1 표준 progression table 기본값 (연속 개월 → VND, 15개월 cap)
+# index = 개월 수 인 lookup array → 다수 직원 vectorized 조회 / 역산에 사용
+_PROGRESSION_AMOUNTS = np.array([0, 150000, 250000, 300000, 350000, 400000, 450000, 500000,
+                                 650000, 750000, 850000, 950000, 1000000, 1000000, 1000000, 1000000],
+                                dtype=np.int64)
+_DEFAULT_PROGRESSION_TABLE = {months: int(amount) for months, amount in enumerate(_PROGRESSION_AMOUNTS)}
+# 금액 → 개월 수 (같은 금액이면 가장 작은 개월 수, 0개월 제외)
+_PROGRESSION_MONTHS_BY_AMOUNT = {}
+for _months, _amount in enumerate(_PROGRESSION_AMOUNTS[1:].tolist(), start=1):
+    _PROGRESSION_MONTHS_BY_AMOUNT.setdefault(_amount, _months)
+
+# AQL Inspector Part 3 (HWK 클레임 방지) - 4개월부터 지급
+_AQL_PART3_AMOUNTS = np.array([0, 0, 0, 0, 300000, 300000, 300000, 500000, 500000, 500000,
+                               700000, 700000, 700000, 900000, 900000, 900000], dtype=np.int64)
+_AQL_PART3_TABLE = {months: int(amount) for months, amount in enumerate(_AQL_PART3_AMOUNTS)}
+# Part 1 + Part 3 합계 (1~15개월) - 3-Part 합계 역산용
+_AQL_EXPECTED_BASE = _PROGRESSION_AMOUNTS[1:] + _AQL_PART3_AMOUNTS[1:]
+
+
 @dataclass
 class MonthConfig:
     """Monthly configuration data class"""
@@ -173,7 +572,7 @@ class MonthConfig:
         elif format_type == "korean":
             return self.month.korean_name
         elif format_type == "capital":
-            return self.month.full_name.capitalize()
+            return self.month.capital_name
         return str(self.month.number)
     
     def get_file_path(self, file_type: str) -> str:
@@ -247,8 +646,8 @@ class ConfigManager:
                 print("⚠️ Attendance file not found.")
                 return None
         
-        # attendance 파일에서 yearmonth detection
-        year, month = detect_month_from_attendance(attendance_file)
+        # attendance 파일에서 yearmonth detection + 근무 days 수 calculation (파일 1회 읽기)
+        year, month, working_days = analyze_attendance(attendance_file)
         
         if not year or not month:
             print("⚠️ Attendance filecannot detect year/month from.")
@@ -256,8 +655,6 @@ class ConfigManager:
         
         month_obj = Month.from_number(month)
         
-        # 근무 days 수 calculation
-        working_days = calculate_working_days_from_attendance(attendance_file, year, month)
         if not working_days:
             print("❌ Error: attendance 파일에서 cannot calculate working days from.")
             print("   attendance CSV fileplease check if exists and has correct format.")
@@ -373,8 +770,22 @@ class ConfigManager:
         if filepath is None:
             filepath = f"config_{config.month.full_name}_{config.year}.json"
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(config.to_dict(), f, indent=2, ensure_ascii=False)
+        payload = json.dumps(config.to_dict(), indent=2, ensure_ascii=False).encode('utf-8')
+
+        # 기존 파일과 내용이 같으면 다시 쓰지 않음 (mtime 유지 → 입력 cache 등 mtime 기반 비교가 계속 hit)
+        try:
+            with open(filepath, 'rb') as f:
+                if f.read() == payload:
+                    print(f"✅ configuration 변경 없음 (저장 생략): {filepath}")
+                    return
+        except OSError:
+            pass
+
+        # 임시 파일에 쓴 뒤 교체 (쓰는 도중 중단되어도 기존 configuration 보존)
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
         print(f"✅ configuration 저장 완료: {filepath}")
     
     @staticmethod
@@ -503,12 +914,7 @@ class DataProcessor:
             if not os.path.exists(config_path):
                 print(f"⚠️ Warning: {config_path} not found. Using default progression table.")
                 # 기본값 (하드코딩 fallback)
-                return {
-                    0: 0, 1: 150000, 2: 250000, 3: 300000, 4: 350000,
-                    5: 400000, 6: 450000, 7: 500000, 8: 650000, 9: 750000,
-                    10: 850000, 11: 950000, 12: 1000000, 13: 1000000,
-                    14: 1000000, 15: 1000000
-                }
+                return dict(_DEFAULT_PROGRESSION_TABLE)
 
             with open(config_path, 'r', encoding='utf-8') as f:
                 config_data = json.load(f)
@@ -524,12 +930,7 @@ class DataProcessor:
         except Exception as e:
             print(f"⚠️ Error loading progression_table: {e}")
             print("Using default progression table.")
-            return {
-                0: 0, 1: 150000, 2: 250000, 3: 300000, 4: 350000,
-                5: 400000, 6: 450000, 7: 500000, 8: 650000, 9: 750000,
-                10: 850000, 11: 950000, 12: 1000000, 13: 1000000,
-                14: 1000000, 15: 1000000
-            }
+            return dict(_DEFAULT_PROGRESSION_TABLE)
 
     def _reverse_calculate_months_from_incentive(self, incentive_amount: float) -> int:
         """
@@ -1077,7 +1478,21 @@ class DataProcessor:
         return result_df
     
     
-    def calculate_continuous_months_from_history(self, emp_id: str, month_data: pd.DataFrame = None) -> int:
+    def build_padded_id_positions(self, month_data: pd.DataFrame) -> Dict[str, int]:
+        """9자리 패딩 Employee No → 첫 행 위치 dict
+
+        직원 loop 시작 전에 한 번 만들어 calculate_continuous_months_from_history(id_positions=...)
+        로 넘긴다 (직원마다 전체 'Employee No' 컬럼을 astype(str).str.zfill(9) 하지 않도록).
+        loop 도중 month_data 행이 추가/삭제되거나 'Employee No'가 바뀌면 다시 만들어야 한다.
+        """
+        positions = {}
+        for pos, value in enumerate(month_data['Employee No'].astype(str).str.zfill(9).tolist()):
+            if isinstance(value, str):
+                positions.setdefault(value, pos)
+        return positions
+
+    def calculate_continuous_months_from_history(self, emp_id: str, month_data: pd.DataFrame = None,
+                                                 id_positions: Optional[Dict[str, int]] = None) -> int:
         """
         연속 인센티브 수령 개월 수 계산 - Final Incentive 파일 기반 (Issue #47)
 
@@ -1090,6 +1505,8 @@ class DataProcessor:
         Args:
             emp_id: 직원 ID
             month_data: 현재 달 데이터 (Previous_Incentive 컬럼 포함)
+            id_positions: month_data 기준 build_padded_id_positions 결과
+                          (없으면 이번 호출에서 만듦 - loop 에서는 미리 만들어 넘길 것)
 
         Returns:
             int: 다음 달 연속 개월 수 (1-15)
@@ -1108,10 +1525,12 @@ class DataProcessor:
         # ============================================
         if month_data is not None:
             # 직원 찾기
-            emp_rows = month_data[month_data['Employee No'].astype(str).str.zfill(9) == emp_id_padded]
+            if id_positions is None:
+                id_positions = self.build_padded_id_positions(month_data)
+            emp_pos = id_positions.get(emp_id_padded)
 
-            if not emp_rows.empty:
-                emp_row = emp_rows.iloc[0]
+            if emp_pos is not None:
+                emp_row = month_data.iloc[emp_pos]
 
                 # Previous_Incentive 컬럼 확인 (Final Incentive 파일에서 로드된 값)
                 prev_incentive = 0
@@ -1218,7 +1637,7 @@ class DataProcessor:
             try:
                 print(f"📂 [Priority 1] Final Incentive 파일 로드 (Single Source of Truth)")
                 print(f"   → {final_incentive_path}")
-                prev_df = pd.read_excel(final_incentive_path)
+                prev_df = read_final_incentive_excel(final_incentive_path)
 
                 # Employee No 표준화
                 if 'Employee No' in prev_df.columns:
@@ -1328,7 +1747,7 @@ class DataProcessor:
                 print(f"  ✅ Final Incentive file found (Single Source of Truth):")
                 print(f"     {final_incentive_path}")
 
-                final_incentive_data = pd.read_excel(final_incentive_path)
+                final_incentive_data = read_final_incentive_excel(final_incentive_path)
 
                 # Employee No 변환
                 final_incentive_data['Employee No'] = pd.to_numeric(final_incentive_data['Employee No'], errors='coerce')
@@ -1348,8 +1767,7 @@ class DataProcessor:
                         break
 
                 if prev_incentive_col:
-                    prev_incentive_map = final_incentive_data.set_index('Employee No')[prev_incentive_col].to_dict()
-                    month_data['Previous_Incentive'] = month_data['Employee No'].map(prev_incentive_map).fillna(0)
+                    month_data['Previous_Incentive'] = map_previous_incentive(month_data['Employee No'], final_incentive_data, prev_incentive_col)
 
                     # 검증
                     mapped_count = (month_data['Previous_Incentive'] > 0).sum()
@@ -1395,8 +1813,7 @@ class DataProcessor:
                         break
 
                 if prev_incentive_col:
-                    prev_incentive_map = prev_incentive_data.set_index('Employee No')[prev_incentive_col].to_dict()
-                    month_data['Previous_Incentive'] = month_data['Employee No'].map(prev_incentive_map).fillna(0)
+                    month_data['Previous_Incentive'] = map_previous_incentive(month_data['Employee No'], prev_incentive_data, prev_incentive_col)
 
                     mapped_count = (month_data['Previous_Incentive'] > 0).sum()
                     total_amount = month_data['Previous_Incentive'].sum()
@@ -1672,39 +2089,17 @@ class DataProcessor:
         if position_category == 'AQL_INSPECTOR':
             return self._reverse_calculate_aql_months(incentive_int)
 
-        # 표준 TYPE-1 progression table
-        # progression_table: {1: 150000, 2: 250000, ..., 12: 1000000, ...}
-        progression_table = {
-            1: 150000,
-            2: 250000,
-            3: 300000,
-            4: 350000,
-            5: 400000,
-            6: 450000,
-            7: 500000,
-            8: 650000,
-            9: 750000,
-            10: 850000,
-            11: 950000,
-            12: 1000000,
-            13: 1000000,
-            14: 1000000,
-            15: 1000000
-        }
-
+        # 표준 TYPE-1 progression table (_PROGRESSION_AMOUNTS, 1~15개월)
         # 정확히 일치하는 금액 찾기
-        for months, amount in progression_table.items():
-            if incentive_int == amount:
-                return months
+        exact_months = _PROGRESSION_MONTHS_BY_AMOUNT.get(incentive_int)
+        if exact_months is not None:
+            return exact_months
 
-        # 가장 가까운 값 찾기 (tolerance 허용)
-        closest_months = 1
-        min_diff = float('inf')
-        for months, amount in progression_table.items():
-            diff = abs(incentive_int - amount)
-            if diff < min_diff:
-                min_diff = diff
-                closest_months = months
+        # 가장 가까운 값 찾기 (tolerance 허용) - argmin 은 동률 시 작은 개월 수 (기존 loop 와 동일)
+        diffs = np.abs(_PROGRESSION_AMOUNTS[1:] - incentive_int)
+        closest_idx = int(np.argmin(diffs))
+        closest_months = closest_idx + 1
+        min_diff = int(diffs[closest_idx])
 
         # 오차 범위 내 (10% 이내)면 해당 개월 수 반환
         if min_diff <= incentive_int * 0.1:
@@ -1737,30 +2132,11 @@ class DataProcessor:
         if base_amount < 0:
             base_amount = total_incentive  # CFA 없이 계산
 
-        # Part 3 (HWK) 테이블
-        hwk_table = {
-            4: 300000, 5: 300000, 6: 300000,
-            7: 500000, 8: 500000, 9: 500000,
-            10: 700000, 11: 700000, 12: 700000,
-            13: 900000, 14: 900000, 15: 900000
-        }
-
-        # Part 1 테이블
-        part1_table = {
-            1: 150000, 2: 250000, 3: 300000, 4: 350000, 5: 400000,
-            6: 450000, 7: 500000, 8: 650000, 9: 750000, 10: 850000,
-            11: 950000, 12: 1000000, 13: 1000000, 14: 1000000, 15: 1000000
-        }
-
         # 가능한 조합 찾기 (작은 개월부터 - 더 정확한 매칭)
-        for months in range(1, 16):
-            part1 = part1_table.get(months, 0)
-            part3 = hwk_table.get(months, 0) if months >= 4 else 0
-            expected_base = part1 + part3
-
-            # 오차 범위 내 일치 (5%)
-            if expected_base > 0 and abs(base_amount - expected_base) <= expected_base * 0.05:
-                return months
+        # _AQL_EXPECTED_BASE[i] = Part 1 + Part 3 ((i+1)개월), 오차 범위 내 일치 (5%)
+        within = np.abs(base_amount - _AQL_EXPECTED_BASE) <= _AQL_EXPECTED_BASE * 0.05
+        if within.any():
+            return int(np.argmax(within)) + 1
 
         # 기본값: 1개월 (유효한 인센티브가 있으면 최소 1개월)
         return 1
@@ -1815,28 +2191,9 @@ class DataProcessor:
         Returns:
             dict: 인센티브 계산 결과
         """
-        progression_table = {
-            0: 0,
-            1: 150000,
-            2: 250000,
-            3: 300000,
-            4: 350000,
-            5: 400000,
-            6: 450000,
-            7: 500000,
-            8: 650000,
-            9: 750000,
-            10: 850000,
-            11: 950000,
-            12: 1000000,
-            13: 1000000,
-            14: 1000000,
-            15: 1000000
-        }
-
         # 최대 15개월로 제한
         months = min(continuous_months, 15)
-        incentive = progression_table.get(months, 0)
+        incentive = _DEFAULT_PROGRESSION_TABLE.get(months, 0)
 
         return {
             'incentive_amount': incentive,
@@ -1863,33 +2220,17 @@ class DataProcessor:
         Returns:
             dict: 3-Part 계산 결과
         """
-        # Part 1 테이블
-        part1_table = {
-            1: 150000, 2: 250000, 3: 300000, 4: 350000, 5: 400000,
-            6: 450000, 7: 500000, 8: 650000, 9: 750000, 10: 850000,
-            11: 950000, 12: 1000000, 13: 1000000, 14: 1000000, 15: 1000000
-        }
-
-        # Part 3 (HWK) 테이블 - 4개월부터 시작
-        part3_table = {
-            1: 0, 2: 0, 3: 0,
-            4: 300000, 5: 300000, 6: 300000,
-            7: 500000, 8: 500000, 9: 500000,
-            10: 700000, 11: 700000, 12: 700000,
-            13: 900000, 14: 900000, 15: 900000
-        }
-
         months = min(continuous_months, 15)
 
-        # Part 1: AQL 평가
-        part1 = part1_table.get(months, 0)
+        # Part 1: AQL 평가 (표준 progression table)
+        part1 = _DEFAULT_PROGRESSION_TABLE.get(months, 0)
 
         # Part 2: CFA 자격증 확인
         cfa_certified = self._check_cfa_certification(emp_id)
         part2 = 700000 if cfa_certified else 0
 
-        # Part 3: HWK 클레임 방지
-        part3 = part3_table.get(months, 0)
+        # Part 3: HWK 클레임 방지 (4개월부터)
+        part3 = _AQL_PART3_TABLE.get(months, 0)
 
         # 총 인센티브
         total = part1 + part2 + part3
@@ -1992,6 +2333,14 @@ class DataProcessor:
         # [Issue #51] 부하직원 기반 계산 직급 skip 추적
         skipped_positions = {}
 
+        # 계산 결과는 컬럼별 list 에 모아 loop 후 1회 대입
+        # (직원마다 .loc 3회 대입하면 대입마다 pandas indexing / block 갱신 비용 발생)
+        # loop 내 조건 / 연속 개월 계산은 cond_* / Previous_Incentive 만 읽으므로 대입 지연과 무관
+        result_indices = []
+        result_incentives = []
+        result_months = []
+        result_categories = []
+
         # 각 TYPE-1 직원 처리
         for idx in type1_indices:
             row = month_data.loc[idx]
@@ -2024,10 +2373,11 @@ class DataProcessor:
 
             incentive_amount = incentive_result['incentive_amount']
 
-            # DataFrame 업데이트
-            month_data.loc[idx, incentive_col] = incentive_amount
-            month_data.loc[idx, 'Continuous_Months'] = continuous_months
-            month_data.loc[idx, 'Position_Category'] = position_category
+            # DataFrame 업데이트 (loop 후 일괄 대입)
+            result_indices.append(idx)
+            result_incentives.append(incentive_amount)
+            result_months.append(continuous_months)
+            result_categories.append(position_category)
 
             # 통계 업데이트
             category_stats[position_category]['count'] += 1
@@ -2047,6 +2397,15 @@ class DataProcessor:
                     'details': incentive_result['details']
                 })
 
+        if result_indices:
+            for col, values in ((incentive_col, result_incentives),
+                                ('Continuous_Months', result_months),
+                                ('Position_Category', result_categories)):
+                if col not in month_data.columns:
+                    # 새 컬럼은 첫 값 scalar 대입으로 생성 (행 단위 대입과 같은 dtype / 나머지 행 NaN)
+                    month_data.loc[result_indices[0], col] = values[0]
+                month_data.loc[result_indices, col] = values
+
         # 결과 출력
         print("\n  📈 카테고리별 결과:")
         print("  " + "-" * 60)
@@ -2607,6 +2966,14 @@ class CompleteQIPCalculator:
         # data saved
         self.raw_data = data
 
+        # 백그라운드 파일 I/O (next month 파일 복사 등) - wait_for_background_io()에서 완료 확인
+        self._io_pool = None
+        self._io_futures = []
+
+        # 결과 파일 출력 폴더 (폴더 생성은 _ensure_output_dir()에서 1회만)
+        self.output_dir = "output_files"
+        self._output_dir_ready = False
+
         # preparation 작업
         self.prepare_integrated_data()
 
@@ -2638,6 +3005,31 @@ class CompleteQIPCalculator:
             # 2026년 이후: 2개월 이상 연속 실패 제외 (startswith YES)
             return value.startswith('YES')
 
+    def _consecutive_failure_mask(self, continuous_fail_values, year: int = None) -> np.ndarray:
+        """
+        [Issue #50] _is_consecutive_failure_for_year 의 컬럼 단위(vectorized) 버전
+
+        Args:
+            continuous_fail_values: Continuous_FAIL 값 Series/배열
+            year: 판정 기준 연도 (None이면 config.year 사용)
+
+        Returns:
+            행별 bool 배열 (True = 연속 실패로 인센티브 제외)
+        """
+        if year is None:
+            year = self.config.year
+
+        # 문자열 변환 및 안전 처리 (NaN → 'NO' : 스칼라 버전의 'NAN'과 동일하게 False)
+        values = pd.Series(continuous_fail_values, dtype=object).fillna('NO').astype(str).str.strip().str.upper()
+
+        if year <= 2025:
+            # 2025년까지: 3개월 연속 실패만 제외 (YES_3MONTHS)
+            mask = values == 'YES_3MONTHS'
+        else:
+            # 2026년 이후: 2개월 이상 연속 실패 제외 (startswith YES)
+            mask = values.str.startswith('YES')
+        return mask.to_numpy(dtype=bool)
+
     def load_july_incentive_data(self):
         """July incentive data withload (August calculation 시 특별 processing)"""
         # August calculation 시toonly 실행
@@ -2742,7 +3134,8 @@ class CompleteQIPCalculator:
     
     def _merge_all_conditions(self):
         """모든 condition data 병합"""
-        print(f"📊 [DEBUG Issue #42] Starting _merge_all_conditions: {len(self.month_data.columns)} columns")
+        if DEBUG_ISSUE_42:
+            print(f"📊 [DEBUG Issue #42] Starting _merge_all_conditions: {len(self.month_data.columns)} columns")
 
         # attendance data 병합
         attendance_key = f"{self.config.month.full_name}_attendance"
@@ -2781,14 +3174,16 @@ class CompleteQIPCalculator:
                             # att_conditions.loc[att_idx[0], 'attendancy condition 1 - acctual working days is zero'] = 'yes'
                             att_conditions.loc[att_idx[0], '결근율_Absence_Rate_Percent'] = 100.0
                 
-                print(f"📊 [DEBUG Issue #42] Before attendance merge: month_data={len(self.month_data.columns)} cols, att_conditions={len(att_conditions.columns)} cols")
+                if DEBUG_ISSUE_42:
+                    print(f"📊 [DEBUG Issue #42] Before attendance merge: month_data={len(self.month_data.columns)} cols, att_conditions={len(att_conditions.columns)} cols")
                 self.month_data = pd.merge(
                     self.month_data,
                     att_conditions,
                     on='Employee No',
                     how='left'
                 )
-                print(f"📊 [DEBUG Issue #42] After attendance merge: {len(self.month_data.columns)} columns")
+                if DEBUG_ISSUE_42:
+                    print(f"📊 [DEBUG Issue #42] After attendance merge: {len(self.month_data.columns)} columns")
 
                 # 병합 후 퇴사자 absence rate 재calculation
                 self._recalculate_absence_rate_for_resigned()
@@ -2800,14 +3195,16 @@ class CompleteQIPCalculator:
                 self.raw_data[prs_key]
             )
             if not prs_conditions.empty:
-                print(f"📊 [DEBUG Issue #42] Before 5PRS merge: month_data={len(self.month_data.columns)} cols, prs_conditions={len(prs_conditions.columns)} cols")
+                if DEBUG_ISSUE_42:
+                    print(f"📊 [DEBUG Issue #42] Before 5PRS merge: month_data={len(self.month_data.columns)} cols, prs_conditions={len(prs_conditions.columns)} cols")
                 self.month_data = pd.merge(
                     self.month_data,
                     prs_conditions,
                     on='Employee No',
                     how='left'
                 )
-                print(f"📊 [DEBUG Issue #42] After 5PRS merge: {len(self.month_data.columns)} columns")
+                if DEBUG_ISSUE_42:
+                    print(f"📊 [DEBUG Issue #42] After 5PRS merge: {len(self.month_data.columns)} columns")
         
         # AQL data 병합
         aql_key = f"{self.config.month.full_name}_aql"
@@ -2917,14 +3314,16 @@ class CompleteQIPCalculator:
                 print(f"  → month_data 샘플: {month_sample}")
                 print(f"  → aql_conditions 샘플: {aql_sample}")
 
-                print(f"📊 [DEBUG Issue #42] Before AQL merge: month_data={len(self.month_data.columns)} cols, aql_conditions={len(aql_conditions.columns)} cols")
+                if DEBUG_ISSUE_42:
+                    print(f"📊 [DEBUG Issue #42] Before AQL merge: month_data={len(self.month_data.columns)} cols, aql_conditions={len(aql_conditions.columns)} cols")
                 self.month_data = pd.merge(
                     self.month_data,
                     aql_conditions,
                     on='Employee No',
                     how='left'
                 )
-                print(f"📊 [DEBUG Issue #42] After AQL merge: {len(self.month_data.columns)} columns")
+                if DEBUG_ISSUE_42:
+                    print(f"📊 [DEBUG Issue #42] After AQL merge: {len(self.month_data.columns)} columns")
 
                 # 병합 후 AQL failure cases수 checking
                 if aql_col in self.month_data.columns:
@@ -2955,7 +3354,22 @@ class CompleteQIPCalculator:
         # AQL Area Reject Rate calculation 및 추
         self._add_area_reject_rates()
 
-        print(f"📊 [DEBUG Issue #42] End of _merge_all_conditions: {len(self.month_data.columns)} columns")
+        if DEBUG_ISSUE_42:
+            print(f"📊 [DEBUG Issue #42] End of _merge_all_conditions: {len(self.month_data.columns)} columns")
+
+    @staticmethod
+    def _clean_str_col(values: pd.Series) -> pd.Series:
+        """문자열 컬럼 정리: str 변환 + strip, '', 'nan', 'NaN', 'None' → ''
+
+        값 종류가 적은 컬럼(BUILDING 등)이므로 고유 값만 정리한 뒤 code로 펼친다.
+        ('N/A'는 값으로 유지 - 기존 BUILDING 처리와 동일)
+        """
+        codes, uniques = pd.factorize(values)
+        text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+        text = text.mask(text.isna() | text.isin(['', 'nan', 'NaN', 'None']), '')
+        # code -1 (NaN/None) → 마지막 '' 항목
+        lookup = np.append(text.to_numpy(dtype=object), '')
+        return pd.Series(lookup[codes], index=values.index, dtype=object)
 
     def _process_building_consolidation(self):
         """Issue #46: BUILDING 정보 통합 및 불일치 감지 (2026-01-12)
@@ -2984,51 +3398,36 @@ class CompleteQIPCalculator:
         }
         mismatch_list = []  # 불일치 목록
 
-        # 최종 BUILDING 칼럼 생성 (basic_manpower 우선)
-        if has_basic_building:
-            # basic_manpower BUILDING을 기본으로 사용
-            self.month_data['BUILDING_FINAL'] = self.month_data['BUILDING'].fillna('')
-        else:
-            self.month_data['BUILDING_FINAL'] = ''
-
-        for idx, row in self.month_data.iterrows():
-            emp_no = row['Employee No']
-            emp_name = row.get('Full Name', 'Unknown')
-
-            basic_bldg = str(row.get('BUILDING', '')).strip() if has_basic_building else ''
-            aql_bldg = str(row.get('AQL_BUILDING', '')).strip() if has_aql_building else ''
-
-            # 빈 문자열 및 NaN 처리
-            basic_bldg = '' if basic_bldg in ['', 'nan', 'NaN', 'None'] else basic_bldg
-            aql_bldg = '' if aql_bldg in ['', 'nan', 'NaN', 'None'] else aql_bldg
-
-            # 케이스 분류
-            if basic_bldg and aql_bldg:
-                if basic_bldg == aql_bldg:
-                    building_stats['both_match'] += 1
-                    final_bldg = basic_bldg
-                else:
-                    building_stats['both_mismatch'] += 1
-                    final_bldg = basic_bldg  # basic_manpower 우선
-                    mismatch_list.append({
-                        'Employee No': emp_no,
-                        'Full Name': emp_name,
-                        'Basic_BUILDING': basic_bldg,
-                        'AQL_BUILDING': aql_bldg,
-                        'Final_BUILDING': final_bldg,
-                        'Status': '⚠️ 근무지 정보 점검 요망'
-                    })
-            elif basic_bldg:
-                building_stats['basic_only'] += 1
-                final_bldg = basic_bldg
-            elif aql_bldg:
-                building_stats['aql_only'] += 1
-                final_bldg = aql_bldg
-            else:
-                building_stats['none'] += 1
-                final_bldg = ''
-
-            self.month_data.loc[idx, 'BUILDING_FINAL'] = final_bldg
+        # 빈 값 정리 (str 변환 + strip, 'nan'/'None' 등은 '') - 컬럼 단위 1회
+        empty = pd.Series('', index=self.month_data.index, dtype=object)
+        basic_bldg = self._clean_str_col(self.month_data['BUILDING']) if has_basic_building else empty
+        aql_bldg = self._clean_str_col(self.month_data['AQL_BUILDING']) if has_aql_building else empty
+        has_basic = basic_bldg.ne('')
+        has_aql = aql_bldg.ne('')
+
+        # 케이스 분류
+        both_match = has_basic & has_aql & basic_bldg.eq(aql_bldg)
+        both_mismatch = has_basic & has_aql & ~both_match
+        building_stats['both_match'] = int(both_match.sum())
+        building_stats['both_mismatch'] = int(both_mismatch.sum())
+        building_stats['basic_only'] = int((has_basic & ~has_aql).sum())
+        building_stats['aql_only'] = int((~has_basic & has_aql).sum())
+        building_stats['none'] = int((~has_basic & ~has_aql).sum())
+
+        # 최종 BUILDING 칼럼 생성 (basic_manpower 우선, 없으면 AQL)
+        self.month_data['BUILDING_FINAL'] = basic_bldg.where(has_basic, aql_bldg)
+
+        if both_mismatch.any():
+            mismatch_rows = self.month_data.loc[both_mismatch]
+            mismatch_list = pd.DataFrame({
+                'Employee No': mismatch_rows['Employee No'].tolist(),
+                'Full Name': (mismatch_rows['Full Name'].tolist() if 'Full Name' in mismatch_rows.columns
+                              else ['Unknown'] * len(mismatch_rows)),
+                'Basic_BUILDING': basic_bldg[both_mismatch].tolist(),
+                'AQL_BUILDING': aql_bldg[both_mismatch].tolist(),
+                'Final_BUILDING': basic_bldg[both_mismatch].tolist(),  # basic_manpower 우선
+                'Status': '⚠️ 근무지 정보 점검 요망'
+            }, dtype=object).to_dict(orient='records')
 
         # 최종 BUILDING 칼럼 업데이트
         self.month_data['BUILDING'] = self.month_data['BUILDING_FINAL']
@@ -3170,8 +3569,15 @@ class CompleteQIPCalculator:
         calc_month_start = pd.Timestamp(self.config.year, self.config.month.number, 1)
         calc_month_end = pd.Timestamp(self.config.year, self.config.month.number + 1, 1) - pd.Timedelta(days=1) if self.config.month.number < 12 else pd.Timestamp(self.config.year, 12, 31)
         
-        for idx, row in self.month_data.iterrows():
-            stop_date_str = row.get('Stop working Date')
+        # 행별 변경값은 dict로 모아 두고 loop 종료 후 컬럼 단위로 1회 반영 (셀 단위 .loc 쓰기 방지)
+        row_updates = []
+        stop_dates = self.month_data['Stop working Date'].tolist()
+        emp_nos = (self.month_data['Employee No'].tolist()
+                   if 'Employee No' in self.month_data.columns else [''] * len(self.month_data))
+
+        for stop_date_str, emp_no in zip(stop_dates, emp_nos):
+            row_out = {}
+            row_updates.append(row_out)
             if pd.notna(stop_date_str) and stop_date_str != '':
                 try:
                     # date 파싱
@@ -3190,28 +3596,32 @@ class CompleteQIPCalculator:
                                 if current_date.weekday() < 5:  # month-금 (0-4)
                                     working_days_possible += 1
                                 current_date += pd.Timedelta(days=1)
-                            
-                            actual_days = row.get('Actual Working Days', 0)
 
                             # Total Working Daysonly updated
                             # Absence Rate (raw)and conditionare add_condition_evaluation_to_excelfrom
                             # 승인휴 반영하여 통 days되게 calculationdone
-                            self.month_data.loc[idx, 'Total Working Days'] = working_days_possible
+                            row_out['Total Working Days'] = working_days_possible
 
                             # 레거시 컬럼 삭제:                             # minimum 근무 days conditiononly 체크 (Absence Rate 나in progressto calculation)
                             # 레거시 컬럼 삭제: self.month_data.loc[idx, 'attendancy condition 4 - minimum working days'] = 'yes' if actual_days < 12 else 'no'
 
-                            print(f"  → 퇴사자 {row.get('Employee No', '')}: {stop_date.strftime('%Y-%m-%d')} 퇴사, 근무능 days {working_days_possible} days (Absence Rate 승인휴 반영하여 나in progressto calculation)")
+                            print(f"  → 퇴사자 {emp_no}: {stop_date.strftime('%Y-%m-%d')} 퇴사, 근무능 days {working_days_possible} days (Absence Rate 승인휴 반영하여 나in progressto calculation)")
                         
                         # calculation month previous 퇴사자
                         elif stop_date < calc_month_start:
-                            self.month_data.loc[idx, 'Actual Working Days'] = 0
+                            row_out['Actual Working Days'] = 0
                             # 레거시 컬럼 삭제:                             self.month_data.loc[idx, 'Total Working Days'] = 0
                             # 레거시 컬럼 삭제:                             self.month_data.loc[idx, 'attendancy condition 1 - acctual working days is zero'] = 'yes'
                             # 레거시 컬럼 삭제: self.month_data.loc[idx, 'attendancy condition 4 - minimum working days'] = 'yes'
                             
                 except Exception as e:
-                    print(f"  ⚠️ 퇴사자 absence rate 재calculation 오류 (employee {row.get('Employee No', '')}): {e}")
+                    print(f"  ⚠️ 퇴사자 absence rate 재calculation 오류 (employee {emp_no}): {e}")
+
+        # 변경된 행만 컬럼별로 한 번에 반영
+        updates = pd.DataFrame(row_updates, index=self.month_data.index)
+        for col in updates.columns:
+            changed = updates[col].notna()
+            self.month_data.loc[changed, col] = updates.loc[changed, col]
     
     def _set_improved_default_values(self):
         """improved defaultvalue configuration"""
@@ -3376,7 +3786,7 @@ class CompleteQIPCalculator:
                 print(f"   필요한 file들 first preparation해주세요.")
                 print(f"\n❌ {self.config.month.number}month calculationalso in progressproceed.")
                 print(f"   previous month data 필요하므with {prev_month}month first preparation해주세요.")
-                raise Exception(f"{prev_month}month data 없어 {self.config.month.number}month calculation in progressproceed.")
+                raise FileNotFoundError(f"{prev_month}month data 없어 {self.config.month.number}month calculation in progressproceed.")
             
             print(f"\n✅ {prev_month}month calculationto 필요한 file 모두 있습니다.")
             print(f"   {prev_month}month calculation started...")
@@ -3386,7 +3796,7 @@ class CompleteQIPCalculator:
             prev_config_file = self.base_path / 'config_files' / f'config_{prev_month_obj.full_name}_{prev_year}.json'
             if not prev_config_file.exists():
                 print(f"❌ {prev_month}month config file not found: {prev_config_file}")
-                raise Exception(f"{prev_month}month config file 없어 {self.config.month.number}month calculation in progressproceed.")
+                raise FileNotFoundError(f"{prev_month}month config file 없어 {self.config.month.number}month calculation in progressproceed.")
             
             # JSON file withload
             import json
@@ -3418,7 +3828,7 @@ class CompleteQIPCalculator:
             
             if not prev_data:
                 print(f"❌ {prev_month}month data load failed")
-                raise Exception(f"{prev_month}month data load failedwith {self.config.month.number}month calculation in progressproceed.")
+                raise FileNotFoundError(f"{prev_month}month data load failedwith {self.config.month.number}month calculation in progressproceed.")
             
             # previous month calculation기 created
             prev_processor = CompleteQIPCalculator(prev_data, prev_config)
@@ -3620,11 +4030,19 @@ class CompleteQIPCalculator:
         """
         # [Issue #48 근본 해결] startswith('YES')로 변경 - 'YES', 'YES_3MONTHS' 모두 처리
         continuous_fail_mask = self.month_data['Continuous_FAIL'].astype(str).str.startswith('YES')
-        continuous_fail_employees = self.month_data[continuous_fail_mask]
-        
+
+        # Employee No → Building hashmap 1회 구축 (get_employee_factory의 행별 전체 scan 대체)
+        # 중복 Employee No는 첫 번째 행 기준 (reversed zip), NaN ID는 매칭 없음
+        building_col = next((c for c in ['BUILDING', 'Building'] if c in self.month_data.columns), None)
+        if building_col is None:
+            return {}
+        emp_nos = self.month_data['Employee No'].tolist()
+        buildings = [str(b) for b in self.month_data[building_col].tolist()]
+        building_by_emp = dict(zip(reversed(emp_nos), reversed(buildings)))
+
         factory_counts = {}
-        for _, row in continuous_fail_employees.iterrows():
-            factory = self.get_employee_factory(row['Employee No'])
+        for emp_no in self.month_data.loc[continuous_fail_mask, 'Employee No'].tolist():
+            factory = building_by_emp.get(emp_no, '') if pd.notna(emp_no) else ''
             if factory:
                 factory_counts[factory] = factory_counts.get(factory, 0) + 1
         
@@ -3825,6 +4243,9 @@ class CompleteQIPCalculator:
         incentive_col = f"{self.config.get_month_str('capital')}_Incentive"
         aql_col = f"{self.config.get_month_str('capital')} AQL Failures"
         
+        # 연속 개월 수 lookup 용 ID → 행 위치 (아래 두 loop 에서 공유, loop 중 행 추가/삭제 없음)
+        id_positions = self.data_processor.build_padded_id_positions(self.month_data)
+
         # Model Master processing (별alsowith first processing)
         for idx, row in self.month_data[model_master_mask].iterrows():
             # 미 calculationdone 경우 스킵
@@ -3902,7 +4323,8 @@ class CompleteQIPCalculator:
             else:
                 # MODEL MASTER ASSEMBLY INSPECTORand 같은 Progressive Table 사용
                 # position_condition_matrix.jsonof incentive_progression.TYPE_1_PROGRESSIVE apply
-                continuous_months = self.data_processor.calculate_continuous_months_from_history(emp_id, self.month_data)
+                continuous_months = self.data_processor.calculate_continuous_months_from_history(
+                    emp_id, self.month_data, id_positions)
                 incentive = self.get_assembly_inspector_amount(continuous_months)
                 self.month_data.loc[idx, 'Continuous_Months'] = continuous_months
                 print(f"    → {row.get('Full Name', 'Unknown')} (Model Master): {continuous_months}month consecutive → {incentive:,} VND")
@@ -4007,7 +4429,8 @@ class CompleteQIPCalculator:
                 print(f"    → {row.get('Full Name', 'Unknown')}: in charge factory({auditor_factory})to 3-month consecutive AQL failures {fail_count}명 → 0 VND")
             else:
                 # Assembly Inspectorand same days한 consecutive 충족 month basis apply
-                continuous_months = self.data_processor.calculate_continuous_months_from_history(emp_id, self.month_data)
+                continuous_months = self.data_processor.calculate_continuous_months_from_history(
+                    emp_id, self.month_data, id_positions)
                 incentive = self.get_assembly_inspector_amount(continuous_months)
 
                 # Continuous_Months column updated
@@ -4484,6 +4907,9 @@ class CompleteQIPCalculator:
         if aql_mask.any():
             self.calculate_aql_inspector_incentive(aql_mask, incentive_col, aql_col)
         
+        # 연속 개월 수 lookup 용 ID → 행 위치 (loop 중 행 추가/삭제 없음)
+        id_positions = self.data_processor.build_padded_id_positions(self.month_data)
+
         # Assembly Inspector processing
         for idx, row in self.month_data[assembly_mask].iterrows():
             # 미 calculationdone 경우 스킵
@@ -4535,7 +4961,8 @@ class CompleteQIPCalculator:
                     print(f"      {row.get('Full Name', emp_id)}: 조건 미충족 → 0 VND (실패: {', '.join(failed_conditions)})")
             else:
                 # consecutive 충족 month 수 calculation
-                continuous_months = self.data_processor.calculate_continuous_months_from_history(emp_id, self.month_data)
+                continuous_months = self.data_processor.calculate_continuous_months_from_history(
+                    emp_id, self.month_data, id_positions)
 
                 # consecutive 충족 month 수to 따른 차etc. 지급
                 incentive = self.get_assembly_inspector_amount(continuous_months)
@@ -4580,13 +5007,20 @@ class CompleteQIPCalculator:
         # 퇴사자 필터링 카운터
         excluded_resigned_count = 0
 
-        for _, row in self.month_data.iterrows():
-            boss_name = row.get(boss_col)
-            if pd.notna(boss_name) and boss_name.strip():
-                emp_id = row.get('Employee No', '')
+        # 컬럼을 numpy 배열로 1회 추출 (iterrows의 행별 Series 생성 제거)
+        n_rows = len(self.month_data)
+        boss_arr = self.month_data[boss_col].to_numpy()
+        emp_arr = (self.month_data['Employee No'].to_numpy()
+                   if 'Employee No' in self.month_data.columns else [''] * n_rows)
+        stop_arr = (self.month_data['Stop working Date'].to_numpy()
+                    if 'Stop working Date' in self.month_data.columns else [None] * n_rows)
 
+        # Full Name → Employee No hashmap (동명이인은 첫 번째 행 기준, 기존 iloc[0] 동작 유지)
+        boss_id_by_name = dict(zip(reversed(self.month_data['Full Name'].tolist()), reversed(list(emp_arr))))
+
+        for boss_name, emp_id, stop_date_str in zip(boss_arr, emp_arr, stop_arr):
+            if pd.notna(boss_name) and boss_name.strip():
                 # ✅ 퇴사자 필터링: 계산 월 이전 퇴사자는 부하 직원 매핑에서 제외
-                stop_date_str = row.get('Stop working Date')
                 if pd.notna(stop_date_str):
                     try:
                         stop_date = pd.to_datetime(stop_date_str)
@@ -4598,12 +5032,8 @@ class CompleteQIPCalculator:
                         pass  # 날짜 변환 실패 시 퇴사자 아님으로 처리
 
                 # 상사의 Employee No 찾기
-                boss_data = self.month_data[
-                    self.month_data['Full Name'] == boss_name
-                ]
-
-                if not boss_data.empty:
-                    boss_id = boss_data.iloc[0].get('Employee No', '')
+                if boss_name in boss_id_by_name:
+                    boss_id = boss_id_by_name[boss_name]
                     # Employee No를 int로 변환 (일관성 유지)
                     if boss_id:
                         try:
@@ -5374,41 +5804,37 @@ class CompleteQIPCalculator:
         print(f"    TYPE-1 LINE LEADER 수령자 평균: {type1_line_avg:,.0f} VND ({len(receiving_type1)}/{len(type1_line_leaders)}명)")
         print(f"    TYPE-2 LINE LEADER 수령자 평균: {type2_line_avg:,.0f} VND ({len(receiving_type2)}/{len(type2_line_leaders)}명)")
 
-        # 각 GROUP LEADER calculation
-        for idx, row in self.month_data[type2_group_mask].iterrows():
-            emp_id = row.get('Employee No', '')
-            name = row.get('Full Name', '')
-
-            # attendance condition 체크
-            attendance_fail = (
-                row.get('cond_1_attendance_rate') == 'FAIL' or
-                row.get('cond_2_unapproved_absence') == 'FAIL' or
-                row.get('cond_3_actual_working_days') == 'FAIL' or
-                row.get('cond_4_minimum_days') == 'FAIL'  # Phase 1: Single Source of Truth
-            )
-
-            # debugging용 current value checking
-            current_value = self.month_data.loc[idx, incentive_col]
-
-            # 무condition 재calculation - existing value 완전 무시
-            # TYPE-2 GROUP LEADER는 TYPE-1 LINE LEADER 평균 × 2 기준으로 계산
-            if attendance_fail:
-                incentive = 0
-            elif type1_line_avg > 0:
-                # TYPE-1 LINE LEADER 평균 × 2 사용 (Primary)
-                incentive = int(type1_line_avg * 2)
-            elif type2_line_avg > 0:
-                # TYPE-2 LINE LEADER 평균 × 2 (Fallback - TYPE-1 없을 때)
-                incentive = int(type2_line_avg * 2)
-            else:
-                # defaultvalue (LINE LEADER defaultvalue × 2)
-                incentive = 107360 * 2
-
-            self.month_data.loc[idx, incentive_col] = incentive
-
+        # 무condition 재calculation - existing value 완전 무시
+        # TYPE-2 GROUP LEADER는 TYPE-1 LINE LEADER 평균 × 2 기준으로 계산 (모든 GROUP LEADER 동일 금액)
+        if type1_line_avg > 0:
+            # TYPE-1 LINE LEADER 평균 × 2 사용 (Primary)
+            leader_incentive = int(type1_line_avg * 2)
+        elif type2_line_avg > 0:
+            # TYPE-2 LINE LEADER 평균 × 2 (Fallback - TYPE-1 없을 때)
+            leader_incentive = int(type2_line_avg * 2)
+        else:
+            # defaultvalue (LINE LEADER defaultvalue × 2)
+            leader_incentive = 107360 * 2
+
+        # attendance condition 체크 (condition 1-4 중 하나라도 FAIL) - Phase 1: Single Source of Truth
+        group_leaders = self.month_data[type2_group_mask]
+        attendance_fail = np.zeros(len(group_leaders), dtype=bool)
+        for cond_col in ('cond_1_attendance_rate', 'cond_2_unapproved_absence',
+                         'cond_3_actual_working_days', 'cond_4_minimum_days'):
+            if cond_col in group_leaders.columns:
+                attendance_fail |= (group_leaders[cond_col] == 'FAIL').to_numpy()
+
+        # 각 GROUP LEADER calculation (행별 .loc 대입 대신 1회 대입)
+        incentives = np.where(attendance_fail, 0, leader_incentive)
+        if len(incentives):
+            self.month_data.loc[type2_group_mask, incentive_col] = incentives
+
+        emp_ids = group_leaders['Employee No'] if 'Employee No' in group_leaders.columns else [''] * len(group_leaders)
+        names = group_leaders['Full Name'] if 'Full Name' in group_leaders.columns else [''] * len(group_leaders)
+        for emp_id, name, failed, incentive in zip(emp_ids, names, attendance_fail, incentives.tolist()):
             # GROUP LEADER calculation 로그
             print(f"    {name} ({emp_id}):")
-            print(f"      condition 충족: {'NO' if attendance_fail else 'YES'}")
+            print(f"      condition 충족: {'NO' if failed else 'YES'}")
             print(f"      TYPE-1 LINE 평균: {type1_line_avg:,.0f}, TYPE-2 LINE 평균: {type2_line_avg:,.0f}")
             print(f"      calculationdone incentive: {incentive:,.0f} VND")
 
@@ -5564,23 +5990,19 @@ class CompleteQIPCalculator:
         reference_map = {}
         incentive_col = f"{self.config.get_month_str('capital')}_Incentive"
 
-        type1_mask = self.month_data['ROLE TYPE STD'] == 'TYPE-1'
+        type1_data = self.month_data[self.month_data['ROLE TYPE STD'] == 'TYPE-1']
 
         # 포지션별 평균 calculation (수령자만 평균 - 0 VND 제외)
-        for position in self.month_data[type1_mask]['QIP POSITION 1ST  NAME'].unique():
-            if pd.notna(position):
-                pos_employees = self.month_data[
-                    (self.month_data['ROLE TYPE STD'] == 'TYPE-1') &
-                    (self.month_data['QIP POSITION 1ST  NAME'] == position)
-                ]
+        # groupby 1회로 전체 포지션 평균 산출 (포지션마다 전체 행 mask 생성 방지)
+        receiving_employees = type1_data[type1_data[incentive_col] > 0]
+        position_avg = receiving_employees.groupby(
+            'QIP POSITION 1ST  NAME', observed=True, sort=False
+        )[incentive_col].mean()
 
-                # V9.1 원본: 수령자만 평균 (0 VND 제외)
-                receiving_employees = pos_employees[pos_employees[incentive_col] > 0]
-
-                if len(receiving_employees) > 0:
-                    # V9.1 원본: int() 사용 (truncation)
-                    avg_incentive = int(receiving_employees[incentive_col].mean())
-                    reference_map[position.upper()] = avg_incentive
+        for position in type1_data['QIP POSITION 1ST  NAME'].unique():
+            if pd.notna(position) and position in position_avg.index:
+                # V9.1 원본: int() 사용 (truncation)
+                reference_map[position.upper()] = int(position_avg[position])
 
         return reference_map
     
@@ -5765,11 +6187,23 @@ class CompleteQIPCalculator:
                 print(f"\n    📊 {role_type} position별 상세:")
                 position_col = 'QIP POSITION 1ST  NAME'
                 if position_col in type_data.columns:
-                    positions = type_data.groupby(position_col).agg({
-                        incentive_col: ['count', lambda x: (x > 0).sum(), 'sum', 
-                                       lambda x: x[x > 0].mean() if (x > 0).sum() > 0 else 0]
-                    }).round(0)
-                    positions.columns = ['총VND', '수령인VND', '총지급액', '평균지급액']
+                    # position code화(factorize) 후 np.bincount로 count/합계 산출 (groupby dispatch 없이 numpy reduction)
+                    pos_codes, pos_names = pd.factorize(type_data[position_col], sort=True)
+                    has_position = pos_codes >= 0
+                    codes = pos_codes[has_position]
+                    amounts = type_data[incentive_col].to_numpy(dtype=float)[has_position]
+                    has_amount = ~np.isnan(amounts)
+                    received = amounts > 0
+                    n_positions = len(pos_names)
+                    receiving_counts = np.bincount(codes, weights=received, minlength=n_positions)
+                    receiving_sums = np.bincount(codes, weights=np.where(received, amounts, 0), minlength=n_positions)
+                    positions = pd.DataFrame({
+                        '총VND': np.bincount(codes, weights=has_amount, minlength=n_positions).astype(np.int64),
+                        '수령인VND': receiving_counts.astype(np.int64),
+                        '총지급액': np.bincount(codes, weights=np.where(has_amount, amounts, 0), minlength=n_positions),
+                        '평균지급액': np.divide(receiving_sums, receiving_counts,
+                                           out=np.zeros(n_positions), where=receiving_counts > 0),
+                    }, index=pos_names).round(0)
                     positions['미수령인VND'] = positions['총VND'] - positions['수령인VND']
                     positions['수령률'] = (positions['수령인VND'] / positions['총VND'] * 100).round(1)
                     
@@ -5789,13 +6223,35 @@ class CompleteQIPCalculator:
         print("\n📊 연속 개월 추가 tracking columns...")
 
         # previous month consecutive monthsand current month expected month calculation
+        # (previous/current/next month 값을 한 번의 loop에서 함께 계산)
         previous_continuous = []
         current_expected = []
+        next_month_expected = []
 
-        for idx, row in self.month_data.iterrows():
-            emp_id = str(row.get('Employee No', '')).zfill(9)
-            position = str(row.get('QIP POSITION 1ST  NAME', '')).upper()
-            role_type = row.get('ROLE TYPE STD', '')
+        df = self.month_data
+        n_rows = len(df)
+
+        def _column_list(col, default):
+            return df[col].tolist() if col in df.columns else [default] * n_rows
+
+        emp_nos = _column_list('Employee No', '')
+        positions = _column_list('QIP POSITION 1ST  NAME', '')
+        role_types = _column_list('ROLE TYPE STD', '')
+        current_incentives = _column_list(f'{self.config.get_month_str("capital")}_Incentive', 0)
+
+        # JSON 파일은 loop 밖에서 1회만 로드
+        continuous_employees = None
+        try:
+            json_path = Path('config_files/assembly_inspector_continuous_months.json')
+            if json_path.exists():
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    continuous_employees = json.load(f).get('employees', {})
+        except:
+            continuous_employees = None
+
+        for emp_no, position_value, role_type, current_incentive in zip(emp_nos, positions, role_types, current_incentives):
+            emp_id = str(emp_no).zfill(9)
+            position = str(position_value).upper()
 
             # TYPE-1 ASSEMBLY INSPECTOR, MODEL MASTER, AUDITOR & TRAINERonly 해당
             if role_type == 'TYPE-1' and any(x in position for x in ['ASSEMBLY INSPECTOR', 'MODEL MASTER', 'AUDITOR', 'TRAINING']):
@@ -5804,46 +6260,23 @@ class CompleteQIPCalculator:
                 expected_months = 0
 
                 try:
-                    json_path = Path('config_files/assembly_inspector_continuous_months.json')
-                    if json_path.exists():
-                        import json
-                        with open(json_path, 'r', encoding='utf-8') as f:
-                            config = json.load(f)
-
-                        if emp_id in config.get('employees', {}):
-                            emp_data = config['employees'][emp_id]
-                            prev_months = emp_data.get('july_continuous_months', 0)
-                            expected_months = emp_data.get('august_expected_months', 0)
+                    if continuous_employees is not None and emp_id in continuous_employees:
+                        emp_data = continuous_employees[emp_id]
+                        prev_months = emp_data.get('july_continuous_months', 0)
+                        expected_months = emp_data.get('august_expected_months', 0)
                 except:
                     pass
 
                 # incentive 수령 여부with 실제 consecutive months checking
-                current_incentive = row.get(f'{self.config.get_month_str("capital")}_Incentive', 0)
                 if current_incentive > 0 and expected_months == 0:
                     # JSONto 없지only incentive 받았다면 condition 충족with 간주
                     expected_months = 1
 
                 previous_continuous.append(prev_months)
                 current_expected.append(expected_months)
-            else:
-                # 해당 없 position
-                previous_continuous.append('')
-                current_expected.append('')
-
-        # next month expected month수 calculation
-        next_month_expected = []
-        for idx, row in self.month_data.iterrows():
-            emp_id = str(row.get('Employee No', '')).zfill(9)
-            position = str(row.get('QIP POSITION 1ST  NAME', '')).upper()
-            role_type = row.get('ROLE TYPE STD', '')
-
-            # TYPE-1 ASSEMBLY INSPECTOR, MODEL MASTER, AUDITOR & TRAINERonly 해당
-            if role_type == 'TYPE-1' and any(x in position for x in ['ASSEMBLY INSPECTOR', 'MODEL MASTER', 'AUDITOR', 'TRAINING']):
-                # current incentive 수령 여부 checking
-                current_incentive = row.get(f'{self.config.get_month_str("capital")}_Incentive', 0)
-                # 변수employees 충돌 수정: current_expected_valuewith 변경
-                current_expected_value = current_expected[idx] if idx < len(current_expected) and isinstance(current_expected[idx], int) else 0
 
+                # next month expected month수 calculation
+                current_expected_value = expected_months if isinstance(expected_months, int) else 0
                 if current_incentive > 0 and current_expected_value > 0:
                     # condition 충족 - next month은 +1
                     next_expected = current_expected_value + 1
@@ -5856,6 +6289,8 @@ class CompleteQIPCalculator:
                 next_month_expected.append(next_expected)
             else:
                 # 해당 없 position
+                previous_continuous.append('')
+                current_expected.append('')
                 next_month_expected.append('')
 
         # column 추
@@ -5873,39 +6308,54 @@ class CompleteQIPCalculator:
 
         print(f"✅ consecutive months 추적 column 추가 완료 (Next_Month_Expected include)")
 
-    def calculate_approved_leave_days(self, emp_no: str) -> int:
-        """employeeof 승인done 휴  days수 calculation (AR1 아닌 모든 Reason Description)"""
+    def _build_approved_leave_map(self) -> Dict[str, int]:
+        """attendance file 1회 읽기 → employee별 승인휴가 days수 map (AR1 아닌 모든 Reason Description)
+
+        key는 앞의 0을 제거한 employee 번호 문자열. 결과는 self._leave_map 에 캐시.
+        """
+        cached = getattr(self, '_leave_map', None)
+        if cached is not None:
+            return cached
+
+        leave_map = {}
         try:
             # attendance file 경with 져오기
             attendance_path = self.config.get_file_path('attendance')
-            if not os.path.exists(attendance_path):
-                return 0
-
-            # attendance file 읽기
-            att_df = pd.read_csv(attendance_path)
-
-            # employee 번호 표준화 (앞of 0 제거)
-            emp_no_str = str(emp_no).lstrip('0')
-
-            # 해당 employeeof attendance record 필터링
-            # detect_column_names 패턴 사용으로 구조적 호환성 확보 (2025-12-25)
-            emp_col = self.detect_column_names(att_df, ['Personnel Number', 'ID No', 'Employee No', 'EMPLOYEE NO'])
-            if not emp_col:
-                return 0
-            emp_attendance = att_df[att_df[emp_col].astype(str).str.lstrip('0') == emp_no_str]
-
-            # AR1 아닌 사유only 승인휴with 집계
-            # AR1 = 무단결근, 나머지 = 승인휴 (출산휴, 연차, 병, 출장 etc.)
-            approved_leave = emp_attendance[
-                emp_attendance['Reason Description'].notna() &
-                ~emp_attendance['Reason Description'].str.startswith('AR1', na=False)
-            ]
+            if os.path.exists(attendance_path):
+                # header만 먼저 읽어 필요한 컬럼(employee 번호, Reason Description) 결정
+                att_header = pd.read_csv(attendance_path, nrows=0)
+
+                # detect_column_names 패턴 사용으로 구조적 호환성 확보 (2025-12-25)
+                # NOTE: detect_column_names는 DataProcessor 메서드 (calculator에는 없음 →
+                #       이전에는 AttributeError가 조용히 처리되어 모든 employee 승인휴가 0 days)
+                emp_col = self.data_processor.detect_column_names(
+                    att_header, ['Personnel Number', 'ID No', 'Employee No', 'EMPLOYEE NO'])
+                if emp_col and 'Reason Description' in att_header.columns:
+                    # attendance file 읽기 (사용하는 2개 컬럼만)
+                    att_df = pd.read_csv(attendance_path, usecols=[emp_col, 'Reason Description'],
+                                         engine=_CSV_ENGINE)
+
+                    # AR1 아닌 사유only 승인휴with 집계
+                    # AR1 = 무단결근, 나머지 = 승인휴 (출산휴, 연차, 병, 출장 etc.)
+                    reason = att_df['Reason Description']
+                    approved_mask = reason.notna() & ~reason.astype(str).str.startswith('AR1', na=False)
+
+                    # employee 번호 표준화 (앞of 0 제거) 1회 후 집계
+                    # pandas .str 연산보다 numpy 배열 + list comprehension이 빠름
+                    emp_std = [str(v).lstrip('0') for v in att_df[emp_col].to_numpy()[approved_mask.to_numpy()]]
+                    leave_map = dict(Counter(emp_std))
+        except Exception as e:
+            # to러 발생 시 빈 map (with그 출력하지 않음 - 조용히 processing)
+            leave_map = {}
 
-            return len(approved_leave)
+        self._leave_map = leave_map
+        return leave_map
 
-        except Exception as e:
-            # to러 발생 시 0 반환 (with그 출력하지 않음 - 조용히 processing)
-            return 0
+    def calculate_approved_leave_days(self, emp_no: str) -> int:
+        """employeeof 승인done 휴  days수 calculation (AR1 아닌 모든 Reason Description)"""
+        # employee 번호 표준화 (앞of 0 제거)
+        emp_no_str = str(emp_no).lstrip('0')
+        return self._build_approved_leave_map().get(emp_no_str, 0)
 
     def add_condition_evaluation_to_excel(self):
         """10 conditions 평 결and Excelto 추"""
@@ -5919,48 +6369,47 @@ class CompleteQIPCalculator:
         if '출근율_Attendance_Rate_Percent' not in self.month_data.columns:
             print("  → attendance_rate column Calculating (승인휴 반영)...")
             self.month_data['출근율_Attendance_Rate_Percent'] = 0.0
-            self.month_data['Approved Leave Days'] = 0
+            # 승인휴  days수: attendance file 1회 groupby → employee 번호 map
+            leave_map = self._build_approved_leave_map()
+            self.month_data['Approved Leave Days'] = np.array(
+                [leave_map.get(str(v).lstrip('0'), 0) for v in self.month_data['Employee No'].to_numpy()],
+                dtype=int
+            )
             self.month_data['결근율_Absence_Rate_Percent'] = 0.0
 
-            for idx in self.month_data.index:
-                emp_no = self.month_data.loc[idx, 'Employee No']
-                total_days = self.month_data.loc[idx, 'Total Working Days'] if 'Total Working Days' in self.month_data.columns else 27
-                actual_days = self.month_data.loc[idx, 'Actual Working Days'] if 'Actual Working Days' in self.month_data.columns else 0
-
-                # 승인휴  days수 calculation
-                approved_leave_days = self.calculate_approved_leave_days(emp_no)
-                self.month_data.loc[idx, 'Approved Leave Days'] = approved_leave_days
-
-                # ✅ 정책 반영 (2025-12-01): 승인휴가는 결근에서 제외 (출근으로 인정)
-                # 정책 공식:
-                #   결근일 = 총 근무일 - 실제 근무일 - 승인휴가 (무단결근만 카운트)
-                #   결근율 = 결근일 / 총 근무일 × 100
-                #   출근율 = 100 - 결근율
-                # 예시: 총 18일, 실제 14일, 승인휴가 2일
-                #   → 결근 2일, 결근율 11.1%, 출근율 88.9% (PASS)
-                if total_days > 0:
-                    # 결근일 = 총 근무일 - 실제 근무일 - 승인휴가 (무단결근만 카운트)
-                    absence_days = total_days - actual_days - approved_leave_days
-                    absence_days = max(0, absence_days)  # 음수 방지
-
-                    # 결근율 = 결근일 / 총 근무일 × 100
-                    absence_rate = (absence_days / total_days) * 100
-
-                    # 출근율 = 100 - 결근율 (승인휴가는 출근으로 인정)
-                    attendance_rate = 100 - absence_rate
-
-                    # 100% 초과 방지
-                    attendance_rate = min(100, max(0, attendance_rate))
-                else:
-                    attendance_rate = 0
-                    absence_rate = 0
-                    absence_days = 0
+            # ✅ 정책 반영 (2025-12-01): 승인휴가는 결근에서 제외 (출근으로 인정)
+            # 정책 공식:
+            #   결근일 = 총 근무일 - 실제 근무일 - 승인휴가 (무단결근만 카운트)
+            #   결근율 = 결근일 / 총 근무일 × 100
+            #   출근율 = 100 - 결근율
+            # 예시: 총 18일, 실제 14일, 승인휴가 2일
+            #   → 결근 2일, 결근율 11.1%, 출근율 88.9% (PASS)
+            # 전체 column 산술 연산으로 계산 (행 단위 루프 없음)
+            total_days = (self.month_data['Total Working Days']
+                          if 'Total Working Days' in self.month_data.columns else 27)
+            actual_days = (self.month_data['Actual Working Days']
+                           if 'Actual Working Days' in self.month_data.columns else 0)
+            approved_leave_days = self.month_data['Approved Leave Days']
+            total_days = pd.Series(total_days, index=self.month_data.index)
+
+            # 결근일 = 총 근무일 - 실제 근무일 - 승인휴가 (음수/결측 → 0)
+            absence_days = total_days - actual_days - approved_leave_days
+            absence_days = absence_days.where(absence_days > 0, 0)
+
+            # 총 근무일이 0 이하(또는 결측)이면 출근율/결근율 0
+            has_total_days = (total_days > 0).to_numpy()
+            safe_total_days = total_days.where(total_days > 0, 1)
+
+            # 결근율 = 결근일 / 총 근무일 × 100
+            absence_rate = np.where(has_total_days, (absence_days / safe_total_days) * 100, 0.0)
+
+            # 출근율 = 100 - 결근율 (승인휴가는 출근으로 인정), 0~100 범위
+            attendance_rate = np.where(has_total_days, np.clip(100 - absence_rate, 0, 100), 0.0)
 
-                self.month_data.loc[idx, '출근율_Attendance_Rate_Percent'] = attendance_rate
-                self.month_data.loc[idx, '결근율_Absence_Rate_Percent'] = absence_rate
+            # 레거시 컬럼 삭제: 'attendancy condition 3 - absent % is over 12%' (absence rate > 12%)
 
-                # 레거시 컬럼 삭제:                 # attendancy condition 3also updated (absence rate > 12%)
-                # 레거시 컬럼 삭제: self.month_data.loc[idx, 'attendancy condition 3 - absent % is over 12%'] = 'yes' if absence_rate > 12 else 'no'
+            self.month_data['출근율_Attendance_Rate_Percent'] = attendance_rate
+            self.month_data['결근율_Absence_Rate_Percent'] = absence_rate
 
             print(f"  ✅ 승인휴 반영 completed - 평균 승인휴: {self.month_data['Approved Leave Days'].mean():.1f} days")
 
@@ -5974,37 +6423,44 @@ class CompleteQIPCalculator:
             self.month_data[col] = None  # Initialize as None to create object dtype
             self.month_data[col] = self.month_data[col].astype('object')
 
-        # Interim vs Final report 판정 (조건 1&4 예외 처리용)
-        from datetime import datetime
-        current_date = datetime.now()
-        is_current_month = (current_date.year == self.config.year and
-                           current_date.month == self.config.month.number)
-
-        # 각 employee별with 10 conditions 평
-        for idx in self.month_data.index:
-            emp_type = self.month_data.loc[idx, 'ROLE TYPE STD']
-            position = self.month_data.loc[idx, 'QIP POSITION 1ST  NAME']
-            position_code = self.month_data.loc[idx, 'FINAL QIP POSITION NAME CODE']
-
-            # Check if this is QC Assembly Inspector type
-            is_qc_assembly = False
-            if pd.notna(position):
-                position_upper = str(position).upper()
-                is_qc_assembly = (
-                    ('QC' in position_upper and 'ASSEMBLY' in position_upper and 'INSPECTOR' in position_upper) or
-                    ('ASSEMBLY' in position_upper and 'INSPECTOR' in position_upper)
-                )
-            if pd.notna(position_code):
-                position_code_upper = str(position_code).upper()
-                if position_code_upper.startswith('A') and len(position_code_upper) >= 2 and position_code_upper[1].isdigit():
-                    is_qc_assembly = True  # A1-A5 codes
-
-            # [Issue #XX] Interim Report 개념 제거 (2026-01-14)
-            # 항상 Final Report 형식으로 계산 - 모든 조건(1, 4 포함)을 정상 평가
-            # 월초에 조건 미충족 시 인센티브 0으로 표시 (실제 상태 반영)
-            is_interim_report = False
+        # [Issue #XX] Interim Report 개념 제거 (2026-01-14)
+        # 항상 Final Report 형식으로 계산 - 모든 조건(1, 4 포함)을 정상 평가
+        # 월초에 조건 미충족 시 인센티브 0으로 표시 (실제 상태 반영)
+
+        df = self.month_data
+        row_index = df.index
+
+        def _column_or_default(col_name, default):
+            """컬럼이 없으면 기본값으로 채운 Series 반환"""
+            if col_name in df.columns:
+                return df[col_name]
+            return pd.Series(default, index=row_index)
+
+        def _as_value_column(series):
+            """기존 .loc 셀 단위 쓰기와 동일하게 숫자형 값은 float64로 저장"""
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                return series.astype(float)
+            return series
+
+        # position_condition_matrix.jsonfrom 적용 condition 목록
+        # (ROLE TYPE STD, position)을 category code로 변환 → 고유 조합별 1회만 matrix 조회
+        role_cat = pd.Categorical(df['ROLE TYPE STD'])
+        position_cat = pd.Categorical(df['QIP POSITION 1ST  NAME'])
+        # 대문자 position (NaN → '') - category별 1회만 upper, code로 전체 행에 펼침 (condition 7 대상 판정에 재사용)
+        position_upper_by_code = np.array([str(c).upper() for c in position_cat.categories] + [''], dtype=object)
+        position_upper = pd.Series(position_upper_by_code[position_cat.codes], index=row_index)
+        n_position_codes = len(position_cat.categories) + 1  # +1: NaN(code -1)
+        pair_codes = ((role_cat.codes.astype(np.int64) + 1) * n_position_codes
+                      + (position_cat.codes.astype(np.int64) + 1))
+        unique_pair_codes, pair_inverse = np.unique(pair_codes, return_inverse=True)
+
+        # 적용 condition 목록을 10-bit mask로 변환 (condition N → bit N-1)
+        applicable_mask_by_pair = np.zeros(len(unique_pair_codes), dtype=np.uint16)
+        for pair_idx, pair_code in enumerate(unique_pair_codes):
+            role_code, position_code = divmod(int(pair_code), n_position_codes)
+            emp_type = role_cat.categories[role_code - 1] if role_code > 0 else np.nan
+            position = position_cat.categories[position_code - 1] if position_code > 0 else np.nan
 
-            # position_condition_matrix.jsonfrom 해당 positionof condition configuration 져오기
             pos_config = get_position_config_from_matrix(emp_type, position)
 
             if not pos_config:
@@ -6012,215 +6468,213 @@ class CompleteQIPCalculator:
                 type_matrix = POSITION_CONDITION_MATRIX.get('position_matrix', {}).get(emp_type, {})
                 pos_config = type_matrix.get('default', {})
 
-            applicable_conditions = pos_config.get('applicable_conditions', [])
-
-            # [Issue #58] 월별 Config 기반 Threshold 로드 (2026년 2월부터 변경)
-            # Fallback: config에 thresholds 없으면 기존 기본값 사용
-            _thresholds = self.config.thresholds or {}
-            attendance_rate_threshold = _thresholds.get('attendance_rate', 88)
-            unapproved_absence_threshold = _thresholds.get('unapproved_absence', 2)
-            minimum_working_days_threshold = _thresholds.get('minimum_working_days', 12)
-            area_reject_pct = _thresholds.get('area_reject_rate', 3.0)
-            prs_pass_rate_threshold = _thresholds.get('5prs_pass_rate', 95)
-            prs_min_qty_threshold = _thresholds.get('5prs_min_qty', 100)
-
-            # 10 conditions 각각 평
-            # condition 1: attendance율 >= {attendance_rate_threshold}%
-            attendance_rate = self.month_data.loc[idx, '출근율_Attendance_Rate_Percent'] if '출근율_Attendance_Rate_Percent' in self.month_data.columns else 0
-
-            # Expected working days 확인 (Total - Approved Leave)
-            # 근무해야 할 날이 0 이하면 출근율 조건 평가 불가 (예: 전체 기간 출산휴가)
-            total_days = self.month_data.loc[idx, 'Total Working Days'] if 'Total Working Days' in self.month_data.columns else 0
-            approved_leave = self.month_data.loc[idx, 'Approved Leave Days'] if 'Approved Leave Days' in self.month_data.columns else 0
-            expected_working_days = total_days - approved_leave
-
-            # [Issue #XX] Interim Report 예외 처리 제거 - 항상 정상 평가
-            if expected_working_days <= 0:
-                # 근무해야 할 날이 없으므로 출근율 조건 평가 불가
-                cond_1_result = 'NOT_APPLICABLE'
-                cond_1_applicable = 'Y' if 1 in applicable_conditions else 'NOT_APPLICABLE'
-                cond_1_threshold = attendance_rate_threshold
-            else:
-                cond_1_result = 'PASS' if attendance_rate >= attendance_rate_threshold else 'FAIL'
-                cond_1_applicable = 'Y' if 1 in applicable_conditions else 'NOT_APPLICABLE'
-                cond_1_threshold = attendance_rate_threshold
-
-            # 'N/A' 대신 'NOT_APPLICABLE' 사용 (pandas가 'N/A'를 NaN으로 변환하는 문제 해결)
-            self.month_data.loc[idx, 'cond_1_attendance_rate'] = cond_1_applicable if cond_1_applicable == 'NOT_APPLICABLE' else cond_1_result
-            self.month_data.loc[idx, 'cond_1_value'] = attendance_rate
-            self.month_data.loc[idx, 'cond_1_threshold'] = cond_1_threshold
+            for cond_no in pos_config.get('applicable_conditions', []):
+                if 1 <= cond_no <= 10:
+                    applicable_mask_by_pair[pair_idx] |= 1 << (cond_no - 1)
 
-            # condition 2: 무단결근 <= 2 days
-            unapproved_absence = self.month_data.loc[idx, 'Unapproved Absences'] if 'Unapproved Absences' in self.month_data.columns else 0
+        # 조건 번호별 적용 여부 boolean mask (고유 조합 → 행으로 broadcast 후 bit test)
+        applicable_mask = applicable_mask_by_pair[np.asarray(pair_inverse).reshape(-1)]
+        applicable = {
+            cond_no: (applicable_mask & (1 << (cond_no - 1))) != 0
+            for cond_no in range(1, 11)
+        }
 
-            # NaN 처리 추가 (출결 데이터 없는 신입사원)
-            if pd.isna(unapproved_absence):
-                cond_2_result = 'NOT_APPLICABLE'  # 출결 데이터 없음
+        # [Issue #58] 월별 Config 기반 Threshold 로드 (2026년 2월부터 변경)
+        # Fallback: config에 thresholds 없으면 기존 기본값 사용
+        _thresholds = self.config.thresholds or {}
+        attendance_rate_threshold = _thresholds.get('attendance_rate', 88)
+        unapproved_absence_threshold = _thresholds.get('unapproved_absence', 2)
+        minimum_working_days_threshold = _thresholds.get('minimum_working_days', 12)
+        area_reject_pct = _thresholds.get('area_reject_rate', 3.0)
+        prs_pass_rate_threshold = _thresholds.get('5prs_pass_rate', 95)
+        prs_min_qty_threshold = _thresholds.get('5prs_min_qty', 100)
+
+        def _set_result(cond_col, cond_no, pass_mask, na_mask=None):
+            """PASS/FAIL 결과를 컬럼 단위로 기록 (미적용 position은 NOT_APPLICABLE)"""
+            codes = _condition_result_codes(pass_mask, applicable[cond_no], na_mask)
+            # 'N/A' 대신 'NOT_APPLICABLE' 사용 (pandas가 'N/A'를 NaN으로 변환하는 문제 해결)
+            df[cond_col] = pd.Categorical.from_codes(codes, dtype=CONDITION_RESULT_DTYPE)
+
+        # 10 conditions 각각 평 (whole-column 연산)
+        # condition 1: attendance율 >= {attendance_rate_threshold}%
+        attendance_rate = _column_or_default('출근율_Attendance_Rate_Percent', 0)
+
+        # Expected working days 확인 (Total - Approved Leave)
+        # 근무해야 할 날이 0 이하면 출근율 조건 평가 불가 (예: 전체 기간 출산휴가)
+        total_days = _column_or_default('Total Working Days', 0)
+        approved_leave = _column_or_default('Approved Leave Days', 0)
+        expected_working_days = total_days - approved_leave
+
+        # [Issue #XX] Interim Report 예외 처리 제거 - 항상 정상 평가
+        _set_result('cond_1_attendance_rate', 1,
+                    (attendance_rate >= attendance_rate_threshold).to_numpy(),
+                    na_mask=(expected_working_days <= 0).to_numpy())
+        df['cond_1_value'] = _as_value_column(attendance_rate)
+        df['cond_1_threshold'] = float(attendance_rate_threshold)
+
+        # condition 2: 무단결근 <= 2 days
+        # NaN 처리 추가 (출결 데이터 없는 신입사원)
+        unapproved_absence = _column_or_default('Unapproved Absences', 0)
+        _set_result('cond_2_unapproved_absence', 2,
+                    (unapproved_absence <= unapproved_absence_threshold).to_numpy(),
+                    na_mask=unapproved_absence.isna().to_numpy())
+        df['cond_2_value'] = _as_value_column(unapproved_absence)
+        df['cond_2_threshold'] = float(unapproved_absence_threshold)
+
+        # condition 3: 실근무 days > 0
+        actual_working_days = _column_or_default('Actual Working Days', 0)
+        _set_result('cond_3_actual_working_days', 3, (actual_working_days > 0).to_numpy())
+        df['cond_3_value'] = _as_value_column(actual_working_days)
+        df['cond_3_threshold'] = 0.0
+
+        # condition 4: minimum근무 days >= {minimum_working_days_threshold}
+        # 항상 정상 평가 (Interim Report 개념 제거됨)
+        _set_result('cond_4_minimum_days', 4,
+                    (actual_working_days >= minimum_working_days_threshold).to_numpy())
+        df['cond_4_value'] = _as_value_column(actual_working_days)
+        df['cond_4_threshold'] = float(minimum_working_days_threshold)
+
+        # condition 5: items인 AQL 당month failure = 0
+        aql_col = f"{self.config.get_month_str('capital')} AQL Failures"
+        aql_fail = _column_or_default(aql_col, 0)
+        _set_result('cond_5_aql_personal_failure', 5, (aql_fail == 0).to_numpy())
+        df['cond_5_value'] = _as_value_column(aql_fail)
+        df['cond_5_threshold'] = 0.0
+
+        # condition 6: 연속 AQL failure 없음 [Issue #50: 연도별 기준 적용]
+        # 2025년: 3개월 연속(YES_3MONTHS)만 FAIL, 2026년+: 2개월 이상(startswith YES) FAIL
+        continuous_fail = _column_or_default('Continuous_FAIL', 'NO')
+        consecutive_fail_mask = self._consecutive_failure_mask(continuous_fail)
+        _set_result('cond_6_aql_continuous', 6, ~consecutive_fail_mask)
+        df['cond_6_value'] = _as_value_column(continuous_fail)
+        df['cond_6_threshold'] = 'NO'
+
+        # condition 7: 팀/area AQL (3-month consecutive failure 없음)
+        # condition은 LINE LEADER나 특정 포지션toonly apply
+        # default: 적용 대상은 PASS/NO, 미적용은 NOT_APPLICABLE
+        df['cond_7_value'] = np.where(applicable[7], 'NO', 'NOT_APPLICABLE').astype(object)
+        df['cond_7_threshold'] = 'NO'
+
+        # subordinate mapping 사전 구축 (manager ID → 부하 employee ID list)
+        # 루프 밖에서 1회, 컬럼 연산으로 생성 (iterrows 제거)
+        if applicable[7].any():
+            if 'MST direct boss name' in df.columns:
+                manager_raw = df['MST direct boss name']
+                manager_num = pd.to_numeric(manager_raw, errors='coerce')
+                # Convert to int if it's a float to match Employee No format
+                is_numeric_id = manager_num.notna()
+                manager_ids = pd.Series('', index=row_index, dtype=object)
+                manager_ids[is_numeric_id] = manager_num[is_numeric_id].astype('int64').astype(str)
+                other_id = manager_raw.notna() & ~is_numeric_id
+                manager_ids[other_id] = manager_raw[other_id].astype(str)
+
+                sub_ids = df['Employee No'].astype(str)
+                pair_mask = (manager_ids != '') & (sub_ids != '')
+                pairs = pd.DataFrame({'manager': manager_ids[pair_mask], 'sub': sub_ids[pair_mask]})
+                self.subordinate_mapping_cache = pairs.groupby('manager', sort=False)['sub'].apply(list).to_dict()
             else:
-                cond_2_result = 'PASS' if unapproved_absence <= unapproved_absence_threshold else 'FAIL'
-
-            cond_2_applicable = 'Y' if 2 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_2_unapproved_absence'] = cond_2_applicable if cond_2_applicable == 'NOT_APPLICABLE' else cond_2_result
-            self.month_data.loc[idx, 'cond_2_value'] = unapproved_absence
-            self.month_data.loc[idx, 'cond_2_threshold'] = unapproved_absence_threshold
-
-            # condition 3: 실근무 days > 0
-            actual_working_days = self.month_data.loc[idx, 'Actual Working Days'] if 'Actual Working Days' in self.month_data.columns else 0
-            cond_3_result = 'PASS' if actual_working_days > 0 else 'FAIL'
-            cond_3_applicable = 'Y' if 3 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_3_actual_working_days'] = cond_3_applicable if cond_3_applicable == 'NOT_APPLICABLE' else cond_3_result
-            self.month_data.loc[idx, 'cond_3_value'] = actual_working_days
-            self.month_data.loc[idx, 'cond_3_threshold'] = 0
-
-            # condition 4: minimum근무 days >= {minimum_working_days_threshold}
-            # 항상 정상 평가 (Interim Report 개념 제거됨)
-            cond_4_result = 'PASS' if actual_working_days >= minimum_working_days_threshold else 'FAIL'
-            cond_4_applicable = 'Y' if 4 in applicable_conditions else 'NOT_APPLICABLE'
-
-            self.month_data.loc[idx, 'cond_4_minimum_days'] = cond_4_applicable if cond_4_applicable == 'NOT_APPLICABLE' else cond_4_result
-            self.month_data.loc[idx, 'cond_4_value'] = actual_working_days
-            self.month_data.loc[idx, 'cond_4_threshold'] = minimum_working_days_threshold
-
-            # condition 5: items인 AQL 당month failure = 0
-            aql_col = f"{self.config.get_month_str('capital')} AQL Failures"
-            aql_fail = self.month_data.loc[idx, aql_col] if aql_col in self.month_data.columns else 0
-            cond_5_result = 'PASS' if aql_fail == 0 else 'FAIL'
-            cond_5_applicable = 'Y' if 5 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_5_aql_personal_failure'] = cond_5_applicable if cond_5_applicable == 'NOT_APPLICABLE' else cond_5_result
-            self.month_data.loc[idx, 'cond_5_value'] = aql_fail
-            self.month_data.loc[idx, 'cond_5_threshold'] = 0
-
-            # condition 6: 연속 AQL failure 없음 [Issue #50: 연도별 기준 적용]
-            # 2025년: 3개월 연속(YES_3MONTHS)만 FAIL, 2026년+: 2개월 이상(startswith YES) FAIL
-            continuous_fail = self.month_data.loc[idx, 'Continuous_FAIL'] if 'Continuous_FAIL' in self.month_data.columns else 'NO'
-            cond_6_result = 'PASS' if not self._is_consecutive_failure_for_year(continuous_fail) else 'FAIL'
-            cond_6_applicable = 'Y' if 6 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_6_aql_continuous'] = cond_6_applicable if cond_6_applicable == 'NOT_APPLICABLE' else cond_6_result
-            self.month_data.loc[idx, 'cond_6_value'] = continuous_fail
-            self.month_data.loc[idx, 'cond_6_threshold'] = 'NO'
-
-            # condition 7: 팀/area AQL (3-month consecutive failure 없음)
-            # condition은 LINE LEADER나 특정 포지션toonly apply
+                self.subordinate_mapping_cache = {}
+
+            # employee 번호(str) → 연속 실패 여부 hashmap (부하/구역 직원 조회를 O(1)로)
+            # condition 6에서 계산한 mask 재사용, 중복 employee 번호는 첫 번째 행 기준
+            emp_ids_str = df['Employee No'].astype(str).tolist()
+            self._is_consec_by_emp = dict(zip(reversed(emp_ids_str), reversed(consecutive_fail_mask.tolist())))
+
+            # auditor_trainer_area_mapping.json 로드 (루프 밖에서 1회)
+            area_mapping = None
+            area_mapping_file = Path('config_files') / 'auditor_trainer_area_mapping.json'
+            if area_mapping_file.exists():
+                area_mapping = read_json_file(area_mapping_file)
+
+        # auditor ID → 담당 구역 직원 목록 memo (area_mapping/month_data는 이 호출 동안 불변)
+        area_employees_by_auditor = {}
+
+        # 부하/담당 구역 확인이 필요한 LINE LEADER, AUDIT & TRAINING 만 개별 평가
+        # (condition 7 적용 대상이라도 그 외 position 은 항상 PASS → loop 진입 전 vectorized 로 제외)
+        emp_no_arr = df['Employee No'].to_numpy()
+        team_fail_out = np.zeros(len(df), dtype=bool)
+        is_line_leader = (position_upper.str.contains('LINE', regex=False)
+                          & position_upper.str.contains('LEADER', regex=False)).to_numpy()
+        is_area_auditor = ((position_upper.str.contains('AUDIT', regex=False)
+                            | position_upper.str.contains('TRAINING', regex=False))
+                           & ~position_upper.str.contains('MODEL MASTER', regex=False)).to_numpy()
+        for pos in np.flatnonzero(applicable[7] & (is_line_leader | is_area_auditor)):
             team_aql_fail = False  # defaultvalue
-            if 7 in applicable_conditions:
-                # LINE LEADERof 경우 부하employee in progress 3-month consecutive failures checking
-                emp_id = str(self.month_data.loc[idx, 'Employee No'])
-                position_value = self.month_data.loc[idx, 'QIP POSITION 1ST  NAME']
-                position = str(position_value).upper() if pd.notna(position_value) else ''
-
-                if 'LINE' in position and 'LEADER' in position:
-                    # subordinate_mapping 있으면 사용, 없으면 created
-                    if not hasattr(self, 'subordinate_mapping_cache'):
-                        subordinate_mapping = {}
-                        for _, row_inner in self.month_data.iterrows():
-                            manager_id_raw = row_inner.get('MST direct boss name', '')
-                            # Convert to int if it's a float to match Employee No format
-                            if pd.notna(manager_id_raw):
-                                try:
-                                    manager_id = str(int(manager_id_raw))
-                                except (ValueError, TypeError):
-                                    manager_id = str(manager_id_raw)
-                            else:
-                                manager_id = ''
-
-                            sub_id = str(row_inner['Employee No'])
-                            if manager_id and sub_id:
-                                if manager_id not in subordinate_mapping:
-                                    subordinate_mapping[manager_id] = []
-                                subordinate_mapping[manager_id].append(sub_id)
-                        self.subordinate_mapping_cache = subordinate_mapping
-
-                    # 부하employee in progress consecutive failures checking [Issue #50: 연도별 기준 적용]
-                    if emp_id in self.subordinate_mapping_cache:
-                        for sub_id in self.subordinate_mapping_cache[emp_id]:
-                            # FIX: Convert both sides to string for type-safe comparison
-                            # Employee No might be int64 after save_results() numeric conversion
-                            sub_data = self.month_data[self.month_data['Employee No'].astype(str) == str(sub_id)]
-                            if not sub_data.empty:
-                                # [Issue #50] 연도별 연속 실패 기준 적용
-                                # 2025년: YES_3MONTHS만, 2026년+: startswith('YES')
-                                continuous_fail_value = str(sub_data.iloc[0].get('Continuous_FAIL', 'NO'))
-                                if self._is_consecutive_failure_for_year(continuous_fail_value):
-                                    team_aql_fail = True
-                                    break
+            # LINE LEADERof 경우 부하employee in progress 3-month consecutive failures checking
+            emp_id = str(emp_no_arr[pos])
+
+            if is_line_leader[pos]:
+                # 부하employee in progress consecutive failures checking [Issue #50: 연도별 기준 적용]
+                if emp_id in self.subordinate_mapping_cache:
+                    for sub_id in self.subordinate_mapping_cache[emp_id]:
+                        # FIX: Convert both sides to string for type-safe comparison
+                        # Employee No might be int64 after save_results() numeric conversion
+                        # [Issue #50] 연도별 연속 실패 기준 적용
+                        # 2025년: YES_3MONTHS만, 2026년+: startswith('YES')
+                        if self._is_consec_by_emp.get(str(sub_id), False):
+                            team_aql_fail = True
+                            break
 
-                # AUDIT & TRAINING TEAM의 경우 담당 구역 직원 중 3개월 연속 실패 확인
-                # MODEL MASTER는 전체 구역 담당이므로 제외
-                elif ('AUDIT' in position or 'TRAINING' in position) and 'MODEL MASTER' not in position:
-                    # auditor_trainer_area_mapping.json 로드
-                    area_mapping_file = Path('config_files') / 'auditor_trainer_area_mapping.json'
-                    if area_mapping_file.exists():
-                        with open(area_mapping_file, 'r', encoding='utf-8') as f:
-                            area_mapping = json.load(f)
-
-                        # 담당 구역 직원 가져오기
-                        area_employees = self.get_auditor_area_employees(emp_id, area_mapping)
-
-                        # 담당 구역 직원 중 연속 실패자 확인 [Issue #50: 연도별 기준 적용]
-                        for area_emp_id in area_employees:
-                            area_emp_data = self.month_data[self.month_data['Employee No'].astype(str) == str(area_emp_id)]
-                            if not area_emp_data.empty:
-                                # [Issue #50] 연도별 연속 실패 기준 적용
-                                # 2025년: YES_3MONTHS만, 2026년+: startswith('YES')
-                                continuous_fail_value = str(area_emp_data.iloc[0].get('Continuous_FAIL', 'NO'))
-                                if self._is_consecutive_failure_for_year(continuous_fail_value):
-                                    team_aql_fail = True
-                                    break
+            # AUDIT & TRAINING TEAM의 경우 담당 구역 직원 중 3개월 연속 실패 확인
+            # MODEL MASTER는 전체 구역 담당이므로 제외
+            elif is_area_auditor[pos]:
+                if area_mapping is not None:
+                    # 담당 구역 직원 가져오기
+                    if emp_id not in area_employees_by_auditor:
+                        area_employees_by_auditor[emp_id] = self.get_auditor_area_employees(emp_id, area_mapping)
+                    area_employees = area_employees_by_auditor[emp_id]
+
+                    # 담당 구역 직원 중 연속 실패자 확인 [Issue #50: 연도별 기준 적용]
+                    for area_emp_id in area_employees:
+                        # [Issue #50] 연도별 연속 실패 기준 적용
+                        # 2025년: YES_3MONTHS만, 2026년+: startswith('YES')
+                        if self._is_consec_by_emp.get(str(area_emp_id), False):
+                            team_aql_fail = True
+                            break
 
-                cond_7_result = 'PASS' if not team_aql_fail else 'FAIL'
-                self.month_data.loc[idx, 'cond_7_aql_team_area'] = cond_7_result
-                self.month_data.loc[idx, 'cond_7_value'] = 'YES' if team_aql_fail else 'NO'
-            else:
-                self.month_data.loc[idx, 'cond_7_aql_team_area'] = 'NOT_APPLICABLE'
-                self.month_data.loc[idx, 'cond_7_value'] = 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_7_threshold'] = 'NO'
+            team_fail_out[pos] = team_aql_fail
+
+        _set_result('cond_7_aql_team_area', 7, ~team_fail_out)
+        if team_fail_out.any():
+            df['cond_7_value'] = df['cond_7_value'].where(~team_fail_out, 'YES')
+
+        # condition 8: in chargearea reject < {area_reject_pct}%
+        # PASS = reject rate < threshold, FAIL = reject rate >= threshold
+        reject_rate = _column_or_default('Area_Reject_Rate', 0)
+        _set_result('cond_8_area_reject', 8, (reject_rate < area_reject_pct).to_numpy())
+        df['cond_8_value'] = _as_value_column(reject_rate).where(applicable[8], 'NOT_APPLICABLE')
+        df['cond_8_threshold'] = float(area_reject_pct)
+
+        # condition 9: 5PRS passed율 >= {prs_pass_rate_threshold}%
+        prs_pass_rate = _column_or_default('5PRS_Pass_Rate', 0)
+        _set_result('cond_9_5prs_pass_rate', 9, (prs_pass_rate >= prs_pass_rate_threshold).to_numpy())
+        df['cond_9_value'] = _as_value_column(prs_pass_rate)
+        df['cond_9_threshold'] = float(prs_pass_rate_threshold)
+
+        # condition 10: 5PRS inspection량 >= {prs_min_qty_threshold}
+        prs_qty = _column_or_default('5PRS_Inspection_Qty', 0)
+        _set_result('cond_10_5prs_inspection_qty', 10, (prs_qty >= prs_min_qty_threshold).to_numpy())
+        df['cond_10_value'] = _as_value_column(prs_qty)
+        df['cond_10_threshold'] = float(prs_min_qty_threshold)
+
+        # 각 employee별 전체 condition 충족 비율 calculation (전체 frame 1회 집계)
+        result_frame = df[[cond_col for cond_col in condition_columns if cond_col in df.columns]]
+        # NOT_APPLICABLE인 조건은 제외 (interim report 조건 4 등)
+        is_applicable = result_frame.notna() & ~result_frame.isin(['N/A', 'NOT_APPLICABLE'])
+        applicable_count = is_applicable.sum(axis=1).astype(float)
+        passed_count = result_frame.eq('PASS').sum(axis=1).astype(float)
+
+        df['conditions_applicable'] = applicable_count
+        df['conditions_passed'] = passed_count
+        df['conditions_pass_rate'] = np.where(
+            applicable_count > 0,
+            passed_count / applicable_count.where(applicable_count > 0, 1) * 100,
+            0.0
+        )
 
-            # condition 8: in chargearea reject < {area_reject_pct}%
-            if 8 in applicable_conditions:
-                reject_rate = self.month_data.loc[idx, 'Area_Reject_Rate'] if 'Area_Reject_Rate' in self.month_data.columns else 0
-                # PASS = reject rate < threshold, FAIL = reject rate >= threshold
-                cond_8_result = 'PASS' if reject_rate < area_reject_pct else 'FAIL'
-                self.month_data.loc[idx, 'cond_8_area_reject'] = cond_8_result
-                self.month_data.loc[idx, 'cond_8_value'] = reject_rate
-            else:
-                self.month_data.loc[idx, 'cond_8_area_reject'] = 'NOT_APPLICABLE'
-                self.month_data.loc[idx, 'cond_8_value'] = 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_8_threshold'] = area_reject_pct
-
-            # condition 9: 5PRS passed율 >= {prs_pass_rate_threshold}%
-            prs_pass_rate = self.month_data.loc[idx, '5PRS_Pass_Rate'] if '5PRS_Pass_Rate' in self.month_data.columns else 0
-            cond_9_result = 'PASS' if prs_pass_rate >= prs_pass_rate_threshold else 'FAIL'
-            cond_9_applicable = 'Y' if 9 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_9_5prs_pass_rate'] = cond_9_applicable if cond_9_applicable == 'NOT_APPLICABLE' else cond_9_result
-            self.month_data.loc[idx, 'cond_9_value'] = prs_pass_rate
-            self.month_data.loc[idx, 'cond_9_threshold'] = prs_pass_rate_threshold
-
-            # condition 10: 5PRS inspection량 >= {prs_min_qty_threshold}
-            prs_qty = self.month_data.loc[idx, '5PRS_Inspection_Qty'] if '5PRS_Inspection_Qty' in self.month_data.columns else 0
-            cond_10_result = 'PASS' if prs_qty >= prs_min_qty_threshold else 'FAIL'
-            cond_10_applicable = 'Y' if 10 in applicable_conditions else 'NOT_APPLICABLE'
-            self.month_data.loc[idx, 'cond_10_5prs_inspection_qty'] = cond_10_applicable if cond_10_applicable == 'NOT_APPLICABLE' else cond_10_result
-            self.month_data.loc[idx, 'cond_10_value'] = prs_qty
-            self.month_data.loc[idx, 'cond_10_threshold'] = prs_min_qty_threshold
-
-            # 전체 condition 충족 비율 calculation
-            applicable_count = 0
-            passed_count = 0
-            for i in range(1, 11):
-                cond_col = f'cond_{i}_' + ['attendance_rate', 'unapproved_absence', 'actual_working_days', 'minimum_days',
-                                           'aql_personal_failure', 'aql_continuous', 'aql_team_area', 'area_reject',
-                                           '5prs_pass_rate', '5prs_inspection_qty'][i-1]
-                if cond_col in self.month_data.columns:
-                    result = self.month_data.loc[idx, cond_col]
-                    # NOT_APPLICABLE인 조건은 제외 (interim report 조건 4 등)
-                    if result not in ['N/A', 'NOT_APPLICABLE', None] and pd.notna(result):
-                        applicable_count += 1
-                        if result == 'PASS':
-                            passed_count += 1
-
-            self.month_data.loc[idx, 'conditions_applicable'] = applicable_count
-            self.month_data.loc[idx, 'conditions_passed'] = passed_count
-            self.month_data.loc[idx, 'conditions_pass_rate'] = (passed_count / applicable_count * 100) if applicable_count > 0 else 0
+        # 결과 컬럼은 PASS/FAIL/NOT_APPLICABLE 3개 값뿐 → category dtype (정수 code 비교, 메모리 절감)
+        for col in condition_columns:
+            df[col] = df[col].astype(CONDITION_RESULT_DTYPE)
 
         print(f"✅ 10 conditions 평 결and 추가 완료")
 
@@ -6228,8 +6682,8 @@ class CompleteQIPCalculator:
         """AQL 통계 정보 Excelto 추"""
         print("\n📊 AQL Adding statistics to Excel...")
 
-        # AQL 통계 AQL 파일에서 직접 calculation
-        aql_stats = {}
+        # AQL 통계 AQL 파일에서 직접 calculation (employee × RESULT 집계 1회)
+        aql_counts = None
 
         # AQL file 경with
         month_upper = self.config.month.full_name.upper()
@@ -6237,52 +6691,38 @@ class CompleteQIPCalculator:
 
         if os.path.exists(aql_file):
             print(f"  → AQL 파일에서 직접 통계 계산: {aql_file}")
-            aql_df = pd.read_csv(aql_file)
+            # 통계에 필요한 컬럼만 읽기 (나머지 AQL report 컬럼은 materialize하지 않음)
+            aql_df = pd.read_csv(aql_file, usecols=['EMPLOYEE NO', 'RESULT'], engine=_CSV_ENGINE)
 
             # 모든 PO TYPE include (FAIL은 주with FAIL POto 있음)
-            for emp_no in aql_df['EMPLOYEE NO'].unique():
-                emp_tests = aql_df[aql_df['EMPLOYEE NO'] == emp_no]
-                total = len(emp_tests)
-                pass_count = (emp_tests['RESULT'] == 'PASS').sum()
-                fail_count = (emp_tests['RESULT'] == 'FAIL').sum()
-
-                aql_stats[str(emp_no)] = {
-                    'total': int(total),
-                    'pass': int(pass_count),
-                    'fail': int(fail_count)
-                }
+            aql_counts = aql_result_counts(aql_df)
+            aql_counts.index = aql_counts.index.astype(str)
 
-            print(f"  → AQL 파일에서 {len(aql_stats)}명 검사자 통계 생성 완료")
+            print(f"  → AQL 파일에서 {len(aql_counts)}명 검사자 통계 생성 완료")
         else:
             print(f"  ⚠️ AQL file not found: {aql_file}")
             print("  → Using default values based on September AQL Failures column")
 
         # 새with운 column 추
-        self.month_data['AQL_Total_Tests'] = 0
-        self.month_data['AQL_Pass_Count'] = 0
-        self.month_data['AQL_Fail_Percent'] = 0.0
-
-        # 각 employee별with AQL 통계 추
-        for idx in self.month_data.index:
-            emp_no = str(self.month_data.loc[idx, 'Employee No'])
-
-            if emp_no in aql_stats:
-                stats = aql_stats[emp_no]
-                total_tests = stats.get('total', 0)
-                pass_count = stats.get('pass', 0)
-                fail_count = stats.get('fail', 0)
-
-                self.month_data.loc[idx, 'AQL_Total_Tests'] = total_tests
-                self.month_data.loc[idx, 'AQL_Pass_Count'] = pass_count
-
-                # FAIL % calculation
-                if total_tests > 0:
-                    fail_percent = (fail_count / total_tests) * 100
-                else:
-                    fail_percent = 0.0
-
-                self.month_data.loc[idx, 'AQL_Fail_Percent'] = round(fail_percent, 1)
-            # else 블록 제거 - AQL fileto 없 employee은 0with 유지 (inspection 하지 않은 employee)
+        # AQL fileto 없 employee은 0with 유지 (inspection 하지 않은 employee)
+        if aql_counts is not None:
+            emp_no_str = self.month_data['Employee No'].astype(str)
+            total_tests = emp_no_str.map(aql_counts['total']).fillna(0).astype(int)
+            pass_count = emp_no_str.map(aql_counts['PASS']).fillna(0).astype(int)
+            fail_count = emp_no_str.map(aql_counts['FAIL']).fillna(0).astype(int)
+
+            self.month_data['AQL_Total_Tests'] = total_tests
+            self.month_data['AQL_Pass_Count'] = pass_count
+            # FAIL % calculation
+            self.month_data['AQL_Fail_Percent'] = np.where(
+                total_tests > 0,
+                np.round(fail_count / total_tests.where(total_tests > 0, 1) * 100, 1),
+                0.0
+            )
+        else:
+            self.month_data['AQL_Total_Tests'] = 0
+            self.month_data['AQL_Pass_Count'] = 0
+            self.month_data['AQL_Fail_Percent'] = 0.0
 
         # 통계 출력
         aql_with_data = (self.month_data['AQL_Total_Tests'] > 0).sum()
@@ -6303,8 +6743,7 @@ class CompleteQIPCalculator:
             import os
             import shutil
             import json
-            output_dir = "output_files"
-            os.makedirs(output_dir, exist_ok=True)
+            output_dir = self._ensure_output_dir()
             
             # previous month incentive data 병합
             # ✅ 2026-01-06: Final Incentive 파일 우선 사용 (Single Source of Truth)
@@ -6339,11 +6778,12 @@ class CompleteQIPCalculator:
                         print(f"\n  ✅ Final Incentive 파일 발견 (Single Source of Truth):")
                         print(f"     {final_incentive_path}")
 
-                        final_incentive_data = pd.read_excel(final_incentive_path)
+                        final_incentive_data = read_final_incentive_excel(final_incentive_path)
 
                         # Employee No 변환
                         final_incentive_data['Employee No'] = pd.to_numeric(final_incentive_data['Employee No'], errors='coerce')
-                        self.month_data['Employee No'] = pd.to_numeric(self.month_data['Employee No'], errors='coerce')
+                        if not pd.api.types.is_numeric_dtype(self.month_data['Employee No']):
+                            self.month_data['Employee No'] = pd.to_numeric(self.month_data['Employee No'], errors='coerce')
 
                         # 인센티브 컬럼 찾기
                         # ✅ Priority Order (2026-01-11 수정):
@@ -6366,8 +6806,7 @@ class CompleteQIPCalculator:
                                 break
 
                         if prev_incentive_col:
-                            prev_incentive_map = final_incentive_data.set_index('Employee No')[prev_incentive_col].to_dict()
-                            self.month_data['Previous_Incentive'] = self.month_data['Employee No'].map(prev_incentive_map).fillna(0)
+                            self.month_data['Previous_Incentive'] = map_previous_incentive(self.month_data['Employee No'], final_incentive_data, prev_incentive_col)
 
                             # 검증
                             mapped_count = (self.month_data['Previous_Incentive'] > 0).sum()
@@ -6396,7 +6835,8 @@ class CompleteQIPCalculator:
 
                         # Employee No 숫자with 변환하여 mapping
                         prev_incentive_data['Employee No'] = pd.to_numeric(prev_incentive_data['Employee No'], errors='coerce')
-                        self.month_data['Employee No'] = pd.to_numeric(self.month_data['Employee No'], errors='coerce')
+                        if not pd.api.types.is_numeric_dtype(self.month_data['Employee No']):
+                            self.month_data['Employee No'] = pd.to_numeric(self.month_data['Employee No'], errors='coerce')
 
                         # previous month incentive column 찾기
                         prev_incentive_col = None
@@ -6415,8 +6855,7 @@ class CompleteQIPCalculator:
                                 break
 
                         if prev_incentive_col:
-                            prev_incentive_map = prev_incentive_data.set_index('Employee No')[prev_incentive_col].to_dict()
-                            self.month_data['Previous_Incentive'] = self.month_data['Employee No'].map(prev_incentive_map).fillna(0)
+                            self.month_data['Previous_Incentive'] = map_previous_incentive(self.month_data['Employee No'], prev_incentive_data, prev_incentive_col)
 
                             # mapping 결and checking
                             mapped_count = (self.month_data['Previous_Incentive'] > 0).sum()
@@ -6431,8 +6870,7 @@ class CompleteQIPCalculator:
                             prev_incentive_loaded = True
                         elif f'{prev_month.full_name.capitalize()}_Incentive' in prev_incentive_data.columns:
                             col_name = f'{prev_month.full_name.capitalize()}_Incentive'
-                            prev_incentive_map = prev_incentive_data.set_index('Employee No')[col_name].to_dict()
-                            self.month_data['Previous_Incentive'] = self.month_data['Employee No'].map(prev_incentive_map).fillna(0)
+                            self.month_data['Previous_Incentive'] = map_previous_incentive(self.month_data['Employee No'], prev_incentive_data, col_name)
                             prev_incentive_loaded = True
                     except Exception as e:
                         print(f"  ⚠️ {prev_month.korean_name} incentive data load failed: {e}")
@@ -6454,7 +6892,8 @@ class CompleteQIPCalculator:
             incentive_col = f"{self.config.get_month_str('capital')}_Incentive"
             
             # Final Incentive amount column current month incentive valuewith configuration
-            self.month_data['Final Incentive amount'] = self.month_data[incentive_col].copy()
+            # (column 대입 시 값은 새 block으로 복사되므로 .copy() 불필요, numpy 배열로 index 정렬 생략)
+            self.month_data['Final Incentive amount'] = self.month_data[incentive_col].to_numpy()
 
             # Single Source of Truth 위한 column 추
             if self.config.month.number == 8 and self.config.year == 2025:
@@ -6463,28 +6902,34 @@ class CompleteQIPCalculator:
             else:
                 # September 후: Previous_Month_Incentive column 추
                 if 'Previous_Incentive' in self.month_data.columns:
-                    self.month_data['Previous_Month_Incentive'] = self.month_data['Previous_Incentive']
+                    self.month_data['Previous_Month_Incentive'] = self.month_data['Previous_Incentive'].to_numpy()
 
             # consecutive months 추적 column 추 (Next_Month_Expected include)
-            print(f"📊 [DEBUG Issue #42] Before add_continuous_months_tracking: {len(self.month_data.columns)} columns")
+            if DEBUG_ISSUE_42:
+                print(f"📊 [DEBUG Issue #42] Before add_continuous_months_tracking: {len(self.month_data.columns)} columns")
             self.add_continuous_months_tracking()
-            print(f"📊 [DEBUG Issue #42] After add_continuous_months_tracking: {len(self.month_data.columns)} columns")
+            if DEBUG_ISSUE_42:
+                print(f"📊 [DEBUG Issue #42] After add_continuous_months_tracking: {len(self.month_data.columns)} columns")
 
             # Next_Month_Expected 미 add_continuous_months_trackingfrom 추done
             # in progress복 추 제거
 
             # 10 conditions 평 결and Exceland CSVto 추
-            print(f"📊 [DEBUG Issue #42] Before add_condition_evaluation_to_excel: {len(self.month_data.columns)} columns")
+            if DEBUG_ISSUE_42:
+                print(f"📊 [DEBUG Issue #42] Before add_condition_evaluation_to_excel: {len(self.month_data.columns)} columns")
             self.add_condition_evaluation_to_excel()
-            print(f"📊 [DEBUG Issue #42] After add_condition_evaluation_to_excel: {len(self.month_data.columns)} columns")
+            if DEBUG_ISSUE_42:
+                print(f"📊 [DEBUG Issue #42] After add_condition_evaluation_to_excel: {len(self.month_data.columns)} columns")
 
             # AQL 통계 정보 추
-            print(f"📊 [DEBUG Issue #42] Before add_aql_statistics_to_excel: {len(self.month_data.columns)} columns")
+            if DEBUG_ISSUE_42:
+                print(f"📊 [DEBUG Issue #42] Before add_aql_statistics_to_excel: {len(self.month_data.columns)} columns")
             self.add_aql_statistics_to_excel()
-            print(f"📊 [DEBUG Issue #42] After add_aql_statistics_to_excel: {len(self.month_data.columns)} columns")
+            if DEBUG_ISSUE_42:
+                print(f"📊 [DEBUG Issue #42] After add_aql_statistics_to_excel: {len(self.month_data.columns)} columns")
 
             # Issue #42 디버깅: 컬럼 수 확인
-            if len(self.month_data.columns) > 100:
+            if DEBUG_ISSUE_42 and len(self.month_data.columns) > 100:
                 print(f"⚠️ [Issue #42 WARNING] Column count too high: {len(self.month_data.columns)}")
                 print(f"   First 50 columns: {list(self.month_data.columns[:50])}")
                 print(f"   Last 10 columns: {list(self.month_data.columns[-10:])}")
@@ -6499,12 +6944,70 @@ class CompleteQIPCalculator:
 
             # Issue #46 Fix: 저장 전 Unnamed 열 제거 (Excel 빈 열 문제 해결)
             original_cols = len(self.month_data.columns)
-            self.month_data = self.month_data.loc[:, ~self.month_data.columns.str.contains('^Unnamed', na=False)]
-            if original_cols != len(self.month_data.columns):
+            unnamed_cols = [c for c in self.month_data.columns if _is_unnamed_column(c)]
+            if unnamed_cols:
+                self.month_data.drop(columns=unnamed_cols, inplace=True)
                 print(f"  📊 저장 전 Unnamed 열 제거: {original_cols} → {len(self.month_data.columns)}개 열")
 
             csv_file = os.path.join(output_dir, f"{self.config.output_prefix}_Complete_{version}_Complete.csv")
-            self.month_data.to_csv(csv_file, index=False, encoding='utf-8-sig')
+            excel_file = os.path.join(output_dir, f"{self.config.output_prefix}_Complete_{version}_Complete.xlsx")
+            parquet_file = os.path.join(output_dir, f"{self.config.output_prefix}_Complete_{version}_Complete.parquet")
+
+            # 이전 실행과 결과가 같으면 (digest sidecar 일치 + CSV/Excel 존재) 결과 파일 재작성 생략
+            digest = frame_digest(self.month_data)
+            digest_file = f"{csv_file}.digest"
+            outputs_unchanged = False
+            if digest is not None and os.path.exists(csv_file) and os.path.exists(excel_file):
+                try:
+                    with open(digest_file, 'r', encoding='utf-8') as f:
+                        outputs_unchanged = f.read().strip() == digest
+                except OSError:
+                    outputs_unchanged = False
+            if not outputs_unchanged:
+                # 쓰는 도중 중단되면 이전 digest 가 새 파일과 맞지 않으므로 먼저 제거
+                try:
+                    os.remove(digest_file)
+                except OSError:
+                    pass
+
+            # 결과 파일은 임시 경로에 쓴 뒤 os.replace (중단 시 반쯤 쓰인 CSV/Excel 남지 않음)
+            tmp_suffix = f".{os.getpid()}.tmp"
+            csv_tmp = csv_file + tmp_suffix
+            excel_tmp = excel_file + tmp_suffix
+
+            # CSV / Excel / Parquet(pyarrow 설치 시) / 메타data (condition 충족 상세 정보) / Building Review Analysis JSON (Issue #46-B)
+            # 모두 month_data를 읽기만 하는 독립적인 파일 I/O → thread pool에서 동시 저장
+            parquet_saved = False
+            try:
+                with ThreadPoolExecutor(max_workers=5) as executor:
+                    if not outputs_unchanged:
+                        csv_future = executor.submit(write_result_csv, self.month_data, csv_tmp)
+                        excel_future = executor.submit(write_excel_fast, self.month_data, excel_tmp)
+                        parquet_future = executor.submit(write_parquet_fast, self.month_data, parquet_file)
+                    metadata_future = executor.submit(self.save_calculation_metadata, output_dir)
+                    building_review_future = executor.submit(self.generate_building_review_analysis, output_dir)
+
+                    if not outputs_unchanged:
+                        csv_future.result()
+                        os.replace(csv_tmp, csv_file)
+                        excel_future.result()
+                        os.replace(excel_tmp, excel_file)
+                        parquet_saved = parquet_future.result()
+                    metadata_file = metadata_future.result()
+                    building_review_future.result()
+            finally:
+                # 저장 실패 시 남은 임시 파일 정리 (executor 종료 = 모든 writer 완료 후)
+                for tmp_path in (csv_tmp, excel_tmp):
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+
+            if outputs_unchanged:
+                print(f"♻️ 결과 변경 없음 - 기존 CSV/Excel 유지: {csv_file}")
+            elif digest is not None:
+                with open(digest_file, 'w', encoding='utf-8') as f:
+                    f.write(digest)
 
             # CSV file created validation
             if os.path.exists(csv_file) and os.path.getsize(csv_file) > 0:
@@ -6512,32 +7015,23 @@ class CompleteQIPCalculator:
             else:
                 print(f"⚠️ CSV file created failure: {csv_file}")
 
-            # Excel saved
-            excel_file = os.path.join(output_dir, f"{self.config.output_prefix}_Complete_{version}_Complete.xlsx")
-            self.month_data.to_excel(excel_file, index=False)
-            
             # Excel file created validation
             if os.path.exists(excel_file) and os.path.getsize(excel_file) > 0:
                 print(f"✅ Excel file 저장 완료: {excel_file}")
             else:
                 print(f"⚠️ Excel file created failure: {excel_file}")
-            
-            # 메타data saved (condition 충족 상세 정보)
-            metadata_file = self.save_calculation_metadata(output_dir)
+
+            if parquet_saved:
+                print(f"✅ Parquet file 저장 완료: {parquet_file}")
+
             if metadata_file:
                 print(f"✅ 메타data file 저장 완료: {metadata_file}")
             
-            # HTML report created (비활성화 - dashboard_version4.htmlonly 사용)
-            # html_file = self.generate_html_report()
-            # if html_file:
-            #     print(f"✅ HTML report 생성 완료: {html_file}")
-            print("ℹ️ HTML Report created casesskip (dashboard_version4.htmlonly 사용)")
-            
-            # next month 계산용 파일 자동 created
-            self.prepare_next_month_file(csv_file)
+            # HTML report는 저장 경로에서 생성하지 않음 (dashboard_version4.html만 사용)
+            # 필요 시 generate_html_report()를 별도로 호출
 
-            # Building Review Analysis JSON 생성 (Issue #46-B)
-            self.generate_building_review_analysis(output_dir)
+            # next month 계산용 파일 자동 created (CSV 저장 완료 후)
+            self.prepare_next_month_file(csv_file)
 
             return True
         except Exception as e:
@@ -6569,111 +7063,106 @@ class CompleteQIPCalculator:
                 'direct boss name', 'Direct Boss Name', 'DIRECT BOSS NAME'
             ])
 
-            # 결과 저장용
-            building_boss_mismatch = []
-            boss_no_info = []
-            data_source_mismatch = []
+            df = self.month_data
 
-            # 정규화 함수: A2→A, B2→B (첫 글자만 추출)
-            def normalize_building(bldg):
-                if pd.isna(bldg) or str(bldg).strip() in ['', 'nan', 'NaN', 'None', 'N/A']:
-                    return None
-                return str(bldg)[0].upper()
+            def _column(col, default=''):
+                if col in df.columns:
+                    return df[col]
+                return pd.Series(default, index=df.index, dtype=object)
 
-            # 직원별 Building 정보 매핑 (emp_no → building)
-            building_map = {}
-            for _, row in self.month_data.iterrows():
-                emp_no = row.get('Employee No')
-                bldg = row.get('BUILDING', '')
-                if pd.notna(emp_no) and bldg and str(bldg).strip() not in ['', 'nan', 'NaN', 'None']:
-                    building_map[emp_no] = str(bldg).strip()
+            # 정규화 함수: A2→A, B2→B (첫 글자만 추출), 빈 값/N/A는 NaN
+            def _normalize_building(cleaned):
+                return cleaned.str[0].str.upper().where(~cleaned.isin(['', 'N/A']))
 
-            for idx, row in self.month_data.iterrows():
-                emp_no = row.get('Employee No')
-                emp_name = row.get('Full Name', 'Unknown')
-                emp_building = row.get('BUILDING', '')
-                position = row.get('QIP POSITION 1ST  NAME', row.get('Position', ''))
-
-                # 빈 문자열 정리
-                emp_building = '' if str(emp_building).strip() in ['', 'nan', 'NaN', 'None'] else str(emp_building).strip()
-
-                # 퇴사자 필터링
-                stop_date_str = row.get('Stop working Date')
-                if pd.notna(stop_date_str):
-                    try:
-                        stop_date = pd.to_datetime(stop_date_str)
-                        if stop_date < calc_month_start:
-                            continue  # 퇴사자 제외
-                    except (ValueError, TypeError):
-                        pass
-
-                # 1. Building-Boss 불일치 및 2. 상사 정보없음 분석
-                if boss_col and emp_building:
-                    boss_name = row.get(boss_col)
-                    if pd.notna(boss_name) and str(boss_name).strip():
-                        boss_name = str(boss_name).strip()
-                        # 상사의 Building 찾기
-                        boss_data = self.month_data[
-                            self.month_data['Full Name'] == boss_name
-                        ]
+            def _is_resigned(stop_value):
+                try:
+                    return pd.to_datetime(stop_value) < calc_month_start
+                except (ValueError, TypeError):
+                    return False
 
-                        if not boss_data.empty:
-                            boss_row = boss_data.iloc[0]
-                            boss_id = boss_row.get('Employee No', '')
-                            boss_building = boss_row.get('BUILDING', '')
-                            boss_position = boss_row.get('QIP POSITION 1ST  NAME', boss_row.get('Position', ''))
-                            boss_building = '' if str(boss_building).strip() in ['', 'nan', 'NaN', 'None'] else str(boss_building).strip()
-
-                            if boss_building:
-                                # 정규화하여 비교 (A2 vs A는 같음)
-                                emp_norm = normalize_building(emp_building)
-                                boss_norm = normalize_building(boss_building)
-
-                                if emp_norm and boss_norm and emp_norm != boss_norm:
-                                    # Case 1: Building-Boss 불일치
-                                    building_boss_mismatch.append({
-                                        'emp_no': str(emp_no),
-                                        'emp_name': emp_name,
-                                        'emp_building': emp_building,
-                                        'emp_position': str(position),
-                                        'boss_id': str(boss_id),
-                                        'boss_name': boss_name,
-                                        'boss_building': boss_building,
-                                        'boss_position': str(boss_position)
-                                    })
-                            else:
-                                # Case 2: 상사 정보없음
-                                boss_no_info.append({
-                                    'emp_no': str(emp_no),
-                                    'emp_name': emp_name,
-                                    'emp_building': emp_building,
-                                    'emp_position': str(position),
-                                    'boss_id': str(boss_id) if boss_id else '',
-                                    'boss_name': boss_name,
-                                    'boss_building': 'NaN',
-                                    'boss_position': str(boss_position) if boss_position else ''
-                                })
-
-                # 3. 데이터 소스 불일치 (HR vs AQL)
-                hr_building = row.get('BUILDING', '')
-                aql_building = row.get('AQL_BUILDING', '')
-
-                hr_building = '' if str(hr_building).strip() in ['', 'nan', 'NaN', 'None'] else str(hr_building).strip()
-                aql_building = '' if str(aql_building).strip() in ['', 'nan', 'NaN', 'None'] else str(aql_building).strip()
-
-                if hr_building and aql_building:
-                    hr_norm = normalize_building(hr_building)
-                    aql_norm = normalize_building(aql_building)
-
-                    if hr_norm and aql_norm and hr_norm != aql_norm:
-                        # 정규화 후에도 다르면 실제 불일치 (A2 vs A는 제외됨)
-                        data_source_mismatch.append({
-                            'emp_no': str(emp_no),
-                            'emp_name': emp_name,
-                            'emp_position': str(position),
-                            'hr_building': hr_building,
-                            'aql_building': aql_building
-                        })
+            # 직원 정보를 컬럼 단위로 정리 (iterrows 없이 전체 Series 연산)
+            position_col = next((c for c in ['QIP POSITION 1ST  NAME', 'Position'] if c in df.columns), None)
+            position_raw = _column(position_col) if position_col else _column('Position')
+            emp_building = self._clean_str_col(_column('BUILDING'))
+            aql_building = self._clean_str_col(_column('AQL_BUILDING'))
+            emp_norm = _normalize_building(emp_building)
+            aql_norm = _normalize_building(aql_building)
+
+            review_df = pd.DataFrame({
+                'emp_no': [str(v) for v in _column('Employee No', None).tolist()],
+                'emp_name': _column('Full Name', 'Unknown').tolist(),
+                'emp_building': emp_building.tolist(),
+                'emp_position': [str(v) for v in position_raw.tolist()],
+                'boss_id': '',
+                'boss_name': '',
+                'boss_building': '',
+                'boss_position': '',
+                'hr_building': emp_building.tolist(),
+                'aql_building': aql_building.tolist(),
+            }, index=df.index, dtype=object)
+
+            # 퇴사자 필터링 (고유 날짜 값만 파싱)
+            active = pd.Series(True, index=df.index)
+            if 'Stop working Date' in df.columns:
+                stop_dates = df['Stop working Date']
+                has_stop = stop_dates.notna()
+                resigned_values = [v for v in stop_dates[has_stop].unique() if _is_resigned(v)]
+                active &= ~(has_stop & stop_dates.isin(resigned_values))
+
+            # 1. Building-Boss 불일치 및 2. 상사 정보없음 분석
+            building_boss_mask = pd.Series(False, index=df.index)
+            boss_no_info_mask = pd.Series(False, index=df.index)
+            if boss_col:
+                boss_raw = df[boss_col]
+                boss_name = boss_raw.astype(str).str.strip()
+                has_boss = boss_raw.notna() & boss_name.notna() & boss_name.ne('')
+
+                # 상사의 Building 찾기: Full Name → (ID, Building, Position) hashmap
+                # 동명이인은 첫 번째 행 기준 (reversed zip으로 첫 값 유지)
+                full_names = list(reversed(df['Full Name'].tolist()))
+                boss_id_by_name = dict(zip(full_names, reversed(_column('Employee No').tolist())))
+                boss_building_by_name = dict(zip(full_names, reversed(emp_building.tolist())))
+                boss_position_by_name = dict(zip(full_names, reversed(position_raw.tolist())))
+
+                boss_names = [name if ok else None for name, ok in zip(boss_name.tolist(), has_boss.tolist())]
+                boss_found = pd.Series([name in boss_id_by_name for name in boss_names], index=df.index) & has_boss
+
+                review_df['boss_name'] = [name if name in boss_id_by_name else '' for name in boss_names]
+                review_df['boss_id'] = [boss_id_by_name.get(name, '') for name in boss_names]
+                review_df['boss_building'] = [boss_building_by_name.get(name, '') for name in boss_names]
+                review_df['boss_position'] = [boss_position_by_name.get(name, '') for name in boss_names]
+
+                boss_candidates = active & emp_building.ne('') & boss_found
+                boss_has_building = review_df['boss_building'].ne('')
+                boss_norm = _normalize_building(review_df['boss_building'].astype(str))
+                # 정규화하여 비교 (A2 vs A는 같음)
+                building_boss_mask = (boss_candidates & boss_has_building
+                                      & emp_norm.notna() & boss_norm.notna() & emp_norm.ne(boss_norm))
+                boss_no_info_mask = boss_candidates & ~boss_has_building
+
+            boss_columns = ['emp_no', 'emp_name', 'emp_building', 'emp_position',
+                            'boss_id', 'boss_name', 'boss_building', 'boss_position']
+
+            # Case 1: Building-Boss 불일치
+            case_rows = review_df.loc[building_boss_mask, boss_columns].copy()
+            case_rows['boss_id'] = case_rows['boss_id'].map(str)
+            case_rows['boss_position'] = case_rows['boss_position'].map(str)
+            building_boss_mismatch = case_rows.to_dict(orient='records')
+
+            # Case 2: 상사 정보없음
+            case_rows = review_df.loc[boss_no_info_mask, boss_columns].copy()
+            case_rows['boss_id'] = case_rows['boss_id'].map(lambda v: str(v) if v else '')
+            case_rows['boss_building'] = 'NaN'
+            case_rows['boss_position'] = case_rows['boss_position'].map(lambda v: str(v) if v else '')
+            boss_no_info = case_rows.to_dict(orient='records')
+
+            # 3. 데이터 소스 불일치 (HR vs AQL)
+            # 정규화 후에도 다르면 실제 불일치 (A2 vs A는 제외됨)
+            data_source_mask = (active & emp_building.ne('') & aql_building.ne('')
+                                & emp_norm.notna() & aql_norm.notna() & emp_norm.ne(aql_norm))
+            data_source_mismatch = review_df.loc[
+                data_source_mask, ['emp_no', 'emp_name', 'emp_position', 'hr_building', 'aql_building']
+            ].to_dict(orient='records')
 
             # JSON 구조 생성
             review_data = {
@@ -6692,8 +7181,7 @@ class CompleteQIPCalculator:
 
             # JSON 파일 저장
             json_path = os.path.join(output_dir, 'building_review_analysis.json')
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(review_data, f, ensure_ascii=False, indent=2)
+            write_json_file(review_data, json_path)
 
             print(f"  ✅ Building Review Analysis 저장 완료: {json_path}")
             print(f"     - Building-Boss 불일치: {len(building_boss_mismatch)}건")
@@ -6715,87 +7203,153 @@ class CompleteQIPCalculator:
             import os
             
             metadata = {}
-            incentive_col = f"{self.config.get_month_str('capital')}_Incentive"
-            
-            for _, row in self.month_data.iterrows():
-                emp_id = str(row['Employee No'])
-                amount = row[incentive_col] if pd.notna(row[incentive_col]) else 0
-                
+            df = self.month_data
+            n_rows = len(df)
+            # loop 불변값은 1회만 계산 (month 문자열, 컬럼명, reject rate 캐시)
+            _month_cap = self.config.get_month_str('capital')
+            incentive_col = f"{_month_cap}_Incentive"
+            aql_col = f'{_month_cap} AQL Failures'
+            _model_master_reject_rate = getattr(self, 'model_master_reject_rate', 0.0)
+            _auditor_area_reject_rates = getattr(self, 'auditor_area_reject_rates', {})
+
+            # [Issue #58] Config 기반 threshold 사용
+            _meta_thresholds = self.config.thresholds or {}
+            _meta_att = _meta_thresholds.get('attendance_rate', 88)
+            _meta_abs = _meta_thresholds.get('unapproved_absence', 2)
+            _meta_min = _meta_thresholds.get('minimum_working_days', 12)
+            _meta_rej = _meta_thresholds.get('area_reject_rate', 3.0)
+            _meta_prs_rate = _meta_thresholds.get('5prs_pass_rate', 95)
+            _meta_prs_qty = _meta_thresholds.get('5prs_min_qty', 100)
+
+            # 조건별 passed/value를 컬럼 단위로 1회 계산 (행별 row.get/pd.notna 반복 제거)
+            # 컬럼 없음/NaN → 기존 row.get 기본값과 동일하게 처리, tolist()로 Python 기본 타입 유지
+            def _passed(col, compare, default):
+                if col not in df.columns:
+                    return [default] * n_rows
+                values = df[col]
+                return compare(values).where(values.notna(), default).astype(bool).tolist()
+
+            def _int_value(col):
+                if col not in df.columns:
+                    return [0] * n_rows
+                return df[col].fillna(0).astype('int64').tolist()
+
+            def _float_array(col):
+                if col not in df.columns:
+                    return np.full(n_rows, np.nan)
+                return df[col].to_numpy(dtype=float, na_value=np.nan)
+
+            # attendance 4개 condition passed 여부는 (N, 4) bool 행렬로 1회 계산
+            attendance_flags = _attendance_flag_matrix(
+                _float_array('결근율_Absence_Rate_Percent'), _float_array('Unapproved Absences'),
+                _float_array('Actual Working Days'), _meta_att, _meta_abs, _meta_min)
+            attendance_passed, unapproved_passed, working_days_passed, minimum_days_passed = (
+                attendance_flags[:, k].tolist() for k in range(4))
+
+            absence_rate = df['결근율_Absence_Rate_Percent'] if '결근율_Absence_Rate_Percent' in df.columns else None
+            attendance_value = ((100 - absence_rate).astype(object).where(absence_rate.notna(), 100).tolist()
+                                if absence_rate is not None else [100] * n_rows)
+            unapproved_value = _int_value('Unapproved Absences')
+            working_days_value = _int_value('Actual Working Days')
+            prs_volume_passed = _passed('Total Valiation Qty', lambda v: v >= _meta_prs_qty, False)
+            prs_volume_value = _int_value('Total Valiation Qty')
+            prs_rate_passed = _passed('Pass %', lambda v: v >= _meta_prs_rate, False)
+            prs_rate_value = (df['Pass %'].astype(float).astype(object).where(df['Pass %'].notna(), 0).tolist()
+                              if 'Pass %' in df.columns else [0] * n_rows)
+
+            aql_fail_passed = _passed(aql_col, lambda v: v == 0, True)
+            aql_fail_value = _int_value(aql_col)
+            # [Issue #48 근본 해결] startswith('YES')로 변경 - 'YES', 'YES_3MONTHS' 모두 처리
+            continuous_passed = _passed('Continuous_FAIL', lambda v: ~v.astype(str).str.startswith('YES'), True)
+            continuous_value = (df['Continuous_FAIL'].tolist()
+                                if 'Continuous_FAIL' in df.columns else ['NO'] * n_rows)
+
+            emp_ids = [str(v) for v in df['Employee No'].tolist()]
+            amounts = df[incentive_col].fillna(0).astype(float).tolist()
+            names = df['Full Name'].tolist()
+
+            # Position column same적 processing
+            position_col = next((c for c in ['QIP POSITION 1ST  NAME', 'Position', 'POSITION'] if c in df.columns), None)
+
+            # position/TYPE은 종류가 적으므로 고유 값(dictionary)별로 1회만 문자열 처리 후 code로 조회
+            if position_col:
+                position_codes, position_uniques = pd.factorize(df[position_col])
+                position_strs = [str(v) for v in position_uniques] + ['nan']  # code -1 (NaN) → 'nan'
+                position_str_list = [position_strs[c] for c in position_codes.tolist()]
+            else:
+                position_str_list = [''] * n_rows
+            position_upper_by_str = {p: p.upper() for p in set(position_str_list)}
+            role_type = df['ROLE TYPE STD']
+            role_types = role_type.tolist()
+            position_values = df[position_col].tolist() if position_col else [''] * n_rows
+            is_type1 = role_type.eq('TYPE-1').tolist()
+            is_type1_or_2 = role_type.isin(['TYPE-1', 'TYPE-2']).tolist()
+
+            # 행 단위 Series 생성 없이 위치(pos)로 미리 계산한 list 조회
+            for pos, emp_id in enumerate(emp_ids):
+                amount = amounts[pos]
+
                 # default 정보
-                # Position column same적 processing
-                position_value = ''
-                if 'QIP POSITION 1ST  NAME' in row.index:
-                    position_value = row['QIP POSITION 1ST  NAME']
-                elif 'Position' in row.index:
-                    position_value = row['Position']
-                elif 'POSITION' in row.index:
-                    position_value = row['POSITION']
-                
+                position_value = position_values[pos]
+                position_str = position_str_list[pos]
+                position_upper = position_upper_by_str[position_str]
+
                 emp_metadata = {
-                    'name': row['Full Name'],
+                    'name': names[pos],
                     'position': position_value,
-                    'type': row['ROLE TYPE STD'],
-                    'amount': float(amount),
+                    'type': role_types[pos],
+                    'amount': amount,
                     'calculation_basis': '',
                     'conditions': {}
                 }
                 
                 # condition 충족 정보 구성
                 # attendance condition
-                # [Issue #58] Config 기반 threshold 사용
-                _meta_thresholds = self.config.thresholds or {}
-                _meta_att = _meta_thresholds.get('attendance_rate', 88)
-                _meta_abs = _meta_thresholds.get('unapproved_absence', 2)
-                _meta_min = _meta_thresholds.get('minimum_working_days', 12)
-                _meta_rej = _meta_thresholds.get('area_reject_rate', 3.0)
-
                 emp_metadata['conditions']['attendance'] = {
                     '출근율_Attendance_Rate_Percent': {
-                        'passed': row.get('결근율_Absence_Rate_Percent', 0) <= (100 - _meta_att) if pd.notna(row.get('결근율_Absence_Rate_Percent')) else True,
-                        'value': 100 - row.get('결근율_Absence_Rate_Percent', 0) if pd.notna(row.get('결근율_Absence_Rate_Percent')) else 100,
+                        'passed': attendance_passed[pos],
+                        'value': attendance_value[pos],
                         'threshold': _meta_att,
                         'applicable': True
                     },
                     'unapproved_absence': {
-                        'passed': row.get('Unapproved Absences', 0) <= _meta_abs if pd.notna(row.get('Unapproved Absences')) else True,
-                        'value': int(row.get('Unapproved Absences', 0)) if pd.notna(row.get('Unapproved Absences')) else 0,
+                        'passed': unapproved_passed[pos],
+                        'value': unapproved_value[pos],
                         'threshold': _meta_abs,
                         'applicable': True
                     },
                     'working_days': {
-                        'passed': row.get('Actual Working Days', 0) > 0 if pd.notna(row.get('Actual Working Days')) else False,
-                        'value': int(row.get('Actual Working Days', 0)) if pd.notna(row.get('Actual Working Days')) else 0,
+                        'passed': working_days_passed[pos],
+                        'value': working_days_value[pos],
                         'threshold': 1,
                         'applicable': True
                     },
                     'minimum_days': {
-                        'passed': row.get('Actual Working Days', 0) >= _meta_min if pd.notna(row.get('Actual Working Days')) else False,
-                        'value': int(row.get('Actual Working Days', 0)) if pd.notna(row.get('Actual Working Days')) else 0,
+                        'passed': minimum_days_passed[pos],
+                        'value': working_days_value[pos],
                         'threshold': _meta_min,
                         'applicable': True
                     }
                 }
                 
                 # AQL condition (TYPE-1only)
-                if row['ROLE TYPE STD'] == 'TYPE-1':
+                if is_type1[pos]:
                     # MODEL MASTER 특별 processing
-                    if 'MODEL MASTER' in str(position_value).upper():
+                    if 'MODEL MASTER' in position_upper:
                         # Model Master 전체 factory reject율 사용
-                        area_reject_rate = 0.0
-                        if hasattr(self, 'model_master_reject_rate'):
-                            area_reject_rate = self.model_master_reject_rate
+                        area_reject_rate = _model_master_reject_rate
                         
                         emp_metadata['conditions']['aql'] = {
                             'monthly_failure': {
-                                'passed': row.get(f'{self.config.get_month_str("capital")} AQL Failures', 0) == 0 if pd.notna(row.get(f'{self.config.get_month_str("capital")} AQL Failures')) else True,
-                                'value': int(row.get(f'{self.config.get_month_str("capital")} AQL Failures', 0)) if pd.notna(row.get(f'{self.config.get_month_str("capital")} AQL Failures')) else 0,
+                                'passed': aql_fail_passed[pos],
+                                'value': aql_fail_value[pos],
                                 'threshold': 0,
                                 'applicable': False  # Model Master items인 AQL 체크 안함
                             },
                             '3월_continuous': {
                                 # [Issue #48 근본 해결] startswith('YES')로 변경 - 'YES', 'YES_3MONTHS' 모두 처리
-                                'passed': not str(row.get('Continuous_FAIL', 'NO')).startswith('YES') if pd.notna(row.get('Continuous_FAIL')) else True,
-                                'value': row.get('Continuous_FAIL', 'NO'),
+                                'passed': continuous_passed[pos],
+                                'value': continuous_value[pos],
                                 'threshold': 'NO',
                                 'applicable': True
                             },
@@ -6821,26 +7375,22 @@ class CompleteQIPCalculator:
                         else:
                             emp_metadata['calculation_basis'] = 'Model Master incentive'
                     # AUDIT & TRAINING TEAM 특별 processing
-                    elif 'AUDIT' in str(position_value).upper() or 'TRAINING' in str(position_value).upper():
+                    elif 'AUDIT' in position_upper or 'TRAINING' in position_upper:
                         # in charge area reject율 calculation
-                        emp_id_str = str(row['Employee No'])
-                        area_reject_rate = 0.0
-                        
                         # in charge area reject율 져오기 (미 calculationdone value 참조해야 함)
-                        if hasattr(self, 'auditor_area_reject_rates') and emp_id_str in self.auditor_area_reject_rates:
-                            area_reject_rate = self.auditor_area_reject_rates[emp_id_str]
+                        area_reject_rate = _auditor_area_reject_rates.get(emp_id, 0.0)
                         
                         emp_metadata['conditions']['aql'] = {
                             'monthly_failure': {
-                                'passed': row.get(f'{self.config.get_month_str("capital")} AQL Failures', 0) == 0 if pd.notna(row.get(f'{self.config.get_month_str("capital")} AQL Failures')) else True,
-                                'value': int(row.get(f'{self.config.get_month_str("capital")} AQL Failures', 0)) if pd.notna(row.get(f'{self.config.get_month_str("capital")} AQL Failures')) else 0,
+                                'passed': aql_fail_passed[pos],
+                                'value': aql_fail_value[pos],
                                 'threshold': 0,
                                 'applicable': True
                             },
                             '3월_continuous': {
                                 # [Issue #48 근본 해결] startswith('YES')로 변경 - 'YES', 'YES_3MONTHS' 모두 처리
-                                'passed': not str(row.get('Continuous_FAIL', 'NO')).startswith('YES') if pd.notna(row.get('Continuous_FAIL')) else True,
-                                'value': row.get('Continuous_FAIL', 'NO'),
+                                'passed': continuous_passed[pos],
+                                'value': continuous_value[pos],
                                 'threshold': 'NO',
                                 'applicable': True
                             },
@@ -6866,12 +7416,11 @@ class CompleteQIPCalculator:
                         else:
                             emp_metadata['calculation_basis'] = 'Auditor/Trainer incentive'
                     # AQL INSPECTOR 특별 processing
-                    elif 'AQL INSPECTOR' in str(position_value):
-                        aql_col = f'{self.config.get_month_str("capital")} AQL Failures'
+                    elif 'AQL INSPECTOR' in position_str:
                         emp_metadata['conditions']['aql'] = {
                             'monthly_failure': {
                                 'passed': amount > 0,  # incentive 받았으면 passedwith 간주
-                                'value': 0 if amount > 0 else int(row.get(aql_col, 0)) if pd.notna(row.get(aql_col)) else 0,
+                                'value': 0 if amount > 0 else aql_fail_value[pos],
                                 'threshold': 0,
                                 'applicable': True
                             },
@@ -6881,18 +7430,17 @@ class CompleteQIPCalculator:
                         }
                         emp_metadata['calculation_basis'] = 'AQL Inspector 3-part incentive'
                     else:
-                        aql_col = f'{self.config.get_month_str("capital")} AQL Failures'
                         emp_metadata['conditions']['aql'] = {
                             'monthly_failure': {
-                                'passed': row.get(aql_col, 0) == 0 if pd.notna(row.get(aql_col)) else True,
-                                'value': int(row.get(aql_col, 0)) if pd.notna(row.get(aql_col)) else 0,
+                                'passed': aql_fail_passed[pos],
+                                'value': aql_fail_value[pos],
                                 'threshold': 0,
                                 'applicable': True
                             },
                             '3월_continuous': {
                                 # [Issue #48 근본 해결] startswith('YES')로 변경 - 'YES', 'YES_3MONTHS' 모두 처리
-                                'passed': not str(row.get('Continuous_FAIL', 'NO')).startswith('YES') if pd.notna(row.get('Continuous_FAIL')) else True,
-                                'value': row.get('Continuous_FAIL', 'NO'),
+                                'passed': continuous_passed[pos],
+                                'value': continuous_value[pos],
                                 'threshold': 'NO',
                                 'applicable': True
                             }
@@ -6900,19 +7448,17 @@ class CompleteQIPCalculator:
 
                 # 5PRS conditions (TYPE-1, TYPE-2  days부)
                 # [Issue #58] Config 기반 5PRS threshold 사용
-                _meta_prs_rate = _meta_thresholds.get('5prs_pass_rate', 95)
-                _meta_prs_qty = _meta_thresholds.get('5prs_min_qty', 100)
-                if row['ROLE TYPE STD'] in ['TYPE-1', 'TYPE-2'] and 'AQL INSPECTOR' not in str(position_value):
+                if is_type1_or_2[pos] and 'AQL INSPECTOR' not in position_str:
                     emp_metadata['conditions']['5prs'] = {
                         'volume': {
-                            'passed': row.get('Total Valiation Qty', 0) >= _meta_prs_qty if pd.notna(row.get('Total Valiation Qty')) else False,
-                            'value': int(row.get('Total Valiation Qty', 0)) if pd.notna(row.get('Total Valiation Qty')) else 0,
+                            'passed': prs_volume_passed[pos],
+                            'value': prs_volume_value[pos],
                             'threshold': _meta_prs_qty,
                             'applicable': True
                         },
                         'pass_rate': {
-                            'passed': row.get('Pass %', 0) >= _meta_prs_rate if pd.notna(row.get('Pass %')) else False,
-                            'value': float(row.get('Pass %', 0)) if pd.notna(row.get('Pass %')) else 0,
+                            'passed': prs_rate_passed[pos],
+                            'value': prs_rate_value[pos],
                             'threshold': _meta_prs_rate,
                             'applicable': True
                         }
@@ -6924,8 +7470,7 @@ class CompleteQIPCalculator:
             
             # JSON filewith saved
             metadata_file = os.path.join(output_dir, f"{self.config.output_prefix}_metadata.json")
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+            write_json_file(metadata, metadata_file)
             
             # file created validation
             if os.path.exists(metadata_file) and os.path.getsize(metadata_file) > 0:
@@ -6940,30 +7485,47 @@ class CompleteQIPCalculator:
             traceback.print_exc()
             return None
     
+    def _ensure_output_dir(self) -> str:
+        """output_files 폴더 created (report 반복 생성 시에도 makedirs 는 1회)"""
+        output_dir = getattr(self, 'output_dir', "output_files")
+        if not getattr(self, '_output_dir_ready', False):
+            os.makedirs(output_dir, exist_ok=True)
+            self._output_dir_ready = True
+        return output_dir
+
+    def _submit_background_io(self, fn, *args):
+        """파일 복사 등 I/O 작업을 백그라운드 thread로 제출 (main thread는 다음 단계 진행)"""
+        if getattr(self, '_io_pool', None) is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=2)
+            self._io_futures = []
+        future = self._io_pool.submit(fn, *args)
+        self._io_futures.append(future)
+        return future
+
+    def wait_for_background_io(self):
+        """백그라운드 I/O 작업 완료 대기 - 실패 시 경고만 출력"""
+        pool = getattr(self, '_io_pool', None)
+        if pool is None:
+            return
+        for future in self._io_futures:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"  ⚠️ 백그라운드 파일 작업 failure: {e}")
+                print(f"     수samewith fileemployees 변경해주세요.")
+        pool.shutdown(wait=True)
+        self._io_pool = None
+        self._io_futures = []
+
     def prepare_next_month_file(self, csv_file_path):
         """next month 계산용 파일 자동 created (month 자same 순환 include)"""
         try:
-            import shutil
             import os
             from datetime import datetime
             
-            # month 름 mapping
-            month_korean = {
-                'january': '1월', 'february': '2월', 'march': '3월',
-                'april': '4월', 'may': '5월', 'june': '6월',
-                'july': 'July', 'august': 'August', 'september': 'September',
-                'october': 'October', 'november': 'November', 'december': 'December'
-            }
-            
-            # month 순서 mapping (자same 순환용)
-            month_order = [
-                'january', 'february', 'march', 'april', 'may', 'june',
-                'july', 'august', 'september', 'october', 'november', 'december'
-            ]
-            
-            # current month 인덱스 찾기
+            # current month 인덱스 찾기 (MONTH_INDEX dict 조회)
             current_month_name = self.config.month.full_name.lower()
-            current_month_index = month_order.index(current_month_name)
+            current_month_index = MONTH_INDEX[current_month_name]
             current_year = self.config.year
             
             # next month calculation (December → 1월 자same processing)
@@ -6975,11 +7537,11 @@ class CompleteQIPCalculator:
                 next_month_index = current_month_index + 1
                 next_year = current_year
             
-            next_month_name = month_order[next_month_index]
-            next_korean_month = month_korean[next_month_name]
+            next_month_name = MONTH_ORDER[next_month_index]
+            next_korean_month = MONTH_KOREAN[next_month_name]
             
             # current monthof 한글 름 (saved용)
-            current_korean_month = month_korean.get(current_month_name, self.config.month.korean_name)
+            current_korean_month = MONTH_KOREAN.get(current_month_name, self.config.month.korean_name)
             
             # input_files 폴더 created
             os.makedirs("input_files", exist_ok=True)
@@ -6988,14 +7550,20 @@ class CompleteQIPCalculator:
             # current month file (previous month datawith 사용될 file)
             target_file = f"input_files/{current_year}year {current_korean_month} incentive 지급 세부 정보.csv"
             
-            # existing file 백업
+            # existing file 백업 (같은 파일시스템이면 하드링크 - 데이터 복사 없음)
+            backup_file = None
             if os.path.exists(target_file):
                 backup_file = f"input_files/backup/{current_year}year {current_korean_month} incentive 지급 세부 정보_backup.csv"
-                shutil.copy2(target_file, backup_file)
                 print(f"  📦 existing file 백업: {backup_file}")
-            
-            # file 복사
-            shutil.copy2(csv_file_path, target_file)
+
+            def _copy_files():
+                if backup_file:
+                    fast_copy_file(target_file, backup_file, allow_link=True)
+                # file 복사 (새 inode로 교체되므로 하드링크 백업은 그대로 유지)
+                fast_copy_file(csv_file_path, target_file)
+
+            # 백업 → 복사 순서 유지한 채 백그라운드 thread에서 실행 (wait_for_background_io에서 완료 확인)
+            self._submit_background_io(_copy_files)
             print(f"\n🎯 next month 계산용 파일 자동 created:")
             print(f"  → {target_file}")
             print(f"  ℹ️ {next_year}year {next_korean_month} calculation 시 파일 자동with 사용됩니다.")
@@ -7016,8 +7584,28 @@ class CompleteQIPCalculator:
             print(f"  ⚠️ next month 파일 자동 created failure: {e}")
             print(f"     수samewith fileemployees 변경해주세요.")
     
+    @staticmethod
+    def _shrink_report_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """리포트용 DataFrame의 저카디널리티 문자열 컬럼을 category로 변환
+
+        ROLE TYPE STD / QIP POSITION 1ST  NAME / Continuous_FAIL / cond_* 는 값 종류가
+        수십 개 이하 - category로 바꾸면 메모리가 줄고 groupby/비교가 code 기반으로 처리된다.
+        (self.month_data 자체는 변경하지 않음 - 이후 단계에서 새 값이 대입될 수 있음)
+        """
+        shrink_cols = [
+            col for col in df.columns
+            if (col in ('ROLE TYPE STD', 'QIP POSITION 1ST  NAME', 'Continuous_FAIL')
+                or (isinstance(col, str) and col.startswith('cond_')))
+            and (df[col].dtype == object or pd.api.types.is_string_dtype(df[col].dtype))
+            and not isinstance(df[col].dtype, pd.CategoricalDtype)
+        ]
+        if shrink_cols:
+            df = df.astype({col: 'category' for col in shrink_cols})
+        return df
+
     def generate_html_report(self) -> Optional[str]:
         """HTML report created (improved 버전)"""
+        tmp_html_filename = None
         try:
             month_str = self.config.get_month_str('capital')
             month_kr = self.config.get_month_str('korean')
@@ -7039,14 +7627,12 @@ class CompleteQIPCalculator:
                             prev_incentive_data = pd.read_csv(prev_file_path, encoding='utf-8-sig')
                             print(f"  ✅ {prev_month.korean_name} incentive data loaded successfully")
                             
-                            # employee번호with 6월 incentive matching
-                            if 'June_Incentive' in prev_incentive_data.columns:
-                                prev_incentive_map = prev_incentive_data.set_index('Employee No')['June_Incentive'].to_dict()
-                                self.month_data['Previous_Incentive'] = self.month_data['Employee No'].map(prev_incentive_map).fillna(0)
-                            elif f'{prev_month.full_name.capitalize()}_Incentive' in prev_incentive_data.columns:
-                                col_name = f'{prev_month.full_name.capitalize()}_Incentive'
-                                prev_incentive_map = prev_incentive_data.set_index('Employee No')[col_name].to_dict()
-                                self.month_data['Previous_Incentive'] = self.month_data['Employee No'].map(prev_incentive_map).fillna(0)
+                            # employee번호with 6월 incentive matching (reindex 1회)
+                            col_name = next((c for c in ('June_Incentive', f'{prev_month.full_name.capitalize()}_Incentive')
+                                             if c in prev_incentive_data.columns), None)
+                            if col_name:
+                                self.month_data['Previous_Incentive'] = map_previous_incentive(
+                                    self.month_data['Employee No'], prev_incentive_data, col_name).to_numpy()
                             else:
                                 print(f"  ⚠️ {prev_month.korean_name} incentive column 찾 수 없습니다")
                                 self.month_data['Previous_Incentive'] = 0
@@ -7060,12 +7646,14 @@ class CompleteQIPCalculator:
                     self.month_data['Previous_Incentive'] = 0
             
             # 통계 계산 - Employee No 있 실제 employeeonly
-            valid_employees = self.month_data[self.month_data['Employee No'].notna()]
+            valid_employees = self._shrink_report_frame(self.month_data[self.month_data['Employee No'].notna()])
             
             # calculation month previous 퇴사자 exclude
             calc_month_start = pd.Timestamp(self.config.year, self.config.month.number, 1)
             if 'Stop working Date' in valid_employees.columns:
-                valid_employees['Stop working Date'] = pd.to_datetime(valid_employees['Stop working Date'], errors='coerce')
+                # 이미 datetime 컬럼이면 재파싱 생략
+                if not pd.api.types.is_datetime64_any_dtype(valid_employees['Stop working Date']):
+                    valid_employees['Stop working Date'] = pd.to_datetime(valid_employees['Stop working Date'], errors='coerce', cache=True)
                 active_employees = valid_employees[
                     (valid_employees['Stop working Date'].isna()) |  # 퇴사 days 없 employee
                     (valid_employees['Stop working Date'] >= calc_month_start)  # calculation month 후 퇴사자
@@ -7081,14 +7669,266 @@ class CompleteQIPCalculator:
             prev_incentive_col = 'Previous_Incentive' if 'Previous_Incentive' in valid_employees.columns else None
             prev_month_kr = self.config.previous_months[-1].korean_name if self.config.previous_months else "previousmonth"
             
-            # HTML 템플릿
-            html_content = f"""
+            def _pct(numerator, denominator):
+                """백분율 (분모 0이면 0.0 - 빈 데이터에서도 report 생성)"""
+                return numerator / denominator * 100 if denominator else 0.0
+
+            # file saved 경로
+            import os
+            output_dir = self._ensure_output_dir()
+            html_filename = os.path.join(output_dir, f"QIP_Incentive_Report_{month_str}_{self.config.year}.html")
+            tmp_html_filename = f"{html_filename}.tmp"
+
+            # HTML 템플릿 - 전체 문서를 메모리에 만들지 않고 fragment 단위로 파일에 바로 기록
+            # (임시 파일에 쓴 뒤 완료 시 교체 - 도중 오류 시 기존 report 유지)
+            # 수 MB 리포트 - 기본 8KB 대신 256KB 버퍼로 write syscall 수 감소
+            with open(tmp_html_filename, 'w', encoding='utf-8', buffering=256 * 1024) as buf:
+                buf.write(_HTML_REPORT_HEAD.format_map({
+                    'year': self.config.year,
+                    'month_kr': month_kr,
+                    'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'total_employees': total_employees,
+                    'receiving_employees': receiving_employees,
+                    'receiving_rate': _pct(receiving_employees, total_employees),
+                    'total_amount_m': total_amount / 1000000,
+                }))
+            
+                # Type별 data 추 (ROLE TYPE STD groupby 1회 - Type마다 전체 행 mask 생성 방지)
+                month_data_by_type = dict(list(self.month_data.groupby('ROLE TYPE STD', observed=True, sort=False)))
+                for role_type, type_class in [('TYPE-1', 'type-1'), ('TYPE-2', 'type-2'), ('TYPE-3', 'type-3')]:
+                    type_data = month_data_by_type.get(role_type)
+                    if type_data is not None and not type_data.empty:
+                        type_total = len(type_data)
+                        type_receiving = (type_data[incentive_col] > 0).sum()
+                        type_amount = type_data[incentive_col].sum()
+                        type_avg = type_data[type_data[incentive_col] > 0][incentive_col].mean() if type_receiving > 0 else 0
+                    
+                        buf.write(_HTML_TYPE_ROW.format(
+                            type_class=type_class, role_type=role_type, type_total=type_total,
+                            type_receiving=type_receiving, type_rate=_pct(type_receiving, type_total),
+                            type_amount=type_amount, type_avg=type_avg))
+            
+                buf.write(_HTML_POSITION_TAB_HEAD)
+            
+                # position별 상세 테블 추
+                valid_by_type = dict(list(valid_employees.groupby('ROLE TYPE STD', observed=True, sort=False)))
+                for role_type in ['TYPE-1', 'TYPE-2', 'TYPE-3']:
+                    type_data = valid_by_type.get(role_type)
+                    if type_data is not None and not type_data.empty:
+                        buf.write(_HTML_POSITION_TABLE_HEAD.format(role_type=role_type))
+                    
+                        position_col = 'QIP POSITION 1ST  NAME'
+                        if position_col in type_data.columns:
+                            # named aggregation (Python lambda 콜백 없이 groupby C 경로 사용)
+                            received = type_data[incentive_col] > 0
+                            positions = type_data.assign(
+                                _recv=received,
+                                _amt_pos=type_data[incentive_col].where(received)
+                            ).groupby(position_col, observed=True).agg(
+                                총VND=(incentive_col, 'count'),
+                                수령인VND=('_recv', 'sum'),
+                                총지급액=(incentive_col, 'sum'),
+                                평균지급액=('_amt_pos', 'mean'),
+                            ).fillna({'평균지급액': 0}).round(0)
+                            positions['미수령인VND'] = positions['총VND'] - positions['수령인VND']
+                            positions['수령률'] = (positions['수령인VND'] / positions['총VND'] * 100).round(1)
+                            positions = positions.sort_values('수령인VND', ascending=False)
+                        
+                            for position, row in positions.iterrows():
+                                if row['총VND'] > 0:
+                                    buf.write(_HTML_POSITION_ROW.format(
+                                        position=position, total=int(row['총VND']), received=int(row['수령인VND']),
+                                        not_received=int(row['미수령인VND']), rate=row['수령률'],
+                                        amount=row['총지급액'], average=row['평균지급액']))
+                    
+                        buf.write(_HTML_POSITION_TABLE_TAIL)
+            
+                buf.write(_HTML_DETAIL_TAB_HEAD.format(prev_month_kr=prev_month_kr, month_kr=month_kr))
+            
+                # items인별 상세 data 추
+                # 사유 판정용 값 사전 계산 (행마다 str().upper() / row.get() 반복 방지)
+                n_valid = len(valid_employees)
+                no_flags = np.zeros(n_valid, dtype=bool)
+
+                def _fail_flags(col, fail_value='FAIL'):
+                    if col in valid_employees.columns:
+                        return (valid_employees[col] == fail_value).to_numpy()
+                    return no_flags
+
+                if 'QIP POSITION 1ST  NAME' in valid_employees.columns:
+                    position_upper_arr = valid_employees['QIP POSITION 1ST  NAME'].astype(object).map(str).str.upper().to_numpy()
+                else:
+                    position_upper_arr = np.full(n_valid, '', dtype=object)
+                if 'Continuous_FAIL' in valid_employees.columns:
+                    # [Issue #48 근본 해결] startswith('YES') - 'YES', 'YES_3MONTHS' 모두 처리
+                    cont_fail_arr = valid_employees['Continuous_FAIL'].astype(object).map(str).str.startswith('YES').to_numpy(dtype=bool)
+                else:
+                    cont_fail_arr = no_flags
+                aql_fail_col = f"{month_str} AQL Failures"
+                if aql_fail_col in valid_employees.columns:
+                    aql_fail_arr = (valid_employees[aql_fail_col].fillna(0) > 0).to_numpy()
+                else:
+                    aql_fail_arr = no_flags
+                cond3_fail_arr = _fail_flags('cond_3_actual_working_days')
+                cond2_fail_arr = _fail_flags('cond_2_unapproved_absence')
+                cond1_fail_arr = _fail_flags('cond_1_attendance_rate')
+                prs_fail_arr = _fail_flags('5prs condition 1 - there is  enough 5 prs validation qty or pass rate is over 95%', 'no')
+
+                # 단일 사유 (수령자 / TYPE-3)는 np.select 1회로 결정 - 복수 사유 조합이 필요한 미수령자만 loop에서 처리
+                role_type_arr = valid_employees['ROLE TYPE STD'].to_numpy() if 'ROLE TYPE STD' in valid_employees.columns \
+                    else np.full(n_valid, '', dtype=object)
+                is_type1 = role_type_arr == 'TYPE-1'
+                is_type3 = role_type_arr == 'TYPE-3'
+                paid_arr = (valid_employees[incentive_col] > 0).to_numpy()
+                paid_type1 = paid_arr & is_type1
+                position_upper_s = pd.Series(position_upper_arr, dtype=object)
+                base_reason_arr = np.select(
+                    [
+                        paid_type1 & position_upper_s.str.contains('ASSEMBLY INSPECTOR', regex=False).to_numpy(dtype=bool),
+                        paid_type1 & position_upper_s.str.contains('LINE LEADER', regex=False).to_numpy(dtype=bool),
+                        paid_type1 & position_upper_s.str.contains('GROUP LEADER', regex=False).to_numpy(dtype=bool),
+                        paid_type1,
+                        paid_arr & (role_type_arr == 'TYPE-2'),
+                        is_type3,  # TYPE-3 항상 정책 exclude (수령 여부 무관)
+                    ],
+                    [
+                        "condition 충족 - consecutive month성",
+                        "부하employee incentive × 15%",
+                        "Line Leader 평균 × 2",
+                        "TYPE-1 basis 충족",
+                        "TYPE-1 평균 basis",
+                        "TYPE-3 정책 exclude",
+                    ],
+                    default="",
+                ).astype(object)
+                needs_detail_arr = ~paid_arr & ~is_type3
+
+                # type-badge CSS suffix ('TYPE-1' → '1', '-' 없으면 '0') - 고유 role type별 1회만 split
+                role_codes, role_uniques = pd.factorize(role_type_arr)
+                type_suffix_arr = np.array(
+                    [(v.split('-')[1] if '-' in v else '0') if isinstance(v, str) else '0' for v in role_uniques] + ['0'],
+                    dtype=object)[role_codes]
+
+                # 상사별 "부하 중 Continuous_FAIL YES 존재" 여부 - groupby 1회 (Line Leader마다 전체 scan 방지)
+                if 'MST direct boss name' in valid_employees.columns:
+                    fail_by_boss = pd.Series(cont_fail_arr, index=valid_employees.index).groupby(
+                        valid_employees['MST direct boss name'], sort=False).any().to_dict()
+                else:
+                    fail_by_boss = {}
+
+                # 행 값도 컬럼 배열로 꺼내 zip (iterrows의 행별 Series 생성 제거)
+                def _column_values(col, default):
+                    if col in valid_employees.columns:
+                        return valid_employees[col].to_numpy()
+                    return np.full(n_valid, default, dtype=object)
+
+                format_detail_row = _HTML_DETAIL_ROW.format
+                for (emp_no, name, position, role_type, type_suffix, prev_amount, curr_amount, position_upper, base_reason,
+                     needs_detail, cont_fail, aql_fail, cond3_fail, cond2_fail, cond1_fail, prs_fail) in zip(
+                        _column_values('Employee No', ''), _column_values('Full Name', ''),
+                        _column_values('QIP POSITION 1ST  NAME', ''), role_type_arr, type_suffix_arr,
+                        _column_values('Previous_Incentive', 0), _column_values(incentive_col, 0),
+                        position_upper_arr, base_reason_arr, needs_detail_arr,
+                        cont_fail_arr, aql_fail_arr, cond3_fail_arr, cond2_fail_arr, cond1_fail_arr, prs_fail_arr):
+                    diff = curr_amount - prev_amount
+                
+                    # calculation 근거 created (복수 사유 표시)
+                    if needs_detail:
+                        # 미수령 사유 - 복수 사유 수집
+                        reasons = []
+                    
+                        # attendance condition 체크
+                        if cond3_fail:
+                            reasons.append('실근무일=0')
+                        if cond2_fail:
+                            reasons.append('무단결근>2일')
+                        if cond1_fail:
+                            reasons.append('출근율<88%')  # Phase 1: Single Source of Truth
+                            reasons.append("absence rate >12%")
+                    
+                        # AQL condition 체크
+                        if cont_fail:
+                            reasons.append("3-month consecutive AQL failure")
+                        elif aql_fail:
+                            reasons.append("AQL failure")
+                    
+                        # 직책별 차별화done 체크
+                        # AUDITOR/TRAINER 5PRS 체크 exclude
+                        if 'AUDIT' not in position_upper and 'TRAINER' not in position_upper:
+                            # Assembly Inspectoronly 5PRS 체크
+                            if 'ASSEMBLY INSPECTOR' in position_upper:
+                                if prs_fail:
+                                    reasons.append("5PRS conditions 미month")
+                    
+                        # LINE LEADER special condition (JSON matrix based)
+                        if 'LINE LEADER' in position_upper and curr_amount == 0:
+                            # JSON matrixfrom configuration checking
+                            should_check_subordinates = False
+                            if POSITION_CONDITION_MATRIX:
+                                pos_config = cached_position_config('TYPE-1', position)
+                                if pos_config:
+                                    applicable_conditions = pos_config.get('applicable_conditions', [])
+                                    # condition 7: 팀/area AQL
+                                    if 7 in applicable_conditions:
+                                        should_check_subordinates = True
+                            else:
+                                # 폴백: existing with직
+                                should_check_subordinates = True
+                        
+                            if should_check_subordinates:
+                                # [Issue #48 근본 해결] startswith('YES') - 'YES', 'YES_3MONTHS' 모두 처리
+                                if fail_by_boss.get(emp_no, False):
+                                    reasons.append("부하employee 3-month consecutive AQL failure (condition 7 미충족)")
+                    
+                        # AUDITOR/TRAINER special condition
+                        if ('AUDIT' in position_upper or 'TRAINER' in position_upper) and curr_amount == 0:
+                            # in charge area related 체크only (미 5PRS excludedone)
+                            if not reasons:  # other 사유 없 경우toonly
+                                reasons.append("in charge area reject율 초and 또 3-month consecutive failures 발생")
+                
+                        # 사유 조합
+                        if reasons:
+                            if len(reasons) == 1:
+                                reason = reasons[0]
+                            else:
+                                # 주요 사유and 추 사유 구분
+                                reason = f"{reasons[0]} / 추: {', '.join(reasons[1:])}"
+                        else:
+                            reason = "condition 미충족"
+                    else:
+                        reason = base_reason
+                
+                    diff_color = 'green' if diff > 0 else 'red' if diff < 0 else 'black'
+                
+                    buf.write(format_detail_row(
+                        emp_no=emp_no, name=name, position=position,
+                        type_suffix=type_suffix, role_type=role_type,
+                        prev_amount=prev_amount, curr_amount=curr_amount,
+                        diff_color=diff_color, diff=diff, reason=reason))
+            
+                buf.write(_HTML_REPORT_TAIL)
+
+            os.replace(tmp_html_filename, html_filename)
+            
+            return html_filename
+        
+        except Exception as e:
+            print(f"❌ HTML report created in progress Error: {e}")
+            traceback.print_exc()
+            if tmp_html_filename and os.path.exists(tmp_html_filename):
+                os.remove(tmp_html_filename)
+            return None
+
+
+# HTML report 템플릿 (generate_html_report) - str.format placeholder, CSS/JS 중괄호는 {{ }}로 escape
+# 정적 텍스트를 모듈 상수로 분리 - 메서드에서는 값만 채운다
+_HTML_REPORT_HEAD = """
 <!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>QIP incentive 계산 결과 report - {self.config.year}year {month_kr}</title>
+    <title>QIP incentive 계산 결과 report - {year}year {month_kr}</title>
     <style>
         * {{
             margin: 0;
@@ -7366,7 +8206,7 @@ class CompleteQIPCalculator:
     <div class="container">
         <div class="header">
             <h1>QIP incentive 계산 결과</h1>
-            <p>{self.config.year}year {month_kr} | created days: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p>{year}year {month_kr} | created days: {created_at}</p>
         </div>
         
         <div class="content">
@@ -7381,11 +8221,11 @@ class CompleteQIPCalculator:
                 </div>
                 <div class="summary-card">
                     <h3>수령률</h3>
-                    <div class="value">{receiving_employees/total_employees*100:.1f}<span class="unit">%</span></div>
+                    <div class="value">{receiving_rate:.1f}<span class="unit">%</span></div>
                 </div>
                 <div class="summary-card">
                     <h3>총 지급액</h3>
-                    <div class="value">{total_amount/1000000:.1f}<span class="unit">M VND</span></div>
+                    <div class="value">{total_amount_m:.1f}<span class="unit">M VND</span></div>
                 </div>
             </div>
             
@@ -7413,29 +8253,18 @@ class CompleteQIPCalculator:
                         </tr>
                     </thead>
                     <tbody>"""
-            
-            # Type별 data 추
-            for role_type in ['TYPE-1', 'TYPE-2', 'TYPE-3']:
-                type_data = self.month_data[self.month_data['ROLE TYPE STD'] == role_type]
-                if not type_data.empty:
-                    type_total = len(type_data)
-                    type_receiving = (type_data[incentive_col] > 0).sum()
-                    type_amount = type_data[incentive_col].sum()
-                    type_avg = type_data[type_data[incentive_col] > 0][incentive_col].mean() if type_receiving > 0 else 0
-                    
-                    type_class = f"type-{role_type.split('-')[1]}"
-                    
-                    html_content += f"""
+
+_HTML_TYPE_ROW = """
                         <tr>
                             <td><span class="type-badge {type_class}">{role_type}</span></td>
                             <td>{type_total}명</td>
                             <td>{type_receiving}명</td>
-                            <td>{type_receiving/type_total*100:.1f}%</td>
+                            <td>{type_rate:.1f}%</td>
                             <td>{type_amount:,.0f} VND</td>
                             <td>{type_avg:,.0f} VND</td>
                         </tr>"""
-            
-            html_content += """
+
+_HTML_POSITION_TAB_HEAD = """
                     </tbody>
                 </table>
             </div>
@@ -7446,12 +8275,8 @@ class CompleteQIPCalculator:
     <div id="position" class="tab-content">
         <div class="section">
             <h2 class="section-title">position별 상세 현황</h2>"""
-            
-            # position별 상세 테블 추
-            for role_type in ['TYPE-1', 'TYPE-2', 'TYPE-3']:
-                type_data = valid_employees[valid_employees['ROLE TYPE STD'] == role_type]
-                if not type_data.empty:
-                    html_content += f"""
+
+_HTML_POSITION_TABLE_HEAD = """
             <h3 style="margin-top: 30px; color: #667eea;">{role_type} position별 통계</h3>
             <table>
                 <thead>
@@ -7466,36 +8291,23 @@ class CompleteQIPCalculator:
                     </tr>
                 </thead>
                 <tbody>"""
-                    
-                    position_col = 'QIP POSITION 1ST  NAME'
-                    if position_col in type_data.columns:
-                        positions = type_data.groupby(position_col).agg({
-                            incentive_col: ['count', lambda x: (x > 0).sum(), 'sum', 
-                                           lambda x: x[x > 0].mean() if (x > 0).sum() > 0 else 0]
-                        }).round(0)
-                        positions.columns = ['총VND', '수령인VND', '총지급액', '평균지급액']
-                        positions['미수령인VND'] = positions['총VND'] - positions['수령인VND']
-                        positions['수령률'] = (positions['수령인VND'] / positions['총VND'] * 100).round(1)
-                        positions = positions.sort_values('수령인VND', ascending=False)
-                        
-                        for position, row in positions.iterrows():
-                            if row['총VND'] > 0:
-                                html_content += f"""
+
+_HTML_POSITION_ROW = """
                     <tr>
                         <td>{position}</td>
-                        <td>{int(row['총VND'])}명</td>
-                        <td>{int(row['수령인VND'])}명</td>
-                        <td>{int(row['미수령인VND'])}명</td>
-                        <td>{row['수령률']}%</td>
-                        <td>{row['총지급액']:,.0f} VND</td>
-                        <td>{row['평균지급액']:,.0f} VND</td>
+                        <td>{total}명</td>
+                        <td>{received}명</td>
+                        <td>{not_received}명</td>
+                        <td>{rate}%</td>
+                        <td>{amount:,.0f} VND</td>
+                        <td>{average:,.0f} VND</td>
                     </tr>"""
-                    
-                    html_content += """
+
+_HTML_POSITION_TABLE_TAIL = """
                 </tbody>
             </table>"""
-            
-            html_content += f"""
+
+_HTML_DETAIL_TAB_HEAD = """
         </div>
     </div>
     
@@ -7534,120 +8346,20 @@ class CompleteQIPCalculator:
                         </tr>
                     </thead>
                     <tbody>"""
-            
-            # items인별 상세 data 추
-            for idx, row in valid_employees.iterrows():
-                emp_no = row.get('Employee No', '')
-                name = row.get('Full Name', '')
-                position = row.get('QIP POSITION 1ST  NAME', '')
-                role_type = row.get('ROLE TYPE STD', '')
-                prev_amount = row.get('Previous_Incentive', 0) if 'Previous_Incentive' in row else 0
-                curr_amount = row.get(incentive_col, 0)
-                diff = curr_amount - prev_amount
-                
-                # calculation 근거 created (복수 사유 표시)
-                reason = ""
-                if curr_amount > 0:
-                    if role_type == 'TYPE-1':
-                        if 'ASSEMBLY INSPECTOR' in str(position).upper():
-                            # consecutive months 수 찾기 (with그from 추출하거나 calculation)
-                            reason = f"condition 충족 - consecutive month성"
-                        elif 'LINE LEADER' in str(position).upper():
-                            reason = "부하employee incentive × 15%"
-                        elif 'GROUP LEADER' in str(position).upper():
-                            reason = "Line Leader 평균 × 2"
-                        else:
-                            reason = "TYPE-1 basis 충족"
-                    elif role_type == 'TYPE-2':
-                        reason = "TYPE-1 평균 basis"
-                    elif role_type == 'TYPE-3':
-                        reason = "TYPE-3 정책 exclude"
-                else:
-                    # 미수령 사유 - 복수 사유 수집
-                    reasons = []
-                    
-                    # TYPE-3 항상 정책 exclude
-                    if role_type == 'TYPE-3':
-                        reasons.append("TYPE-3 정책 exclude")
-                    else:
-                        # attendance condition 체크
-                        if row.get('cond_3_actual_working_days') == 'FAIL':
-                            reasons.append('실근무일=0')
-                        if row.get('cond_2_unapproved_absence') == 'FAIL':
-                            reasons.append('무단결근>2일')
-                        if row.get('cond_1_attendance_rate') == 'FAIL':
-                            reasons.append('출근율<88%')  # Phase 1: Single Source of Truth
-                            reasons.append("absence rate >12%")
-                        
-                        # AQL condition 체크
-                        # [Issue #48 근본 해결] startswith('YES')로 변경 - 'YES', 'YES_3MONTHS' 모두 처리
-                        if str(row.get('Continuous_FAIL', 'NO')).startswith('YES'):
-                            reasons.append("3-month consecutive AQL failure")
-                        elif row.get(f"{month_str} AQL Failures", 0) > 0:
-                            reasons.append("AQL failure")
-                        
-                        # 직책별 차별화done 체크
-                        position_upper = str(position).upper()
-                        
-                        # AUDITOR/TRAINER 5PRS 체크 exclude
-                        if 'AUDIT' not in position_upper and 'TRAINER' not in position_upper:
-                            # Assembly Inspectoronly 5PRS 체크
-                            if 'ASSEMBLY INSPECTOR' in position_upper:
-                                if row.get('5prs condition 1 - there is  enough 5 prs validation qty or pass rate is over 95%') == 'no':
-                                    reasons.append("5PRS conditions 미month")
-                        
-                        # LINE LEADER special condition (JSON matrix based)
-                        if 'LINE LEADER' in position_upper and curr_amount == 0:
-                            # JSON matrixfrom configuration checking
-                            should_check_subordinates = False
-                            if POSITION_CONDITION_MATRIX:
-                                pos_config = get_position_config_from_matrix('TYPE-1', position)
-                                if pos_config:
-                                    applicable_conditions = pos_config.get('applicable_conditions', [])
-                                    # condition 7: 팀/area AQL
-                                    if 7 in applicable_conditions:
-                                        should_check_subordinates = True
-                            else:
-                                # 폴백: existing with직
-                                should_check_subordinates = True
-                            
-                            if should_check_subordinates:
-                                subordinates = valid_employees[valid_employees['MST direct boss name'] == emp_no]
-                                # [Issue #48 근본 해결] startswith('YES')로 변경 - 'YES', 'YES_3MONTHS' 모두 처리
-                                if subordinates['Continuous_FAIL'].astype(str).str.startswith('YES').any():
-                                    reasons.append("부하employee 3-month consecutive AQL failure (condition 7 미충족)")
-                        
-                        # AUDITOR/TRAINER special condition
-                        if ('AUDIT' in position_upper or 'TRAINER' in position_upper) and curr_amount == 0:
-                            # in charge area related 체크only (미 5PRS excludedone)
-                            if not reasons:  # other 사유 없 경우toonly
-                                reasons.append("in charge area reject율 초and 또 3-month consecutive failures 발생")
-                    
-                    # 사유 조합
-                    if reasons:
-                        if len(reasons) == 1:
-                            reason = reasons[0]
-                        else:
-                            # 주요 사유and 추 사유 구분
-                            reason = f"{reasons[0]} / 추: {', '.join(reasons[1:])}"
-                    else:
-                        reason = "condition 미충족"
-                
-                diff_color = 'green' if diff > 0 else 'red' if diff < 0 else 'black'
-                
-                html_content += f"""
+
+_HTML_DETAIL_ROW = """
                     <tr>
                         <td>{emp_no}</td>
                         <td>{name}</td>
                         <td>{position}</td>
-                        <td><span class="type-badge type-{role_type.split('-')[1] if '-' in role_type else '0'}">{role_type}</span></td>
+                        <td><span class="type-badge type-{type_suffix}">{role_type}</span></td>
                         <td>{prev_amount:,.0f} VND</td>
                         <td><strong>{curr_amount:,.0f} VND</strong></td>
                         <td style="color: {diff_color}">{diff:+,.0f}</td>
                         <td>{reason}</td>
                     </tr>"""
-            
-            html_content += """
+
+_HTML_REPORT_TAIL = """
                     </tbody>
                 </table>
             </div>
@@ -7942,21 +8654,260 @@ class CompleteQIPCalculator:
     </div>
 </body>
 </html>"""
-            
-            # file saved
-            import os
-            output_dir = "output_files"
-            os.makedirs(output_dir, exist_ok=True)
-            html_filename = os.path.join(output_dir, f"QIP_Incentive_Report_{month_str}_{self.config.year}.html")
-            with open(html_filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            return html_filename
-        
+
+
+# attendance_conversion_config.json default configuration (파일 값이 우선)
+_AUTO_CONVERT_DEFAULTS = {
+    "auto_convert": True,
+    "debug_mode": False,
+    "validate_conversion": True,
+    "cache_enabled": True
+}
+
+
+@lru_cache(maxsize=4)
+def _load_auto_convert_config_file(config_path: str, mtime: float):
+    """attendance_conversion_config.json parse 결과 cache - (절대경로, mtime)이 같으면 재사용"""
+    return read_json_file(config_path)
+
+
+_CSV_DELIMITERS = (',', ';', '\t', '|')
+# 입력 파일의 알려진 문자열 열 (attendance) - 항상 str() 로만 사용되므로 type 추론 없이 문자열로 parse
+# (파일에 없는 열 이름은 read_csv 가 무시, 숫자 열은 downstream 이 int/float 에 의존하므로 추론 유지)
+_INPUT_TEXT_DTYPES = {
+    'Work Date': str,
+    'WorkDate': str,
+    'compAdd': str,
+    'Reason Description': str,
+}
+
+
+def _as_input_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """pyarrow engine 결과의 _INPUT_TEXT_DTYPES 열을 C engine (dtype=_INPUT_TEXT_DTYPES) 과 같은 문자열 열로 변환
+
+    pyarrow engine 은 type 추론 후 dtype 을 astype 으로만 적용 (ISO 'Work Date' → datetime64 → 문자열,
+    빈 칸 → 'nan' / 'None' 문자열) → 결측은 NaN 으로 유지하고 값만 문자열로 변환
+    """
+    for col, dtype in _INPUT_TEXT_DTYPES.items():
+        if col in df.columns:
+            values = df[col]
+            df[col] = values.astype(dtype).where(values.notna(), np.nan)
+    return df
+
+
+# Excel 빈 열 header (pandas 가 "Unnamed: N" 으로 채움) - Issue #46
+_UNNAMED_COL_PREFIX = 'Unnamed'
+
+
+def _is_unnamed_column(col) -> bool:
+    """Issue #46: Excel 빈 열 ("Unnamed: N") 여부"""
+    return isinstance(col, str) and col.startswith(_UNNAMED_COL_PREFIX)
+
+
+# attendance 파일에서 DataProcessor.process_attendance_conditions 가 읽는 열
+# (employee ID 후보 / date 후보 / raw 형식 compAdd·Reason / converted 형식 집계 열) - 나머지 열은 parse 하지 않음
+_ATTENDANCE_ID_COLUMNS = (
+    'ID No', 'Employee No', 'EMPLOYEE NO', 'EMPLOYEE_NO', 'EMP_NO',
+    'EMPLOYEE ID', 'EMPLOYEE_ID', 'ID', 'WORKER ID', 'STAFF ID',
+)
+_ATTENDANCE_USED_COLUMNS = frozenset(col.upper() for col in _ATTENDANCE_ID_COLUMNS + (
+    'Work Date', 'WorkDate', 'Date', ' days자', 'Ngày',
+    'compAdd', 'Reason Description',
+    'ACTUAL WORK DAY', 'TOTAL WORK DAY', 'AR1 Absences', 'Unapproved Absences', 'Absence Rate (%)',
+    'Approved Leave Days', 'Attendance Rate (%)', 'Come Late Days', 'Leave Early Days',
+    'Absence (without permission) time', 'Absence (without permission) Ratio (%)',
+))
+# detect_column_names 부분 matching 규칙과 동일 (영숫자만 대문자 비교)
+_ATTENDANCE_ID_COLUMNS_CLEAN = tuple(re.sub(r'[^a-zA-Z0-9]', '', col.upper()) for col in _ATTENDANCE_ID_COLUMNS)
+# process_attendance_conditions 의 날짜형 열 이름 fallback 패턴 (가로형 attendance 표)
+_ATTENDANCE_DATE_HEADER_RE = re.compile(r'\d{1,2}[-/]\d{1,2}')
+
+
+def _is_attendance_column_used(col) -> bool:
+    """attendance 파일 열을 로드해야 하는지 (ID 열은 detect_column_names 부분 matching 후보까지 유지)"""
+    if not isinstance(col, str):
+        return True
+    if col.upper() in _ATTENDANCE_USED_COLUMNS or _ATTENDANCE_DATE_HEADER_RE.search(col):
+        return True
+    col_clean = re.sub(r'[^a-zA-Z0-9]', '', col.upper())
+    return any(pattern in col_clean or col_clean in pattern for pattern in _ATTENDANCE_ID_COLUMNS_CLEAN)
+
+
+# 입력 파일 parse 결과 cache - key: (절대경로, mtime_ns, size, 열 선택 규칙) → 파일이 바뀌면 자동 무효화
+#   (같은 파일도 file_key 에 따라 로드하는 열이 다르므로 열 선택 규칙도 key 에 포함)
+# 프로세스 내 dict + 디스크 (재실행 시 parse 생략)
+#   - pyarrow 설치 시: cache 폴더의 .parquet (input_files/ 에는 쓰지 않음)
+#   - 없거나 Parquet 로 저장 못 하는 frame 이면: cache 폴더의 pickle
+#   두 파일 모두 key + cache 버전 digest 로 이름을 지어 버전이 바뀌면 자동 무효화
+# QIP_INPUT_CACHE=0 이면 비활성화, 위치는 QIP_CACHE_DIR (기본 ~/.cache/qip_incentive)
+_INPUT_CACHE_ENABLED = os.environ.get('QIP_INPUT_CACHE', '1') != '0'
+_INPUT_CACHE_DIR = Path(os.environ.get('QIP_CACHE_DIR') or (Path.home() / '.cache' / 'qip_incentive'))
+_INPUT_FRAME_CACHE = {}
+# 로더 parse 규칙이 바뀌면 올려서 기존 디스크 cache 무효화
+_INPUT_CACHE_VERSION = 4
+
+
+def _input_cache_key(file_path: str, st: os.stat_result, column_mode: str) -> tuple:
+    """입력 파일 cache key (절대경로, mtime_ns, size, 열 선택 규칙 - 'attendance' / 'all')"""
+    return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size, column_mode)
+
+
+def _input_cache_digest(cache_key: tuple) -> str:
+    """디스크 cache 파일 이름 (cache / pandas / Python 버전이 바뀌면 다른 이름)"""
+    version_key = (_INPUT_CACHE_VERSION, pd.__version__, sys.version_info[:2])
+    return hashlib.sha1(repr((cache_key, version_key)).encode('utf-8')).hexdigest()
+
+
+def _input_cache_file(cache_key: tuple) -> Path:
+    """디스크 pickle cache 파일 경로"""
+    return _INPUT_CACHE_DIR / f"{_input_cache_digest(cache_key)}.pkl"
+
+
+def _input_parquet_sidecar(cache_key: tuple) -> Path:
+    """디스크 Parquet cache 파일 경로 (pickle 과 같은 digest, 확장자만 다름)"""
+    return _INPUT_CACHE_DIR / f"{_input_cache_digest(cache_key)}.parquet"
+
+
+def _load_input_frame_from_disk(cache_key: tuple) -> Optional[pd.DataFrame]:
+    """디스크 cache (Parquet → pickle 순서) 에서 로드, 없으면 None"""
+    if _HAS_PYARROW:
+        parquet_path = _input_parquet_sidecar(cache_key)
+        try:
+            return pd.read_parquet(parquet_path)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"❌ HTML report created in progress Error: {e}")
-            traceback.print_exc()
+            print(f"  ⚠️ Parquet cache 로드 실패: {e}")
+
+    cache_file = _input_cache_file(cache_key)
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'rb') as f:
+            df = pickle.load(f)
+    except Exception as e:
+        print(f"  ⚠️ 입력 cache 로드 실패, 원본 파일에서 다시 읽음: {e}")
+        return None
+    return df if isinstance(df, pd.DataFrame) else None
+
+
+def load_cached_input_frame(cache_key: tuple) -> Optional[pd.DataFrame]:
+    """cache 된 입력 DataFrame (없으면 None) - 호출자가 수정해도 cache 에 영향 없도록 복사본 반환"""
+    if not _INPUT_CACHE_ENABLED:
+        return None
+    df = _INPUT_FRAME_CACHE.get(cache_key)
+    if df is None:
+        df = _load_input_frame_from_disk(cache_key)
+        if df is None:
             return None
+        _INPUT_FRAME_CACHE[cache_key] = df
+    return df.copy()
+
+
+def store_cached_input_frame(cache_key: tuple, df: pd.DataFrame):
+    """parse 결과를 cache 에 저장 (디스크 저장 실패는 경고만 - 로드 결과는 정상 사용)"""
+    if not _INPUT_CACHE_ENABLED:
+        return
+    _INPUT_FRAME_CACHE[cache_key] = df.copy()
+
+    if _HAS_PYARROW:
+        # Parquet cache (columnar, 다음 실행부터 CSV parse 없이 로드)
+        parquet_path = _input_parquet_sidecar(cache_key)
+        tmp_parquet = parquet_path.with_name(f"{parquet_path.name}.{os.getpid()}.tmp")
+        try:
+            _INPUT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_parquet, index=False)
+            os.replace(tmp_parquet, parquet_path)
+            return
+        except Exception as e:
+            # 혼합 type object 열 등 Parquet 변환 불가 → pickle cache 사용
+            print(f"  ⚠️ Parquet cache 저장 실패, pickle cache 사용: {e}")
+            try:
+                os.remove(tmp_parquet)
+            except OSError:
+                pass
+
+    cache_file = _input_cache_file(cache_key)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        _INPUT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        print(f"  ⚠️ 입력 cache 저장 실패: {e}")
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+def _guess_encoding(head: bytes) -> Optional[str]:
+    """파일 앞부분 bytes 로 인코딩 추정 (read_csv 에서 UnicodeDecodeError 반복 방지)
+
+    BOM → utf-8-sig, 그 외 utf-8 → cp949 → euc-kr 순서로 decode 가능 여부 확인 (모두 실패 시 None)
+    """
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    for encoding in ('utf-8', 'cp949', 'euc-kr'):
+        try:
+            # incremental decoder: 잘린 마지막 multi-byte 문자는 오류로 보지 않음
+            codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def _detect_csv_dialect(head: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """CSV 인코딩/구분자 사전 감지 (byte 검사 + csv.Sniffer) - read_csv 시도 횟수 최소화
+
+    head: 파일 앞부분 bytes (64KB 정도면 충분)
+    Returns: (encoding, sep) - 감지 실패 시 (None, None) → 기존 인코딩×구분자 조합 순회
+    """
+    if not head:
+        return None, None
+
+    encoding = _guess_encoding(head)
+    if encoding is None:
+        return None, None
+    sample = head.decode(encoding, errors='ignore')
+    header_line = sample.split('\n', 1)[0]
+    try:
+        sep = csv.Sniffer().sniff(sample, delimiters=''.join(_CSV_DELIMITERS)).delimiter
+    except csv.Error:
+        sep = None
+    # Sniffer 결과가 header 행에 없으면 신뢰하지 않고 header 에 있는 첫 구분자 사용
+    if sep is None or sep not in header_line:
+        sep = next((d for d in _CSV_DELIMITERS if d in header_line), None)
+    if sep is None:
+        return None, None
+    return encoding, sep
+
+
+# AttendanceAutoConverter 클래스 cache (None: 아직 미해결, False: import 불가)
+_ATTENDANCE_CONVERTER_CLS = None
+
+
+def _resolve_attendance_converter_cls():
+    """AttendanceAutoConverter import 를 1회만 시도하고 결과 cache (sys.path 조작도 1회)"""
+    global _ATTENDANCE_CONVERTER_CLS
+    if _ATTENDANCE_CONVERTER_CLS is not None:
+        return _ATTENDANCE_CONVERTER_CLS
+
+    # Try different import methods
+    try:
+        from input_files.attendance.attendance_auto_converter import AttendanceAutoConverter
+    except ImportError:
+        try:
+            # Alternative import path
+            sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            from input_files.attendance.attendance_auto_converter import AttendanceAutoConverter
+        except ImportError:
+            # If still fails, remember the failure (converter 미사용)
+            AttendanceAutoConverter = False
+    _ATTENDANCE_CONVERTER_CLS = AttendanceAutoConverter
+    return _ATTENDANCE_CONVERTER_CLS
 
 
 class CompleteDataLoader:
@@ -7967,7 +8918,7 @@ class CompleteDataLoader:
         self.file_mapping = {
             f"{config.month.full_name}_basic": config.get_file_path("basic_manpower"),
             f"{config.previous_months[-1].full_name}_incentive" if config.previous_months else "prev_incentive":
-                config.get_file_path("previous_incentive"),
+                config.get_file_path("previous_incentive") or self._default_previous_incentive_path(),
             f"{config.month.full_name}_aql": config.get_file_path("aql_current"),
             f"{config.month.full_name}_5prs": config.get_file_path("5prs"),
             f"{config.month.full_name}_attendance": config.get_file_path("attendance")
@@ -7976,24 +8927,40 @@ class CompleteDataLoader:
         # 자same 변환 configuration withload
         self.auto_convert_config = self.load_auto_convert_config()
         self.attendance_converter = None
+        # (source 경로, mtime_ns, size) → 변환된 파일 경로 (source 가 바뀌면 자동 무효화)
+        self._converted_paths = {}
     
+    def _default_previous_incentive_path(self) -> Optional[str]:
+        """previous_incentive 경로 미지정 시 이전 달 실행 결과 사용
+
+        이전 달 계산의 prepare_next_month_file 이 input_files 에 남긴 CSV
+        ("{year}year {month} incentive 지급 세부 정보.csv") 가 있으면 그 경로 반환
+        (입력 cache 로 파일이 바뀌지 않았으면 다시 parse 하지 않음)
+        """
+        if not self.config.previous_months:
+            return None
+        prev_month = self.config.previous_months[-1]
+        prev_year = self.config.year if prev_month.number < self.config.month.number else self.config.year - 1
+        prev_path = f"input_files/{prev_year}year {prev_month.korean_name} incentive 지급 세부 정보.csv"
+        if not os.path.exists(prev_path):
+            return None
+        print(f"ℹ️ previous_incentive 경로 미지정 → 이전 달 계산 결과 사용: {prev_path}")
+        return prev_path
+
     def load_auto_convert_config(self) -> Dict:
-        """자same 변환 configuration withload"""
+        """자same 변환 configuration withload (default 와 1회 merge → 이후 key 직접 접근)"""
+        loaded = None
         try:
             config_path = Path('attendance_conversion_config.json')
             if config_path.exists():
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except:
-            pass
-        
-        # default configuration
-        return {
-            "auto_convert": True,
-            "debug_mode": False,
-            "validate_conversion": True,
-            "cache_enabled": True
-        }
+                # 파일이 바뀌지 않았으면 (mtime 동일) 이전 parse 결과 재사용
+                loaded = _load_auto_convert_config_file(str(config_path.resolve()), config_path.stat().st_mtime)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            # 읽기 / parse 실패 시 default configuration 사용
+            print(f"⚠️ attendance_conversion_config.json load failed, default configuration 사용: {e}")
+        
+        # default configuration + 파일 값 (파일에 없는 key 는 default)
+        return {**_AUTO_CONVERT_DEFAULTS, **(loaded if isinstance(loaded, dict) else {})}
     
     def get_attendance_file_path(self, file_path: str, file_key: str) -> str:
         """출결 file 경with processing (자same 변환 include)"""
@@ -8002,26 +8969,17 @@ class CompleteDataLoader:
             return file_path
         
         # 자same 변환 비활성화면 그대with 반환
-        if not self.auto_convert_config.get('auto_convert', True):
+        if not self.auto_convert_config['auto_convert']:
             return file_path
         
         # 자same 변환기 초기화 (필요시)
         if self.attendance_converter is None:
             try:
-                # Try different import methods
-                try:
-                    from input_files.attendance.attendance_auto_converter import AttendanceAutoConverter
-                except ImportError:
-                    try:
-                        # Alternative import path
-                        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                        from input_files.attendance.attendance_auto_converter import AttendanceAutoConverter
-                    except ImportError:
-                        # If still fails, set converter to None
-                        AttendanceAutoConverter = None
+                # import 경로 탐색은 프로세스당 1회 (_resolve_attendance_converter_cls 에서 cache)
+                AttendanceAutoConverter = _resolve_attendance_converter_cls()
                 if AttendanceAutoConverter:
                     self.attendance_converter = AttendanceAutoConverter(
-                        debug_mode=self.auto_convert_config.get('debug_mode', False)
+                        debug_mode=self.auto_convert_config['debug_mode']
                     )
                     print("✅ 출결 자same 변환 모듈 loaded successfully")
                 else:
@@ -8033,9 +8991,16 @@ class CompleteDataLoader:
         
         # 자same 변환 실행
         try:
+            st = os.stat(file_path)
+            cache_key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+            cached_path = self._converted_paths.get(cache_key)
+            if cached_path and os.path.exists(cached_path):
+                return cached_path
+
             converted_path = self.attendance_converter.ensure_converted_file(file_path)
             if converted_path != file_path:
                 print(f"✅ 출결 data 자same 변환 completed: {os.path.basename(converted_path)}")
+            self._converted_paths[cache_key] = converted_path
             return converted_path
         except Exception as e:
             print(f"⚠️ 자same 변환 failure, original file 사용: {e}")
@@ -8046,32 +9011,92 @@ class CompleteDataLoader:
         # attendance fileof 경우 자same 변환 processing
         file_path = self.get_attendance_file_path(file_path, file_key)
         
-        if not file_path or not os.path.exists(file_path):
+        # 존재 확인은 os.stat 1회 (size 는 빈 파일 판정, mtime/size 는 cache key 에 사용)
+        try:
+            st = os.stat(file_path) if file_path else None
+        except OSError:
+            st = None
+        if st is None:
             print(f"⚠️ file not found: {file_path}")
             return None
+        file_size = st.st_size
+
+        # AQL fileof 경우 빈 행 제거 후 cases수 표시 (file_key 판정은 1회)
+        is_aql = 'aql' in file_key.lower()
+        is_attendance = 'attendance' in file_key.lower()
+
+        def report_loaded(df: pd.DataFrame, source: str = ''):
+            if is_aql:
+                valid_df = df.dropna(how='all')
+                print(f"✅ {file_key} loaded successfully{source}: {len(valid_df)} cases")
+            else:
+                print(f"✅ {file_key} loaded successfully{source}: {len(df)} cases")
+
+        # 파일이 바뀌지 않았으면 (경로, mtime, size, 열 선택 규칙 동일) 이전 parse 결과 사용
+        cache_key = _input_cache_key(file_path, st, 'attendance' if is_attendance else 'all')
+        cached_df = load_cached_input_frame(cache_key)
+        if cached_df is not None:
+            report_loaded(cached_df, ' (cache)')
+            return cached_df
         
         try:
-            # 다양한 인코ingand 구분자 attempt
-            for enc in ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']:
-                for sep in [',', ';', '\t', '|']:
-                    try:
-                        df = pd.read_csv(file_path, sep=sep, encoding=enc)
-                        if len(df) > 0 and len(df.columns) > 1:
-                            # Issue #46 Fix: Unnamed 열 제거 (Excel 빈 열 문제 해결)
-                            original_cols = len(df.columns)
-                            df = df.loc[:, ~df.columns.str.contains('^Unnamed', na=False)]
-                            if original_cols != len(df.columns):
-                                print(f"  📊 Unnamed 열 제거: {original_cols} → {len(df.columns)}개 열")
-
-                            # AQL fileof 경우 빈 행 제거 후 cases수 표시
-                            if 'aql' in file_key.lower():
-                                valid_df = df.dropna(how='all')
-                                print(f"✅ {file_key} loaded successfully: {len(valid_df)} cases")
+            # 파일은 1회만 읽고 이후 감지 / 파싱 시도는 모두 메모리 buffer 에서 수행
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+
+            # BOM / csv.Sniffer 로 감지한 (인코딩, 구분자)를 먼저 1회 시도
+            detected = _detect_csv_dialect(raw[:65536]) if file_size else (None, None)
+            candidates = []
+            if detected[0]:
+                # 가장 큰 입력인 attendance 는 PyArrow 설치 시 multi-thread parser 우선 사용
+                # (basic manpower 등은 ISO date 문자열이 timestamp 로 추론되지 않도록 C engine 유지)
+                if _HAS_PYARROW and is_attendance:
+                    candidates.append(detected + ('pyarrow',))
+                candidates.append(detected + ('c',))
+            # 감지 실패 또는 결과 부적합 시 다양한 인코ingand 구분자 attempt (기존 순서)
+            candidates += [(enc, sep, 'c')
+                           for enc in ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']
+                           for sep in _CSV_DELIMITERS
+                           if (enc, sep) != detected]
+            # Issue #46 Fix: Unnamed 열 제거 (Excel 빈 열 문제 해결)
+            # → usecols 로 parse 단계에서 제외 (버릴 열은 decode / type 추론하지 않음)
+            # attendance 는 calculator 가 읽는 열만 유지 (이름/부서 등 나머지 열 parse 생략)
+            header_cols = set()
+
+            def keep_column(col) -> bool:
+                header_cols.add(col)
+                if _is_unnamed_column(col):
+                    return False
+                return _is_attendance_column_used(col) if is_attendance else True
+
+            for enc, sep, engine in candidates:
+                try:
+                    header_cols.clear()
+                    if engine == 'pyarrow':
+                        # pyarrow engine 은 callable usecols 미지원 → 읽은 후 Unnamed 열 제외
+                        # 문자열 열은 C engine 과 같은 dtype 으로 변환 (engine 에 따라 cache 된 frame 이 달라지지 않도록)
+                        df = _as_input_text_columns(
+                            pd.read_csv(io.BytesIO(raw), sep=sep, encoding=enc, engine='pyarrow'))
+                        kept_cols = [c for c in df.columns if keep_column(c)]
+                        if len(kept_cols) < len(df.columns):
+                            df = df[kept_cols]
+                    else:
+                        df = pd.read_csv(io.BytesIO(raw), sep=sep, encoding=enc, engine='c',
+                                         usecols=keep_column, dtype=_INPUT_TEXT_DTYPES)
+                    # 열 개수 판정은 Unnamed 제외 전 header 기준 (기존과 동일)
+                    if len(df) > 0 and len(header_cols) > 1:
+                        if len(df.columns) < len(header_cols):
+                            if is_attendance:
+                                print(f"  📊 attendance 사용 열만 로드: {len(header_cols)} → {len(df.columns)}개 열")
                             else:
-                                print(f"✅ {file_key} loaded successfully: {len(df)} cases")
-                            return df
-                    except:
-                        continue
+                                print(f"  📊 Unnamed 열 제거: {len(header_cols)} → {len(df.columns)}개 열")
+
+                        report_loaded(df)
+                        store_cached_input_frame(cache_key, df)
+                        return df
+                except (UnicodeError, ValueError, pd.errors.ParserError, pd.errors.EmptyDataError):
+                    # 인코딩 / 구분자 불일치 → 다음 조합 attempt (ArrowInvalid 도 ValueError 하위)
+                    continue
             
             print(f"❌ {file_key} load failed")
             return None
@@ -8085,9 +9110,15 @@ class CompleteDataLoader:
         print(f"\n📂 {self.config.get_month_str('korean')} data file withing in progress...")
         
         data = {}
-        for file_key, file_path in self.file_mapping.items():
-            if file_path:  # None 아닌 경우only
-                df = self.load_single_file(file_path, file_key)
+        targets = [(file_key, file_path) for file_key, file_path in self.file_mapping.items()
+                   if file_path]  # None 아닌 경우only
+
+        # 파일별 I/O + C engine parse 는 GIL 해제 → thread 로 동시 로드 (결과 순서는 file_mapping 순서 유지)
+        with ThreadPoolExecutor(max_workers=max(1, min(5, len(targets)))) as executor:
+            futures = [(file_key, executor.submit(self.load_single_file, file_path, file_key))
+                       for file_key, file_path in targets]
+            for file_key, future in futures:
+                df = future.result()
                 if df is not None:
                     data[file_key] = df
         
@@ -8095,30 +9126,69 @@ class CompleteDataLoader:
         return data
 
 
+def _read_attendance_dates(file_path: str) -> Optional[pd.Series]:
+    """Attendance file 1회 읽기 + Work Date column datetime 파싱 (column 없으면 None)"""
+    # Work Date column 찾기 (header 만 먼저 읽음)
+    header = pd.read_csv(file_path, encoding='utf-8-sig', nrows=0).columns
+    date_cols = ['Work Date', 'WorkDate', 'Date', 'date']
+    date_col = next((col for col in date_cols if col in header), None)
+    if not date_col:
+        return None
+
+    # file 읽기 - date column 만 parse (PyArrow 설치 시 multi-thread parser)
+    df = pd.read_csv(file_path, encoding='utf-8-sig', usecols=[date_col], dtype={date_col: str},
+                     engine=_CSV_ENGINE)
+
+    # "2025.07.01 08:00" 처럼 시간이 붙은 값도 허용 (exact=False)
+    return pd.to_datetime(df[date_col], format='%Y.%m.%d', exact=False, errors='coerce')
+
+
+def _count_working_days(dates: pd.Series, year: int, month: int) -> int:
+    """해당 yearmonthof 유니크한 date 수"""
+    in_month = (dates.dt.year == year) & (dates.dt.month == month)
+    return int(dates[in_month].dt.day.nunique())
+
+
+def analyze_attendance(file_path: str) -> tuple:
+    """Attendance file 1회 읽기로 (year, month, Working days) 동시 calculation
+
+    detect_month_from_attendance + calculate_working_days_from_attendance 를 연달아 호출하면
+    같은 파일을 두 번 read_csv / 파싱하므로 auto config 에서는 이 함수를 사용
+    """
+    try:
+        dates = _read_attendance_dates(file_path)
+        if dates is None:
+            print("⚠️ Date column not found.")
+            return None, None, None
+
+        valid_dates = dates.dropna()
+        if valid_dates.empty:
+            print("⚠️ 유효한 date 찾 수 없습니다.")
+            return None, None, None
+
+        # 장 많 나타나 yearmonth 찾기
+        most_common = valid_dates.dt.to_period('M').value_counts().index[0]
+        year, month = most_common.year, most_common.month
+        print(f"✅ Attendance 파일에서 detectiondone yearMonth: {year}year {month}month")
+
+        working_days = _count_working_days(valid_dates, year, month)
+        print(f"✅ Attendance 파일에서 calculationdone {year}year {month}month Working days: {working_days} days")
+        return year, month, working_days
+
+    except Exception as e:
+        print(f"⚠️ Attendance file 분석 failure: {e}")
+        return None, None, None
+
+
 def detect_month_from_attendance(file_path: str) -> tuple:
     """Attendance fileof Work Datefrom yearalsoand month 자same detection"""
     try:
-        import pandas as pd
-        
-        # file 읽기
-        df = pd.read_csv(file_path, encoding='utf-8-sig')
-        
-        # Work Date column 찾기
-        date_cols = ['Work Date', 'WorkDate', 'Date', 'date']
-        date_col = None
-        for col in date_cols:
-            if col in df.columns:
-                date_col = col
-                break
-        
-        if not date_col:
+        dates = _read_attendance_dates(file_path)
+        if dates is None:
             print("⚠️ Date column not found.")
             return None, None
-        
-        # date 파싱 및 yearmonth 추출
-        dates = pd.to_datetime(df[date_col], format='%Y.%m.%d', errors='coerce')
+
         dates = dates.dropna()
-        
         if dates.empty:
             print("⚠️ 유효한 date 찾 수 없습니다.")
             return None, None
@@ -8141,30 +9211,13 @@ def detect_month_from_attendance(file_path: str) -> tuple:
 def calculate_working_days_from_attendance(file_path: str, year: int, month: int) -> int:
     """Attendance 파일에서 실제 근무 days calculation"""
     try:
-        import pandas as pd
-        
-        # file 읽기
-        df = pd.read_csv(file_path, encoding='utf-8-sig')
-        
-        # Work Date columnfrom 해당 yearmonth 필터링
-        date_pattern = f"{year}.{month:02d}"
-        
-        # Work Date column 찾기
-        date_cols = ['Work Date', 'WorkDate', 'Date', 'date']
-        date_col = None
-        for col in date_cols:
-            if col in df.columns:
-                date_col = col
-                break
-        
-        if not date_col:
+        dates = _read_attendance_dates(file_path)
+        if dates is None:
             print("⚠️ Date column not found. defaultvalue 사용")
             return None
         
         # 해당 monthof 유니크한 date 수 calculation
-        month_dates = df[df[date_col].str.contains(date_pattern, na=False)][date_col]
-        unique_dates = month_dates.str.extract(r'(\d{4}\.\d{2}\.\d{2})')[0].unique()
-        working_days = len(unique_dates)
+        working_days = _count_working_days(dates, year, month)
         
         print(f"✅ Attendance 파일에서 calculationdone {year}year {month}month Working days: {working_days} days")
         return working_days
@@ -8174,17 +9227,34 @@ def calculate_working_days_from_attendance(file_path: str, year: int, month: int
         return None
 
 
+# init_command file 자동 detection 패턴 ({full}/{short}: 대상 month, {prev_full}/{prev_short}: previous month)
+_INIT_FILE_PATTERN_TEMPLATES = {
+    "basic": "basic.*{full}|{short}.*manpower",
+    "previous_incentive": "{prev_full}.*incentive|{prev_short}.*qip",
+    "aql": "aql.*{full}|{short}.*aql",
+    "5prs": "5.*p.*{full}|{short}.*5.*p",
+    "attendance": "attendance.*{full}|{short}.*attendance"
+}
+
+
 def init_command():
     """초기 configuration employees령어 - 파일 자동 detection 및 configuration"""
     print("\n🔧 Initial configuration started...")
     print("📂 current directoryof file 분석합니다...")
     
     import os
-    import glob
     
-    # current directoryof CSV file 목록
-    csv_files = glob.glob("*.csv")
-    excel_files = glob.glob("*.xlsx")
+    # current directoryof CSV / Excel file 목록 (directory 1회 scan, glob 과 동일하게 숨김 파일 제외)
+    csv_files, excel_files = [], []
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.name.endswith('.csv'):
+                csv_files.append(entry.name)
+            elif entry.name.endswith('.xlsx'):
+                excel_files.append(entry.name)
+    candidate_files = csv_files + excel_files
     
     print(f"\n발견done file:")
     print(f"  CSV file: {len(csv_files)}items")
@@ -8192,7 +9262,7 @@ def init_command():
     
     # Attendance file 찾기
     attendance_file = None
-    for file in csv_files + excel_files:
+    for file in candidate_files:
         if 'attendance' in file.lower():
             attendance_file = file
             print(f"\n✅ Attendance file 발견: {attendance_file}")
@@ -8226,22 +9296,28 @@ def init_command():
     # file 패턴 detection
     print("\n📁 data Auto-detecting files...")
     
-    # default file 패턴
+    # default file 패턴 (month 이름 채워서 1회 compile)
     file_patterns = {
-        "basic": f"basic.*{month.full_name}|{month.short_name}.*manpower",
-        "previous_incentive": f"{prev_month2.full_name}.*incentive|{prev_month2.short_name}.*qip",
-        "aql": f"aql.*{month.full_name}|{month.short_name}.*aql",
-        "5prs": f"5.*p.*{month.full_name}|{month.short_name}.*5.*p",
-        "attendance": f"attendance.*{month.full_name}|{month.short_name}.*attendance"
+        key: re.compile(template.format(full=month.full_name, short=month.short_name,
+                                        prev_full=prev_month2.full_name, prev_short=prev_month2.short_name),
+                        re.IGNORECASE)
+        for key, template in _INIT_FILE_PATTERN_TEMPLATES.items()
     }
     
+    # 파일 목록은 1회 순회 - key 별로 처음 매칭된 파일 사용 (기존 우선순위 동일)
+    matched_files = {}
+    for file in candidate_files:
+        for key, pattern in file_patterns.items():
+            if key not in matched_files and pattern.search(file):
+                matched_files[key] = file
+        if len(matched_files) == len(file_patterns):
+            break
+    
     detected_files = {}
-    for key, pattern in file_patterns.items():
-        for file in csv_files + excel_files:
-            if re.search(pattern, file, re.IGNORECASE):
-                detected_files[key] = file
-                print(f"  ✅ {key}: {file}")
-                break
+    for key in file_patterns:
+        if key in matched_files:
+            detected_files[key] = matched_files[key]
+            print(f"  ✅ {key}: {matched_files[key]}")
     
     # 수same 입력 필요한 file
     for key in file_patterns:
@@ -8273,11 +9349,104 @@ def init_command():
     return None
 
 
+def prompt_paths(labels: Dict[str, str]) -> Dict[str, str]:
+    """
+    여러 파일 경로 입력 - label 목록을 먼저 한 번에 출력하고 한 줄에 하나씩 입력받음
+
+    - 경로 여러 줄을 한꺼번에 붙여넣으면 줄 순서대로 각 항목에 배정
+      (붙여넣은 나머지 줄은 stdin 에 이미 있으므로 추가 입력 대기 없이 바로 읽힘)
+    - 빈 줄은 빈 경로 (기존 항목별 input() 과 동일)
+    """
+    keys = list(labels)
+    print("\n".join(f"  {i}. {labels[key]}" for i, key in enumerate(keys, 1)))
+    values = []
+    while len(values) < len(keys):
+        if not values:
+            line = input(f"파일 경로 {len(keys)}개 입력 (한 줄에 하나씩, 여러 줄 붙여넣기 가능) 1: ")
+        else:
+            line = input(f"  {len(values) + 1}: ")
+        values.append(line)
+    return dict(zip(keys, values))
+
+# 마지막으로 사용한 manifest 사본 (--manifest 경로 생략 시 재사용)
+_LAST_MANIFEST_FILE = _INPUT_CACHE_DIR / 'last_manifest.json'
+# manifest file_paths 키 - CompleteDataLoader.get_file_path 와 같은 이름 (previous_incentive 는 선택: 생략 시 이전 달 결과 파일)
+_MANIFEST_REQUIRED_PATHS = ('basic_manpower', 'aql_current', '5prs', 'attendance')
+# 짧은 별칭 → loader 키
+_MANIFEST_PATH_ALIASES = {'basic': 'basic_manpower', 'aql': 'aql_current'}
+
+
+def load_manifest_config(manifest_path: str = None) -> Optional[MonthConfig]:
+    """
+    manifest JSON 1회 읽기로 MonthConfig 생성 (month / 파일 경로 input() 입력 대체)
+
+    형식: {"year": 2025, "month": 7 또는 "july", "working_days": 27,
+           "file_paths": {"basic_manpower": ..., "aql_current": ..., "5prs": ..., "attendance": ...,
+                          "previous_incentive": (선택)},
+           "output_prefix": (선택)}
+    - file_paths 키는 config_files/config_*.json 과 동일 ("basic" / "aql" 별칭도 허용)
+    - 필수 파일 경로가 없으면 None (아무 파일도 로드하지 않는 config 를 만들지 않음)
+    - manifest_path 가 비어 있으면 마지막으로 사용한 manifest 재사용
+    - 읽은 manifest 는 last_manifest.json 으로 보관 (QIP_CACHE_DIR)
+    """
+    if not manifest_path:
+        manifest_path = str(_LAST_MANIFEST_FILE)
+    try:
+        data = read_json_file(manifest_path)
+        month_value = str(data['month']).strip()
+        month = Month.from_number(int(month_value)) if month_value.isdigit() else Month.from_name(month_value)
+        year = int(data['year'])
+        working_days = int(data['working_days'])
+        file_paths = dict(data['file_paths'])
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"❌ manifest 읽기 실패 ({manifest_path}): {e}")
+        return None
+
+    for alias, key in _MANIFEST_PATH_ALIASES.items():
+        if alias in file_paths and key not in file_paths:
+            file_paths[key] = file_paths.pop(alias)
+    missing = [key for key in _MANIFEST_REQUIRED_PATHS if not file_paths.get(key)]
+    if missing:
+        print(f"❌ manifest file_paths 누락 ({manifest_path}): {', '.join(missing)}")
+        return None
+
+    prev_month1 = Month.from_number((month.number - 2) % 12 or 12)
+    prev_month2 = Month.from_number((month.number - 1) % 12 or 12)
+    config = MonthConfig(
+        year=year,
+        month=month,
+        working_days=working_days,
+        previous_months=[prev_month1, prev_month2],
+        file_paths=file_paths,
+        output_prefix=data.get('output_prefix') or f"output_QIP_incentive_{month.full_name}_{year}"
+    )
+    print(f"✅ manifest loaded successfully: {manifest_path}")
+
+    if os.path.abspath(manifest_path) != os.path.abspath(_LAST_MANIFEST_FILE):
+        try:
+            _LAST_MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+            write_json_file(data, _LAST_MANIFEST_FILE)
+        except OSError as e:
+            print(f"  ⚠️ 마지막 manifest 보관 실패: {e}")
+    return config
+
+# main() 고정 출력 문구 (banner / month 선택 menu) - 여러 줄을 모듈 로드 시 1회 구성, print 1회로 출력
+_MAIN_BANNER = "\n".join([
+    "=" * 60,
+    "🚀 QIP Incentive Calculation System v8.02",
+    "=" * 60,
+])
+_MAIN_MONTH_MENU = "\n".join([
+    "\n📅 Select month to calculate:",
+    "1. 6월 (June)",
+    "2. July (July)",
+    "3. Custom configuration",
+    "4. /init - Auto-configuration (recommended)",
+])
+
 def main():
     """메인 실행 함수"""
-    print("="*60)
-    print(f"🚀 QIP Incentive Calculation System v8.02")
-    print("="*60)
+    print(_MAIN_BANNER)
     
     # employees령어 체크
     import sys
@@ -8287,15 +9456,29 @@ def main():
     parser = argparse.ArgumentParser(description='QIP Incentive Calculation System')
     parser.add_argument('--config', type=str, help='configuration file 경with')
     parser.add_argument('--init', action='store_true', help='자same configuration 초기화')
+    parser.add_argument('--manifest', nargs='?', const='',
+                        help='month / 파일 경로 manifest JSON (경로 생략 시 마지막 사용 manifest)')
     args = parser.parse_args()
     
     # config file 지정done 경우
     if args.config:
+        # 비대화형(batch) 실행: 터미널 stdout의 line buffering 해제 → print마다 write syscall 발생 방지
+        # (버퍼는 input() 호출 시 / 종료 시 자동 flush)
+        reconfigure = getattr(sys.stdout, 'reconfigure', None)
+        if reconfigure is not None:
+            try:
+                reconfigure(line_buffering=False)
+            except (ValueError, io.UnsupportedOperation):
+                pass
         config = ConfigManager.load_config(args.config)
         if config is None:
             print(f"\n❌ configuration file not found: {args.config}")
             return
         print(f"\n✅ configuration file loaded successfully: {args.config}")
+    elif args.manifest is not None:
+        config = load_manifest_config(args.manifest)
+        if config is None:
+            return
     elif args.init or (len(sys.argv) > 1 and sys.argv[1] == '/init'):
         config = init_command()
         if config is None:
@@ -8303,11 +9486,7 @@ def main():
             return
     else:
         # month 선택
-        print("\n📅 Select month to calculate:")
-        print("1. 6월 (June)")
-        print("2. July (July)")
-        print("3. Custom configuration")
-        print("4. /init - Auto-configuration (recommended)")
+        print(_MAIN_MONTH_MENU)
         
         choice = input("\n선택 (1/2/3/4): ").strip()
     
@@ -8335,21 +9514,21 @@ def main():
                 month=month,
                 working_days=working_days,
                 previous_months=[prev_month1, prev_month2],
-                file_paths={
-                    "basic": input(f"{month.korean_name} default data fileemployees: "),
-                    "previous_incentive": input(f"{prev_month2.korean_name} incentive data fileemployees: "),
-                    "aql": input(f"{month.korean_name} AQL data fileemployees: "),
-                    "5prs": input(f"{month.korean_name} 5PRS data fileemployees: "),
-                    "attendance": input(f"{month.korean_name} attendance data fileemployees: ")
-                },
+                file_paths=prompt_paths({
+                    "basic": f"{month.korean_name} default data fileemployees",
+                    "previous_incentive": f"{prev_month2.korean_name} incentive data fileemployees",
+                    "aql": f"{month.korean_name} AQL data fileemployees",
+                    "5prs": f"{month.korean_name} 5PRS data fileemployees",
+                    "attendance": f"{month.korean_name} attendance data fileemployees"
+                }),
                 output_prefix=f"output_QIP_incentive_{month.full_name}_{year}"
             )
         else:
             print("❌ 잘못done 선택입니다.")
             return
     
-    # configuration saved 옵션 (config 파라미터with 실행한 경우to cases너뛰기)
-    if not args.config:
+    # configuration saved 옵션 (config / manifest 파라미터with 실행한 경우to cases너뛰기)
+    if not args.config and args.manifest is None:
         if input("\nconfiguration saved하시겠습니까? (y/n): ").lower() == 'y':
             ConfigManager.save_config(config)
     
@@ -8372,14 +9551,26 @@ def main():
         calculator.generate_summary()
         
         # 결and saved
-        if calculator.save_results():
+        saved = calculator.save_results()
+        # next month 파일 복사 등 백그라운드 I/O 완료 대기
+        calculator.wait_for_background_io()
+        if saved:
             print(f"\n🎉 {config.get_month_str('korean')} incentive calculation 완료!")
         else:
             print("\n⚠️ 결and saved in progress  days부 오류 발생했습니다.")
     
-    except Exception as e:
+    except (OSError, ValueError, KeyError, pd.errors.ParserError) as e:
+        # 입력 파일 / 데이터 형식 오류만 메시지로 처리 - 그 외 예외(코드 버그)는 그대로 전파 → 비정상 종료 코드 (CI 에서 실패로 감지)
         print(f"\n❌ 실행 in progress 오류 발생: {e}")
-        traceback.print_exc()
+        if SHOW_MAIN_TRACEBACK:
+            # stderr traceback이 버퍼된 stdout 내용보다 먼저 출력되지 않도록 flush
+            sys.stdout.flush()
+            traceback.print_exc()
+        else:
+            print(f"   ({type(e).__name__} - 상세 traceback은 QIP_TRACEBACK=1 로 실행)")
+    finally:
+        # 처리하지 않는 예외도 interpreter의 traceback(stderr) 출력 전에 버퍼된 stdout 먼저 내보냄
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":